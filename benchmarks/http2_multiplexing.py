@@ -0,0 +1,109 @@
+"""
+HTTP/1.1 против HTTP/2 для клиентов gateway: сокеты генератора, соединения на стороне заглушки
+и статистика потоков по соединениям (GATEWAY_HTTP_CLIENT.CONNECTION_STATS).
+
+Виртуальные пользователи, как GatewayHTTPTaskSet, создают пять клиентов gateway на пуле
+из build_gateway_locust_http_transport и по кругу выполняют запросы каждым из них. Режимы:
+- HTTP/1.1, transport_scope=user — соединение на каждого виртуального пользователя;
+- HTTP/2, transport_scope=user — то же соединение, но HTTP/2;
+- HTTP/2, transport_scope=group — одно мультиплексированное соединение на группу пользователей.
+
+Заглушки gateway (benchmarks/http_stub_server.py) для HTTP/1.1 и h2c запускаются в отдельных процессах.
+
+Запуск из корня проекта:
+    python -m benchmarks.http2_multiplexing --users 300 --rounds 5 --group-size 50
+"""
+import argparse
+import subprocess
+import sys
+import time
+
+import gevent
+import httpx
+from locust.env import Environment
+
+import clients.http.gateway.client as gateway_client
+from benchmarks.http_transport_sockets import CLIENTS_PER_USER, count_sockets
+from clients.http.gateway.client import build_gateway_locust_http_client, build_gateway_locust_http_transport
+from config import settings
+from tools.config.http import HTTPTransportScope
+
+MODES = [
+    (False, HTTPTransportScope.USER),
+    (True, HTTPTransportScope.USER),
+    (True, HTTPTransportScope.GROUP)
+]
+
+
+def run_user(environment: Environment, rounds: int) -> list[httpx.Client]:
+    transport = build_gateway_locust_http_transport(environment)
+    clients = [build_gateway_locust_http_client(environment, transport) for _ in range(CLIENTS_PER_USER)]
+    for _ in range(rounds):
+        for client in clients:
+            client.get("/api/v1/users/id")
+    return clients
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="HTTP/1.1 против HTTP/2: соединения и потоки")
+    parser.add_argument("--users", type=int, default=300)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--group-size", type=int, default=50)
+    parser.add_argument("--port", type=int, default=8099, help="Порт заглушки HTTP/1.1, h2c — на следующем")
+    arguments = parser.parse_args()
+
+    servers = [
+        subprocess.Popen([sys.executable, "-m", "benchmarks.http_stub_server", "--port", str(arguments.port)]),
+        subprocess.Popen(
+            [sys.executable, "-m", "benchmarks.http_stub_server", "--port", str(arguments.port + 1), "--http2"]
+        )
+    ]
+    try:
+        time.sleep(1)
+        settings.gateway_http_client.connection_stats = True
+        settings.gateway_http_client.transport_group_size = arguments.group_size
+
+        print(f"users: {arguments.users}, clients per user: {CLIENTS_PER_USER}, rounds: {arguments.rounds}")
+        print(
+            f"{'protocol':<10}{'scope':<7}{'sockets':>9}{'connections':>13}{'requests':>10}{'elapsed, s':>12}"
+            f"{'streams/conn':>14}{'max concurrent':>16}"
+        )
+        for http2, scope in MODES:
+            port = arguments.port + http2
+            settings.gateway_http_client.url = f"http://127.0.0.1:{port}"
+            settings.gateway_http_client.http2 = http2
+            settings.gateway_http_client.transport_scope = scope
+            gateway_client._group_transport, gateway_client._group_users = None, 0
+
+            environment = Environment()
+            stats_client = httpx.Client(base_url=settings.gateway_http_client.client_url, http1=not http2, http2=http2)
+            stats_client.get("/__connections")
+            sockets_before = count_sockets()
+
+            started = time.perf_counter()
+            greenlets = [gevent.spawn(run_user, environment, arguments.rounds) for _ in range(arguments.users)]
+            gevent.joinall(greenlets, raise_error=True)
+            elapsed = time.perf_counter() - started
+
+            sockets = count_sockets() - sockets_before
+            connections = int(stats_client.get("/__connections").text)
+            stats = environment.http_connection_stats.connections
+            streams = sum(connection.streams for connection in stats)
+            print(
+                f"{'HTTP/2' if http2 else 'HTTP/1.1':<10}{scope:<7}{sockets:>9}{connections:>13}{streams:>10}"
+                f"{elapsed:>12.2f}{streams / len(stats):>14.1f}"
+                f"{max(connection.max_concurrent_streams for connection in stats):>16}"
+            )
+
+            stats_client.close()
+            # Клиенты делят транспорт: повторное закрытие пула безопасно
+            for greenlet in greenlets:
+                for client in greenlet.value:
+                    client.close()
+    finally:
+        for server in servers:
+            server.terminate()
+
+
+if __name__ == '__main__':
+    main()
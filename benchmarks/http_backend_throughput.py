@@ -0,0 +1,85 @@
+"""
+Запросов в секунду на одно ядро для бэкендов HTTP-клиента (GATEWAY_HTTP_CLIENT.BACKEND): httpx и gevent.
+
+Виртуальные пользователи, как GatewayHTTPTaskSet, создают клиентов gateway на общем транспорте
+и по очереди выполняют GET /api/v1/users/{user_id} и POST /api/v1/users через UsersGatewayHTTPClient,
+то есть с extensions route и хуками Locust. Заглушка gateway (benchmarks/http_stub_server.py)
+отвечает без задержки в отдельном процессе, поэтому процессорное время бенчмарка — это время клиента.
+
+Запуск из корня проекта:
+    python -m benchmarks.http_backend_throughput --users 50 --requests 200
+"""
+import argparse
+import subprocess
+import sys
+import time
+from collections import Counter
+
+import gevent
+from locust.env import Environment
+
+from clients.http.gateway.client import build_gateway_locust_http_transport
+from clients.http.gateway.users.client import build_users_gateway_locust_http_client
+from clients.http.gateway.users.schema import CreateUserRequestSchema
+from config import settings
+from tools.config.http import HTTPClientBackend
+
+
+def run_user(environment: Environment, requests: int) -> None:
+    client = build_users_gateway_locust_http_client(environment, build_gateway_locust_http_transport(environment))
+    request = CreateUserRequestSchema()
+    for index in range(requests):
+        if index % 2:
+            client.create_user_api(request)
+        else:
+            client.get_user_api("00000000-0000-0000-0000-000000000000")
+    client.client.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Пропускная способность бэкендов HTTP-клиента на одно ядро")
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=200, help="Запросов на виртуального пользователя")
+    parser.add_argument("--port", type=int, default=8099)
+    arguments = parser.parse_args()
+
+    server = subprocess.Popen(
+        [sys.executable, "-m", "benchmarks.http_stub_server", "--port", str(arguments.port), "--latency", "0"]
+    )
+    try:
+        time.sleep(1)
+        settings.gateway_http_client.url = f"http://127.0.0.1:{arguments.port}"
+        environment = Environment()
+        names, failures = Counter(), Counter()
+
+        def on_request(name: str, exception: Exception | None, **kwargs) -> None:
+            names[name] += 1
+            failures[name] += exception is not None
+
+        environment.events.request.add_listener(on_request)
+
+        print(f"users: {arguments.users}, requests per user: {arguments.requests}")
+        print(f"{'backend':<9}{'requests':>10}{'failures':>10}{'wall, s':>9}{'cpu, s':>8}{'rps per core':>14}")
+        for backend in HTTPClientBackend:
+            settings.gateway_http_client.backend = backend
+            names.clear()
+            failures.clear()
+
+            started, cpu_started = time.perf_counter(), time.process_time()
+            greenlets = [gevent.spawn(run_user, environment, arguments.requests) for _ in range(arguments.users)]
+            gevent.joinall(greenlets, raise_error=True)
+            wall, cpu = time.perf_counter() - started, time.process_time() - cpu_started
+
+            # Имена запросов в статистике Locust берутся из route: у обоих бэкендов они должны совпадать
+            assert set(names) == {"GET /api/v1/users/{user_id}", "POST /api/v1/users"}, names
+            requests = sum(names.values())
+            print(
+                f"{backend:<9}{requests:>10}{sum(failures.values()):>10}{wall:>9.2f}{cpu:>8.2f}"
+                f"{requests / cpu:>14.0f}"
+            )
+    finally:
+        server.terminate()
+
+
+if __name__ == '__main__':
+    main()
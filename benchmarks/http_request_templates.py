@@ -0,0 +1,125 @@
+"""
+Тела запросов make_*_operation: pydantic-путь (схема с Faker-значениями по умолчанию, model_dump
+и json.dumps в httpx) против предкомпилированного JSONBodyTemplate.
+
+Сначала для каждой операции проверяется, что при одинаковом состоянии Faker клиент операций
+отправляет одинаковые по байтам запросы обоими путями (метод, URL, заголовки, тело). Затем
+измеряется время сборки тела; колонка faker — время одних только Faker-значений по умолчанию,
+которое обязательно для обоих путей. Колонки со звёздочкой — сборка тела с явно переданными
+status и amount (и category), то есть стоимость самой сериализации без Faker.
+
+Запуск из корня проекта:
+    python -m benchmarks.http_request_templates --repeat 20000
+"""
+import argparse
+import gc
+import json
+import time
+import uuid
+
+from httpx import Client, MockTransport, Request, Response
+
+import clients.http.gateway.operations.client as operations_client
+from clients.http.gateway.operations.client import OperationsGatewayHTTPClient
+from clients.http.gateway.operations.schema import OperationStatus
+from tools.fakers import fake
+
+OPERATIONS = ["fee", "top_up", "cashback", "transfer", "purchase", "bill_payment", "cash_withdrawal"]
+
+
+def build_operation_response(request: Request) -> Response:
+    body = json.loads(request.content)
+    return Response(200, json={"operation": {
+        "id": str(uuid.uuid4()), "type": "TOP_UP", "status": body["status"], "amount": body["amount"],
+        "cardId": body["cardId"], "category": body.get("category", "taxi"), "createdAt": "2026-10-18T07:00:00",
+        "accountId": body["accountId"]
+    }})
+
+
+def capture(call) -> tuple:
+    requests = []
+
+    def handler(request: Request) -> Response:
+        requests.append((request.method, str(request.url), request.headers.raw, request.content))
+        return build_operation_response(request)
+
+    call(OperationsGatewayHTTPClient(client=Client(base_url="http://gateway", transport=MockTransport(handler))))
+    return requests[0]
+
+
+def check_identical(operation: str, card_id: str, account_id: str) -> None:
+    schema = getattr(operations_client, f"MAKE_{operation.upper()}_OPERATION_TEMPLATE").schema
+
+    fake.faker.seed_instance(operation)
+    expected = capture(lambda client: getattr(client, f"make_{operation}_operation_api")(
+        schema(card_id=card_id, account_id=account_id)
+    ))
+    fake.faker.seed_instance(operation)
+    actual = capture(lambda client: getattr(client, f"make_{operation}_operation")(
+        card_id=card_id, account_id=account_id
+    ))
+    assert actual == expected, (operation, actual, expected)
+
+
+def measure(build, repeat: int, rounds: int = 5) -> float:
+    # Лучший из нескольких прогонов без сборщика мусора
+    timings = []
+    for _ in range(rounds):
+        gc.disable()
+        started = time.perf_counter()
+        for _ in range(repeat):
+            build()
+        timings.append(time.perf_counter() - started)
+        gc.enable()
+
+    return min(timings) / repeat * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Тела запросов операций: pydantic vs шаблон")
+    parser.add_argument("--repeat", type=int, default=20_000)
+    arguments = parser.parse_args()
+
+    card_id, account_id = str(uuid.uuid4()), str(uuid.uuid4())
+    for operation in OPERATIONS:
+        check_identical(operation, card_id, account_id)
+    print(f"byte-identical requests: {', '.join(OPERATIONS)}")
+
+    print(f"repeat: {arguments.repeat}, microseconds per body")
+    print(f"{'operation':<17}{'faker':>8}{'pydantic':>10}{'template':>10}{'pydantic*':>11}{'template*':>11}")
+    for operation in ["top_up", "purchase"]:
+        template = getattr(operations_client, f"MAKE_{operation.upper()}_OPERATION_TEMPLATE")
+        schema = template.schema
+        category = [fake.category] if operation == "purchase" else []
+
+        def build_faker():
+            fake.enum(OperationStatus), fake.amount(), [factory() for factory in category]
+
+        def build_pydantic():
+            body = schema(card_id=card_id, account_id=account_id).model_dump(by_alias=True)
+            # Так httpx кодирует json= (httpx._content.encode_json)
+            json.dumps(body, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode("utf-8")
+
+        def build_template():
+            template.render(card_id=card_id, account_id=account_id)
+
+        values = {"status": OperationStatus.COMPLETED, "amount": 512.25, "card_id": card_id, "account_id": account_id}
+        if category:
+            values["category"] = "taxi"
+
+        def build_pydantic_values():
+            body = schema(**values).model_dump(by_alias=True)
+            json.dumps(body, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode("utf-8")
+
+        def build_template_values():
+            template.render(**values)
+
+        builds = (build_faker, build_pydantic, build_template, build_pydantic_values, build_template_values)
+        timings = [measure(build, arguments.repeat) for build in builds]
+        print(f"{operation:<17}" + "".join(
+            f"{timing:>{width}.1f}" for timing, width in zip(timings, (8, 10, 10, 11, 11))
+        ))
+
+
+if __name__ == '__main__':
+    main()
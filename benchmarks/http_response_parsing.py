@@ -0,0 +1,97 @@
+"""
+Микробенчмарк разбора ответов http-gateway в доменных клиентах:
+- text — прежний путь Schema.model_validate_json(response.text) с декодированием тела в str;
+- bytes — HTTPClient.parse_response: валидация прямо из прочитанных байтов тела;
+- trusted — HTTPClient.parse_response в доверенном режиме: извлекаются только идентификаторы.
+
+Каждый ответ разбирается один раз, как в задаче Locust: response.text у httpx кешируется,
+поэтому для каждого повтора создаётся свой httpx.Response.
+
+Запуск из корня проекта:
+    python -m benchmarks.http_response_parsing --repeat 5000
+"""
+import argparse
+import gc
+import json
+import time
+import uuid
+
+from httpx import Client, Response
+
+from clients.http.client import HTTPClient
+from clients.http.gateway.accounts.schema import OpenDebitCardAccountResponseSchema
+from clients.http.gateway.operations.schema import GetOperationsResponseSchema, MakeTopUpOperationResponseSchema
+from clients.http.gateway.users.schema import CreateUserResponseSchema
+
+
+def build_card(account_id: str) -> dict:
+    return {
+        "id": str(uuid.uuid4()), "pin": "1234", "cvv": "123", "type": "VIRTUAL", "status": "ACTIVE",
+        "accountId": account_id, "cardNumber": "4111111111111111", "cardHolder": "Ivan Ivanov",
+        "expiryDate": "2030-12-31", "paymentSystem": "VISA"
+    }
+
+
+def build_operation(account_id: str) -> dict:
+    return {
+        "id": str(uuid.uuid4()), "type": "TOP_UP", "status": "COMPLETED", "amount": 1250.5,
+        "cardId": str(uuid.uuid4()), "category": "taxi", "createdAt": "2026-10-18T07:00:00",
+        "accountId": account_id
+    }
+
+
+def build_bodies() -> list[tuple[type, bytes]]:
+    account_id = str(uuid.uuid4())
+    user = {
+        "id": str(uuid.uuid4()), "email": "ivan.ivanov@example.com", "lastName": "Ivanov",
+        "firstName": "Ivan", "middleName": "Ivanovich", "phoneNumber": "+79990000000"
+    }
+    account = {
+        "id": account_id, "type": "DEBIT_CARD", "status": "ACTIVE", "balance": 0.0,
+        "cards": [build_card(account_id), build_card(account_id)]
+    }
+    return [
+        (CreateUserResponseSchema, json.dumps({"user": user}).encode()),
+        (OpenDebitCardAccountResponseSchema, json.dumps({"account": account}).encode()),
+        (MakeTopUpOperationResponseSchema, json.dumps({"operation": build_operation(account_id)}).encode()),
+        (GetOperationsResponseSchema, json.dumps({"operations": [build_operation(account_id) for _ in range(50)]}).encode())
+    ]
+
+
+def measure(parse, schema: type, body: bytes, repeat: int, rounds: int = 5) -> float:
+    # Лучший из нескольких прогонов без сборщика мусора: меньше шума от соседних процессов и GC
+    timings = []
+    for _ in range(rounds):
+        responses = [Response(200, content=body) for _ in range(repeat)]
+        gc.disable()
+        started = time.perf_counter()
+        for response in responses:
+            parse(response, schema)
+        timings.append(time.perf_counter() - started)
+        gc.enable()
+
+    return min(timings) / repeat * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Разбор ответов: text vs bytes vs trusted")
+    parser.add_argument("--repeat", type=int, default=5_000)
+    arguments = parser.parse_args()
+
+    client = HTTPClient(client=Client())
+    trusted_client = HTTPClient(client=Client(), trusted=True)
+    methods = {
+        "text": lambda response, schema: schema.model_validate_json(response.text),
+        "bytes": client.parse_response,
+        "trusted": trusted_client.parse_response
+    }
+
+    print(f"repeat: {arguments.repeat}, microseconds per response")
+    print(f"{'schema':<36}{'size, B':>8}" + "".join(f"{name:>9}" for name in methods))
+    for schema, body in build_bodies():
+        timings = [measure(parse, schema, body, arguments.repeat) for parse in methods.values()]
+        print(f"{schema.__name__:<36}{len(body):>8}" + "".join(f"{timing:>9.1f}" for timing in timings))
+
+
+if __name__ == '__main__':
+    main()
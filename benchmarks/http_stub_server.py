@@ -0,0 +1,111 @@
+"""
+Заглушка http-gateway для HTTP-бенчмарков: на любой запрос отвечает небольшим JSON
+после задержки --latency. Поддерживает keep-alive (HTTP/1.1), а с --http2 — HTTP/2 без TLS
+(h2c с prior knowledge): потоки одного соединения обрабатываются параллельно.
+
+GET /__connections возвращает количество принятых соединений с момента предыдущего вызова
+и обнуляет счётчик — по нему бенчмарки считают, сколько TCP-соединений открыл клиент.
+
+Запуск из корня проекта:
+    python -m benchmarks.http_stub_server --port 8099
+    python -m benchmarks.http_stub_server --port 8100 --http2
+"""
+import argparse
+import json
+import socket
+from typing import Callable
+
+from gevent import monkey
+
+monkey.patch_all()
+
+import gevent  # noqa: E402
+import h2.config  # noqa: E402
+import h2.connection  # noqa: E402
+import h2.events  # noqa: E402
+from gevent.lock import Semaphore  # noqa: E402
+from gevent.pywsgi import WSGIServer  # noqa: E402
+from gevent.server import StreamServer  # noqa: E402
+
+BODY = json.dumps({"user": {"id": "00000000-0000-0000-0000-000000000000", "email": "user@example.com"}}).encode()
+
+
+def serve_http2(latency: float, connections: set) -> Callable[[socket.socket, tuple], None]:
+    """
+    Возвращает обработчик соединения HTTP/2 для StreamServer. Обработчик отвечает на каждый поток после завершения запроса (с телом или без)
+    в отдельном greenlet'е, поэтому задержка одного потока не задерживает остальные.
+    """
+
+    def handle(sock, address):
+        connection = h2.connection.H2Connection(config=h2.config.H2Configuration(client_side=False))
+        connection.initiate_connection()
+        sock.sendall(connection.data_to_send())
+        # Запись в сокет из greenlet'ов потоков и цикла чтения
+        lock = Semaphore()
+        paths: dict[int, str] = {}
+
+        def respond(stream_id: int, path: str) -> None:
+            if path == "/__connections":
+                body = str(len(connections)).encode()
+                connections.clear()
+            else:
+                connections.add(address)
+                if latency:
+                    gevent.sleep(latency)
+                body = BODY
+
+            with lock:
+                connection.send_headers(stream_id, [
+                    (":status", "200"), ("content-type", "application/json"), ("content-length", str(len(body)))
+                ])
+                connection.send_data(stream_id, body, end_stream=True)
+                sock.sendall(connection.data_to_send())
+
+        try:
+            while data := sock.recv(65535):
+                with lock:
+                    for event in connection.receive_data(data):
+                        if isinstance(event, h2.events.RequestReceived):
+                            paths[event.stream_id] = dict(event.headers)[b":path"].decode()
+                        elif isinstance(event, h2.events.DataReceived):
+                            connection.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+                        elif isinstance(event, h2.events.StreamEnded):
+                            gevent.spawn(respond, event.stream_id, paths.pop(event.stream_id))
+                    sock.sendall(connection.data_to_send())
+        except ConnectionError:
+            # Клиент закрыл соединение
+            return
+
+    return handle
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Заглушка http-gateway для бенчмарков")
+    parser.add_argument("--port", type=int, default=8099)
+    parser.add_argument("--latency", type=float, default=0.005)
+    parser.add_argument("--http2", action="store_true", help="HTTP/2 без TLS (h2c с prior knowledge)")
+    arguments = parser.parse_args()
+
+    connections: set[tuple[str, str]] = set()
+    if arguments.http2:
+        StreamServer(("127.0.0.1", arguments.port), serve_http2(arguments.latency, connections)).serve_forever()
+        return
+
+    def application(environ, start_response):
+        if environ["PATH_INFO"] == "/__connections":
+            body = str(len(connections)).encode()
+            connections.clear()
+        else:
+            connections.add((environ["REMOTE_ADDR"], environ["REMOTE_PORT"]))
+            if arguments.latency:
+                gevent.sleep(arguments.latency)
+            body = BODY
+
+        start_response("200 OK", [("Content-Type", "application/json"), ("Content-Length", str(len(body)))])
+        return [body]
+
+    WSGIServer(("127.0.0.1", arguments.port), application, log=None).serve_forever()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""
+Сокеты и TCP-соединения, которые держат HTTP-клиенты виртуальных пользователей
+при разных GATEWAY_HTTP_CLIENT.TRANSPORT_SCOPE (client, user).
+
+Каждый виртуальный пользователь, как GatewayHTTPTaskSet, создаёт пять клиентов gateway
+и по кругу выполняет запросы каждым из них. После прогона считаются открытые сокеты процесса
+и соединения, принятые заглушкой gateway (benchmarks/http_stub_server.py).
+
+Запуск из корня проекта:
+    python -m benchmarks.http_transport_sockets --users 300 --rounds 5
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+import gevent
+import httpx
+from locust.env import Environment
+
+from clients.http.gateway.client import build_gateway_locust_http_client, build_gateway_locust_http_transport
+from config import settings
+from tools.config.http import HTTPTransportScope
+
+# Количество клиентов gateway у виртуального пользователя (users, cards, accounts, documents, operations)
+CLIENTS_PER_USER = 5
+
+
+def count_sockets() -> int:
+    sockets = 0
+    for fd in os.listdir("/proc/self/fd"):
+        try:
+            sockets += os.readlink(f"/proc/self/fd/{fd}").startswith("socket:")
+        except OSError:
+            # Дескриптор самого listdir уже закрыт
+            continue
+    return sockets
+
+
+def run_user(environment: Environment, rounds: int) -> list[httpx.Client]:
+    transport = build_gateway_locust_http_transport(environment)
+    clients = [build_gateway_locust_http_client(environment, transport) for _ in range(CLIENTS_PER_USER)]
+    for _ in range(rounds):
+        for client in clients:
+            client.get("/api/v1/users/id")
+    return clients
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Сокеты HTTP-клиентов по областям пула соединений")
+    parser.add_argument("--users", type=int, default=300)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--port", type=int, default=8099)
+    arguments = parser.parse_args()
+
+    server = subprocess.Popen(
+        [sys.executable, "-m", "benchmarks.http_stub_server", "--port", str(arguments.port)]
+    )
+    try:
+        time.sleep(1)
+        settings.gateway_http_client.url = f"http://127.0.0.1:{arguments.port}"
+        environment = Environment()
+        counter = {"requests": 0}
+        environment.events.request.add_listener(lambda **kwargs: counter.update(requests=counter["requests"] + 1))
+        stats = httpx.Client(base_url=settings.gateway_http_client.client_url)
+        stats.get("/__connections")
+
+        print(f"users: {arguments.users}, clients per user: {CLIENTS_PER_USER}, rounds: {arguments.rounds}")
+        print(f"{'scope':<8}{'sockets':>9}{'connections':>13}{'requests':>10}{'elapsed, s':>12}")
+        for scope in HTTPTransportScope:
+            settings.gateway_http_client.transport_scope = scope
+            sockets_before = count_sockets()
+
+            started = time.perf_counter()
+            greenlets = [gevent.spawn(run_user, environment, arguments.rounds) for _ in range(arguments.users)]
+            gevent.joinall(greenlets, raise_error=True)
+            elapsed = time.perf_counter() - started
+
+            sockets = count_sockets() - sockets_before
+            connections = int(stats.get("/__connections").text)
+            requests = counter["requests"]
+            counter["requests"] = 0
+            print(f"{scope:<8}{sockets:>9}{connections:>13}{requests:>10}{elapsed:>12.2f}")
+
+            # Клиенты одного пользователя делят транспорт: повторное закрытие пула безопасно
+            for greenlet in greenlets:
+                for client in greenlet.value:
+                    client.close()
+    finally:
+        server.terminate()
+
+
+if __name__ == '__main__':
+    main()
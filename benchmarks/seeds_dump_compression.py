@@ -0,0 +1,52 @@
+"""
+Размер дампа сидинга и время записи и загрузки для форматов json и jsonl без сжатия, с gzip и с LZMA.
+
+Запуск из корня проекта:
+    python -m benchmarks.seeds_dump_compression --users 20000
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.seeds_store_memory import build_user
+from seeds.dumps import get_seeds_file, save_seeds_result, load_seeds_result
+from seeds.schema.result import SeedsResult
+from tools.config.seeds import SeedsDumpFormat, SeedsCompression
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Сжатие дампов сидинга: размер и время загрузки")
+    parser.add_argument("--users", type=int, default=20_000)
+    arguments = parser.parse_args()
+
+    result = SeedsResult(users=[build_user() for _ in range(arguments.users)])
+
+    with tempfile.TemporaryDirectory() as directory:
+        # Функции дампов работают с папкой ./dumps
+        os.chdir(directory)
+        print(f"users: {arguments.users}")
+        print(f"{'format':<7}{'compression':<13}{'size, MiB':>10}{'ratio':>8}{'save, s':>9}{'load, s':>9}")
+
+        for dump_format in (SeedsDumpFormat.JSON, SeedsDumpFormat.JSONL):
+            plain_size = None
+            for compression in SeedsCompression:
+                started = time.perf_counter()
+                save_seeds_result(result, "benchmark", dump_format=dump_format, compression=compression)
+                save_time = time.perf_counter() - started
+
+                started = time.perf_counter()
+                loaded = load_seeds_result("benchmark", dump_format=dump_format, compression=compression)
+                load_time = time.perf_counter() - started
+                assert loaded == result
+
+                size = os.path.getsize(get_seeds_file("benchmark", dump_format, compression))
+                plain_size = plain_size or size
+                print(
+                    f"{dump_format:<7}{compression:<13}{size / 2 ** 20:>10.1f}{plain_size / size:>7.1f}x"
+                    f"{save_time:>9.2f}{load_time:>9.2f}"
+                )
+
+
+if __name__ == '__main__':
+    main()
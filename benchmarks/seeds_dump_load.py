@@ -0,0 +1,64 @@
+"""
+Сравнение времени загрузки дампа сидинга в формате json (SeedsResult.model_validate_json всего файла)
+и mmap (отображение бинарного дампа в память и чтение только выданных пользователей).
+
+Запуск из корня проекта:
+    python -m benchmarks.seeds_dump_load --users 100000 --draw 100
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from benchmarks.seeds_store_memory import build_user
+from seeds.mapped import SeedsMappedWriter, MappedSeedsResult
+from seeds.schema.result import SeedsResult
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Загрузка дампа json vs mmap")
+    parser.add_argument("--users", type=int, default=100_000)
+    parser.add_argument("--draw", type=int, default=100, help="Сколько пользователей выдаётся после загрузки")
+    arguments = parser.parse_args()
+
+    result = SeedsResult(users=[build_user() for _ in range(arguments.users)])
+
+    with tempfile.TemporaryDirectory() as directory:
+        json_file = os.path.join(directory, "seeds.json")
+        mmap_file = os.path.join(directory, "seeds.mmap")
+
+        with open(json_file, 'w', encoding="utf-8") as file:
+            file.write(result.model_dump_json())
+        with SeedsMappedWriter(mmap_file) as writer:
+            for user in result.users:
+                writer.write(user)
+
+        draws = [random.randrange(arguments.users) for _ in range(arguments.draw)]
+
+        started = time.perf_counter()
+        with open(json_file, 'r', encoding="utf-8") as file:
+            loaded = SeedsResult.model_validate_json(file.read())
+        json_load = time.perf_counter() - started
+        json_users = [loaded.users[index] for index in draws]
+        del loaded
+
+        started = time.perf_counter()
+        mapped = MappedSeedsResult(mmap_file)
+        mmap_load = time.perf_counter() - started
+        started = time.perf_counter()
+        mmap_users = [mapped.get_user(index) for index in draws]
+        mmap_draw = time.perf_counter() - started
+
+        # Проверяем, что из бинарного дампа читаются те же пользователи
+        assert mmap_users == json_users
+
+        print(f"users: {arguments.users}")
+        print(f"json: {os.path.getsize(json_file) / 2 ** 20:8.1f} MiB  load {json_load * 1000:10.1f} ms")
+        print(f"mmap: {os.path.getsize(mmap_file) / 2 ** 20:8.1f} MiB  load {mmap_load * 1000:10.3f} ms"
+              f"  {arguments.draw} users {mmap_draw * 1000:.2f} ms")
+        mapped.close()
+
+
+if __name__ == '__main__':
+    main()
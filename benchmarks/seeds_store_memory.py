@@ -0,0 +1,79 @@
+"""
+Сравнение памяти, занимаемой результатом сидинга в виде pydantic-моделей (SeedsResult)
+и в колоночном хранилище (CompactSeedsResult).
+
+Запуск из корня проекта:
+    python -m benchmarks.seeds_store_memory --users 100000
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+import uuid
+
+from seeds.schema.result import SeedsResult, SeedUserResult, SeedAccountResult, SeedCardResult, SeedOperationResult
+from seeds.store import CompactSeedsResult
+
+
+def build_user() -> SeedUserResult:
+    # Форма пользователя как в сценариях existing_user_*: кредитный счёт с картой и операциями
+    return SeedUserResult(
+        user_id=str(uuid.uuid4()),
+        credit_card_accounts=[
+            SeedAccountResult(
+                account_id=str(uuid.uuid4()),
+                physical_cards=[SeedCardResult(card_id=str(uuid.uuid4()))],
+                purchase_operations=[SeedOperationResult(operation_id=str(uuid.uuid4())) for _ in range(5)],
+                top_up_operations=[SeedOperationResult(operation_id=str(uuid.uuid4()))],
+                cash_withdrawal_operations=[SeedOperationResult(operation_id=str(uuid.uuid4()))]
+            )
+        ]
+    )
+
+
+def measure(factory) -> tuple[object, int, float]:
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    value = factory()
+    elapsed = time.perf_counter() - started
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return value, size, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Память SeedsResult vs CompactSeedsResult")
+    parser.add_argument("--users", type=int, default=100_000)
+    arguments = parser.parse_args()
+
+    users = [build_user() for _ in range(arguments.users)]
+    json_users = [user.model_dump_json() for user in users]
+    del users
+
+    result, models_size, models_time = measure(
+        lambda: SeedsResult(users=[SeedUserResult.model_validate_json(line) for line in json_users])
+    )
+    del result
+
+    store, compact_size, compact_time = measure(
+        lambda: CompactSeedsResult.from_users(SeedUserResult.model_validate_json(line) for line in json_users)
+    )
+
+    # Проверяем, что представление совпадает с исходными данными
+    first = SeedUserResult.model_validate_json(json_users[0])
+    view = store.get_next_user()
+    assert view.user_id == first.user_id
+    assert view.credit_card_accounts[0].purchase_operations[4].operation_id == \
+           first.credit_card_accounts[0].purchase_operations[4].operation_id
+
+    print(f"users: {arguments.users}")
+    print(f"SeedsResult:        {models_size / 2 ** 20:10.1f} MiB  {models_size / arguments.users:8.0f} B/user"
+          f"  load {models_time:.2f}s")
+    print(f"CompactSeedsResult: {compact_size / 2 ** 20:10.1f} MiB  {compact_size / arguments.users:8.0f} B/user"
+          f"  load {compact_time:.2f}s")
+    print(f"ratio: {models_size / compact_size:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
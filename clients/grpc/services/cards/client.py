@@ -0,0 +1,66 @@
+from grpc import Channel
+
+from clients.grpc.client import GRPCClient
+from clients.grpc.services.client import build_service_grpc_client
+from config import settings
+from contracts.services.cards.card_pb2 import CardType, CardStatus, CardPaymentSystem
+from contracts.services.cards.cards_service_pb2_grpc import CardsServiceStub
+from contracts.services.cards.rpc_create_card_pb2 import CreateCardRequest, CreateCardResponse
+from tools.fakers import fake
+
+
+class CardsGRPCClient(GRPCClient):
+    """
+    gRPC-клиент для взаимодействия с внутренним CardsService (без gateway).
+    """
+
+    def __init__(self, channel: Channel):
+        """
+        Инициализация клиента с указанным gRPC-каналом.
+
+        :param channel: gRPC-канал для подключения к CardsService.
+        """
+        super().__init__(channel)
+
+        self.stub = CardsServiceStub(channel)
+
+    def create_card_api(self, request: CreateCardRequest) -> CreateCardResponse:
+        """
+        Низкоуровневый вызов метода CreateCard через gRPC.
+
+        :param request: gRPC-запрос с ID счёта и реквизитами карты.
+        :return: Ответ от сервиса с данными созданной карты.
+        """
+        return self.stub.CreateCard(request)
+
+    def create_card(self, account_id: str, card_type: CardType.ValueType) -> CreateCardResponse:
+        """
+        Выпуск активной карты со случайными реквизитами.
+
+        :param account_id: Идентификатор счёта.
+        :param card_type: Тип карты (CARD_TYPE_VIRTUAL или CARD_TYPE_PHYSICAL).
+        :return: Ответ с информацией о выпущенной карте.
+        """
+        request = CreateCardRequest(
+            pin=fake.pin(),
+            cvv=fake.cvv(),
+            type=card_type,
+            status=CardStatus.CARD_STATUS_ACTIVE,
+            account_id=account_id,
+            card_number=fake.card_number(),
+            card_holder=fake.card_holder(),
+            expiry_date=fake.expiry_date(),
+            payment_system=fake.faker.random_element(
+                (CardPaymentSystem.CARD_PAYMENT_SYSTEM_VISA, CardPaymentSystem.CARD_PAYMENT_SYSTEM_MASTERCARD)
+            )
+        )
+        return self.create_card_api(request)
+
+
+def build_cards_grpc_client() -> CardsGRPCClient:
+    """
+    Фабрика для создания экземпляра CardsGRPCClient.
+
+    :return: Инициализированный клиент для CardsService.
+    """
+    return CardsGRPCClient(channel=build_service_grpc_client("cards", settings.cards_grpc_client))
@@ -0,0 +1,18 @@
+from grpc import Channel, insecure_channel
+
+from tools.config.grpc import GRPCClientConfig
+
+
+def build_service_grpc_client(name: str, config: GRPCClientConfig | None) -> Channel:
+    """
+    Фабричная функция (билдер) для создания gRPC-канала к внутреннему сервису в обход gateway.
+
+    :param name: Имя сервиса для сообщения об ошибке (например, users).
+    :param config: Настройки подключения к сервису (например, settings.users_grpc_client).
+    :return: gRPC-канал, настроенный на адрес сервиса.
+    :raises ValueError: Адрес сервиса не задан в настройках.
+    """
+    if config is None:
+        raise ValueError(f"Address of {name} service is not configured: set {name.upper()}_GRPC_CLIENT.HOST/PORT")
+
+    return insecure_channel(config.client_url)
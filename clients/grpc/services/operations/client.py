@@ -0,0 +1,72 @@
+from datetime import datetime, timezone
+
+from grpc import Channel
+
+from clients.grpc.client import GRPCClient
+from clients.grpc.services.client import build_service_grpc_client
+from config import settings
+from contracts.services.operations.operation_pb2 import OperationType, OperationStatus
+from contracts.services.operations.operations_service_pb2_grpc import OperationsServiceStub
+from contracts.services.operations.rpc_create_operation_pb2 import CreateOperationRequest, CreateOperationResponse
+from tools.fakers import fake
+
+
+class OperationsGRPCClient(GRPCClient):
+    """
+    gRPC-клиент для взаимодействия с внутренним OperationsService (без gateway).
+    """
+
+    def __init__(self, channel: Channel):
+        """
+        Инициализация клиента с указанным gRPC-каналом.
+
+        :param channel: gRPC-канал для подключения к OperationsService.
+        """
+        super().__init__(channel)
+
+        self.stub = OperationsServiceStub(channel)
+
+    def create_operation_api(self, request: CreateOperationRequest) -> CreateOperationResponse:
+        """
+        Низкоуровневый вызов метода CreateOperation через gRPC.
+
+        :param request: gRPC-запрос с данными операции.
+        :return: Ответ от сервиса с данными созданной операции.
+        """
+        return self.stub.CreateOperation(request)
+
+    def create_operation(
+            self,
+            card_id: str,
+            account_id: str,
+            operation_type: OperationType.ValueType,
+            category: str = ""
+    ) -> CreateOperationResponse:
+        """
+        Создание операции со случайной суммой и статусом.
+
+        :param card_id: Идентификатор карты.
+        :param account_id: Идентификатор счёта.
+        :param operation_type: Тип операции (например, OPERATION_TYPE_PURCHASE).
+        :param category: Категория операции (для покупок).
+        :return: Ответ с информацией о созданной операции.
+        """
+        request = CreateOperationRequest(
+            type=operation_type,
+            status=fake.proto_enum(OperationStatus),
+            amount=fake.amount(),
+            card_id=card_id,
+            category=category,
+            created_at=datetime.now(timezone.utc).isoformat(),
+            account_id=account_id
+        )
+        return self.create_operation_api(request)
+
+
+def build_operations_grpc_client() -> OperationsGRPCClient:
+    """
+    Фабрика для создания экземпляра OperationsGRPCClient.
+
+    :return: Инициализированный клиент для OperationsService.
+    """
+    return OperationsGRPCClient(channel=build_service_grpc_client("operations", settings.operations_grpc_client))
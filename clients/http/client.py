@@ -1,6 +1,11 @@
-from typing import Any, TypedDict
+from typing import Any, TypedDict, TypeVar
 
 from httpx import Client, Response, QueryParams, URL
+from pydantic import BaseModel
+
+from clients.http.trusted import get_trusted_schema
+
+T = TypeVar("T", bound=BaseModel)
 
 
 # Тип расширений, которые можно передать в запрос
@@ -14,10 +19,13 @@ class HTTPClient:
     Базовый HTTP API клиент, принимающий объект httpx.Client.
 
     :param client: экземпляр httpx.Client для выполнения HTTP-запросов
+    :param trusted: доверенный режим разбора ответов: из ответа извлекаются только идентификаторы
+                    (см. clients.http.trusted.get_trusted_schema), остальные поля не валидируются
     """
 
-    def __init__(self, client: Client) -> None:
+    def __init__(self, client: Client, trusted: bool = False) -> None:
         self.client = client
+        self.trusted = trusted
 
     def get(
             self,
@@ -39,7 +47,8 @@ class HTTPClient:
             self,
             url: str | URL,
             json: Any | None = None,
-            extensions: HTTPClientExtensions | None = None  # Поддержка extensions для POST-запросов
+            extensions: HTTPClientExtensions | None = None,  # Поддержка extensions для POST-запросов
+            content: bytes | None = None
     ) -> Response:
         """
         Выполняет POST-запрос.
@@ -47,6 +56,29 @@ class HTTPClient:
         :param url: URL-адрес эндпоинта.
         :param json: Данные в формате JSON.
         :param extensions: Дополнительные данные, передаваемые через HTTPX extensions.
+        :param content: Уже сериализованное JSON-тело (например, из JSONBodyTemplate) вместо json.
         :return: Объект Response с данными ответа.
         """
+        if content is not None:
+            # Заголовки в том же порядке, что httpx добавляет для json=: запрос совпадает по байтам
+            headers = {"Content-Length": str(len(content)), "Content-Type": "application/json"}
+            return self.client.post(url=url, content=content, headers=headers, extensions=extensions)
+
         return self.client.post(url=url, json=json, extensions=extensions)  # extensions передаётся в httpx.Client
+
+    def parse_response(self, response: Response, schema: type[T]) -> T:
+        """
+        Валидирует ответ по схеме прямо из байтов тела: без декодирования в str, как у response.text.
+        Тело уже прочитано httpx (или хуком Locust), поэтому повторного чтения нет.
+
+        В доверенном режиме возвращается модель доверенной схемы: у неё есть только идентификаторы
+        и путь к ним (например, operation.id, account.cards[0].id).
+
+        :param response: Ответ сервера.
+        :param schema: Схема ответа.
+        :return: Модель ответа.
+        """
+        if self.trusted:
+            return get_trusted_schema(schema).model_validate_json(response.content)
+
+        return schema.model_validate_json(response.content)
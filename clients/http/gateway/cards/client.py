@@ -1,4 +1,4 @@
-from httpx import Response
+from httpx import Response, BaseTransport
 from locust.env import Environment
 
 from clients.http.client import HTTPClient
@@ -9,6 +9,7 @@ from clients.http.gateway.cards.schema import (
     IssuePhysicalCardResponseSchema
 )
 from clients.http.gateway.client import build_gateway_http_client, build_gateway_locust_http_client
+from config import settings
 from tools.routes import APIRoutes
 
 
@@ -44,12 +45,12 @@ class CardsGatewayHTTPClient(HTTPClient):
     def issue_virtual_card(self, user_id: str, account_id: str) -> IssueVirtualCardResponseSchema:
         request = IssueVirtualCardRequestSchema(user_id=user_id, account_id=account_id)
         response = self.issue_virtual_card_api(request)
-        return IssueVirtualCardResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, IssueVirtualCardResponseSchema)
 
     def issue_physical_card(self, user_id: str, account_id: str) -> IssuePhysicalCardResponseSchema:
         request = IssuePhysicalCardRequestSchema(user_id=user_id, account_id=account_id)
         response = self.issue_physical_card_api(request)
-        return IssuePhysicalCardResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, IssuePhysicalCardResponseSchema)
 
 
 def build_cards_gateway_http_client() -> CardsGatewayHTTPClient:
@@ -61,14 +62,22 @@ def build_cards_gateway_http_client() -> CardsGatewayHTTPClient:
     return CardsGatewayHTTPClient(client=build_gateway_http_client())
 
 # Новый билдер для нагрузочного тестирования
-def build_cards_gateway_locust_http_client(environment: Environment) -> CardsGatewayHTTPClient:
+def build_cards_gateway_locust_http_client(
+        environment: Environment,
+        transport: BaseTransport | None = None
+) -> CardsGatewayHTTPClient:
     """
     Функция создаёт экземпляр CardsGatewayHTTPClient адаптированного под Locust.
 
     Клиент автоматически собирает метрики и передаёт их в Locust через хуки.
     Используется исключительно в нагрузочных тестах.
+    Ответы разбираются в доверенном режиме при GATEWAY_HTTP_CLIENT.TRUSTED_RESPONSES=true.
 
     :param environment: объект окружения Locust.
+    :param transport: общий пул соединений клиентов виртуального пользователя.
     :return: экземпляр CardsGatewayHTTPClient с хуками сбора метрик.
     """
-    return CardsGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
\ No newline at end of file
+    return CardsGatewayHTTPClient(
+        client=build_gateway_locust_http_client(environment, transport),
+        trusted=settings.gateway_http_client.trusted_responses
+    )
\ No newline at end of file
@@ -1,13 +1,97 @@
 import logging
 
-from httpx import Client
+from httpx import BaseTransport, Client, HTTPTransport, Limits
 from locust.env import Environment  # Импорт окружения Locust для передачи в хуки
 
 from clients.http.event_hooks.locust_event_hook import (
     locust_request_event_hook,  # Хук для отслеживания начала запроса
     locust_response_event_hook  # Хук для сбора метрик по завершении запроса
 )
+from clients.http.transports.gevent_transport import GeventHTTPTransport
+from clients.http.transports.stats_transport import HTTPConnectionStatsCollector, HTTPConnectionStatsTransport
 from config import settings
+from tools.config.http import HTTPClientBackend, HTTPTransportScope
+
+# Пул соединений текущей группы виртуальных пользователей (TRANSPORT_SCOPE=group)
+# и сколько пользователей его уже получили
+_group_transport: BaseTransport | None = None
+_group_users = 0
+
+
+def get_gateway_http_connection_stats(environment: Environment) -> HTTPConnectionStatsCollector | None:
+    """
+    Возвращает статистику соединений процесса при GATEWAY_HTTP_CLIENT.CONNECTION_STATS=true.
+    Статистика создаётся один раз на окружение Locust и выводится в лог при завершении.
+
+    :param environment: Окружение Locust.
+    :return: Статистика соединений или None, если сбор выключен.
+    """
+    if not settings.gateway_http_client.connection_stats:
+        return None
+
+    if not hasattr(environment, "http_connection_stats"):
+        environment.http_connection_stats = HTTPConnectionStatsCollector()
+        environment.events.quitting.add_listener(lambda **kwargs: environment.http_connection_stats.log_stats())
+
+    return environment.http_connection_stats
+
+
+def build_gateway_http_transport(stats: HTTPConnectionStatsCollector | None = None) -> BaseTransport:
+    """
+    Создаёт транспорт (пул соединений) по настройкам GATEWAY_HTTP_CLIENT: httpx.HTTPTransport
+    с лимитами или GeventHTTPTransport при BACKEND=gevent. geventhttpclient не поддерживает HTTP/2,
+    поэтому при HTTP2=true всегда используется httpx.
+
+    :param stats: Статистика соединений, в которую транспорт передаёт свои запросы. None — без статистики.
+    :return: Транспорт, который можно передать в несколько экземпляров httpx.Client.
+    """
+    config = settings.gateway_http_client
+    if config.backend == HTTPClientBackend.GEVENT and not config.http2:
+        transport = GeventHTTPTransport(max_connections=config.max_connections, timeout=config.timeout)
+    else:
+        transport = HTTPTransport(
+            http1=not config.http2,
+            http2=config.http2,
+            limits=Limits(
+                max_connections=config.max_connections,
+                max_keepalive_connections=config.max_keepalive_connections,
+                keepalive_expiry=config.keepalive_expiry
+            )
+        )
+
+    if stats is not None:
+        return HTTPConnectionStatsTransport(transport, stats)
+
+    return transport
+
+
+def build_gateway_locust_http_transport(environment: Environment) -> BaseTransport | None:
+    """
+    Возвращает пул соединений для клиентов одного виртуального пользователя
+    по настройке GATEWAY_HTTP_CLIENT.TRANSPORT_SCOPE:
+    - client — None: каждый клиент создаёт собственный пул;
+    - user — новый пул, общий для клиентов этого виртуального пользователя;
+    - group — пул, общий для TRANSPORT_GROUP_SIZE виртуальных пользователей подряд.
+      Без HTTP2=true работает как user.
+
+    :param environment: Окружение Locust (для статистики соединений).
+    :return: Транспорт или None.
+    """
+    global _group_transport, _group_users
+
+    config = settings.gateway_http_client
+    if config.transport_scope == HTTPTransportScope.CLIENT:
+        return None
+
+    stats = get_gateway_http_connection_stats(environment)
+    if config.transport_scope == HTTPTransportScope.USER or not config.http2:
+        return build_gateway_http_transport(stats)
+
+    if _group_users % config.transport_group_size == 0:
+        _group_transport = build_gateway_http_transport(stats)
+    _group_users += 1
+
+    return _group_transport
 
 
 def build_gateway_http_client() -> Client:
@@ -22,7 +106,7 @@ def build_gateway_http_client() -> Client:
     )
 
 
-def build_gateway_locust_http_client(environment: Environment) -> Client:
+def build_gateway_locust_http_client(environment: Environment, transport: BaseTransport | None = None) -> Client:
     """
     HTTP-клиент, предназначенный специально для нагрузочного тестирования с помощью Locust.
 
@@ -34,7 +118,13 @@ def build_gateway_locust_http_client(environment: Environment) -> Client:
     Таким образом, данный клиент автоматически репортит статистику в Locust
     при каждом выполненном HTTP-запросе.
 
+    Клиенты одного виртуального пользователя могут делить пул соединений (transport):
+    см. build_gateway_locust_http_transport. Чем отправляются запросы (httpx или geventhttpclient),
+    задаёт GATEWAY_HTTP_CLIENT.BACKEND, версию протокола — GATEWAY_HTTP_CLIENT.HTTP2.
+    API клиента и хуки от этого не меняются.
+
     :param environment: Объект окружения Locust, необходим для генерации событий метрик.
+    :param transport: Общий пул соединений. None — у клиента будет собственный пул.
     :return: httpx.Client с подключёнными хуками под нагрузочное тестирование.
     """
     # Подавляем INFO-логи httpx (например: "HTTP Request: GET ... 200 OK")
@@ -44,6 +134,7 @@ def build_gateway_locust_http_client(environment: Environment) -> Client:
     return Client(
         timeout=settings.gateway_http_client.timeout,
         base_url=settings.gateway_http_client.client_url,
+        transport=transport or build_gateway_http_transport(get_gateway_http_connection_stats(environment)),
         event_hooks={
             "request": [locust_request_event_hook],  # Отмечаем время начала запроса
             "response": [locust_response_event_hook(environment)]  # Собираем метрики и передаём их в Locust
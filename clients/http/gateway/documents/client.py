@@ -1,9 +1,10 @@
-from httpx import Response
+from httpx import Response, BaseTransport
 from locust.env import Environment
 
 from clients.http.client import HTTPClient, HTTPClientExtensions
 from clients.http.gateway.client import build_gateway_http_client, build_gateway_locust_http_client
 from clients.http.gateway.documents.schema import GetTariffDocumentResponseSchema, GetContractDocumentResponseSchema
+from config import settings
 from tools.routes import APIRoutes
 
 
@@ -40,11 +41,11 @@ class DocumentsGatewayHTTPClient(HTTPClient):
 
     def get_tariff_document(self, account_id: str) -> GetTariffDocumentResponseSchema:
         response = self.get_tariff_document_api(account_id)
-        return GetTariffDocumentResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, GetTariffDocumentResponseSchema)
 
     def get_contract_document(self, account_id: str) -> GetContractDocumentResponseSchema:
         response = self.get_tariff_document_api(account_id)
-        return GetContractDocumentResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, GetContractDocumentResponseSchema)
 
 
 def build_documents_gateway_http_client() -> DocumentsGatewayHTTPClient:
@@ -55,14 +56,22 @@ def build_documents_gateway_http_client() -> DocumentsGatewayHTTPClient:
     """
     return DocumentsGatewayHTTPClient(client=build_gateway_http_client())
 
-def build_documents_gateway_locust_http_client(environment: Environment) -> DocumentsGatewayHTTPClient:
+def build_documents_gateway_locust_http_client(
+        environment: Environment,
+        transport: BaseTransport | None = None
+) -> DocumentsGatewayHTTPClient:
     """
     Функция создаёт экземпляр DocumentsGatewayHTTPClient адаптированного под Locust.
 
     Клиент автоматически собирает метрики и передаёт их в Locust через хуки.
     Используется исключительно в нагрузочных тестах.
+    Ответы разбираются в доверенном режиме при GATEWAY_HTTP_CLIENT.TRUSTED_RESPONSES=true.
 
     :param environment: объект окружения Locust.
+    :param transport: общий пул соединений клиентов виртуального пользователя.
     :return: экземпляр DocumentsGatewayHTTPClient с хуками сбора метрик.
     """
-    return DocumentsGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
\ No newline at end of file
+    return DocumentsGatewayHTTPClient(
+        client=build_gateway_locust_http_client(environment, transport),
+        trusted=settings.gateway_http_client.trusted_responses
+    )
\ No newline at end of file
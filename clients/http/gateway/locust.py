@@ -3,6 +3,7 @@ from locust import TaskSet, SequentialTaskSet
 # Импортируем типы и билдеры для построения HTTP API клиентов
 from clients.http.gateway.accounts.client import AccountsGatewayHTTPClient, build_accounts_gateway_locust_http_client
 from clients.http.gateway.cards.client import CardsGatewayHTTPClient, build_cards_gateway_locust_http_client
+from clients.http.gateway.client import build_gateway_locust_http_transport
 from clients.http.gateway.documents.client import (
     DocumentsGatewayHTTPClient,
     build_documents_gateway_locust_http_client
@@ -34,11 +35,13 @@ class GatewayHTTPTaskSet(TaskSet):
         Метод вызывается перед запуском задач TaskSet.
         Здесь создаются API клиенты с использованием контекста окружения Locust.
         """
-        self.users_gateway_client = build_users_gateway_locust_http_client(self.user.environment)
-        self.cards_gateway_client = build_cards_gateway_locust_http_client(self.user.environment)
-        self.accounts_gateway_client = build_accounts_gateway_locust_http_client(self.user.environment)
-        self.documents_gateway_client = build_documents_gateway_locust_http_client(self.user.environment)
-        self.operations_gateway_client = build_operations_gateway_locust_http_client(self.user.environment)
+        # Пул соединений клиентов виртуального пользователя (GATEWAY_HTTP_CLIENT.TRANSPORT_SCOPE)
+        transport = build_gateway_locust_http_transport(self.user.environment)
+        self.users_gateway_client = build_users_gateway_locust_http_client(self.user.environment, transport)
+        self.cards_gateway_client = build_cards_gateway_locust_http_client(self.user.environment, transport)
+        self.accounts_gateway_client = build_accounts_gateway_locust_http_client(self.user.environment, transport)
+        self.documents_gateway_client = build_documents_gateway_locust_http_client(self.user.environment, transport)
+        self.operations_gateway_client = build_operations_gateway_locust_http_client(self.user.environment, transport)
 
 
 class GatewayHTTPSequentialTaskSet(SequentialTaskSet):
@@ -59,8 +62,10 @@ class GatewayHTTPSequentialTaskSet(SequentialTaskSet):
         """
         Создание API клиентов для последовательного сценария.
         """
-        self.users_gateway_client = build_users_gateway_locust_http_client(self.user.environment)
-        self.cards_gateway_client = build_cards_gateway_locust_http_client(self.user.environment)
-        self.accounts_gateway_client = build_accounts_gateway_locust_http_client(self.user.environment)
-        self.documents_gateway_client = build_documents_gateway_locust_http_client(self.user.environment)
-        self.operations_gateway_client = build_operations_gateway_locust_http_client(self.user.environment)
+        # Пул соединений клиентов виртуального пользователя (GATEWAY_HTTP_CLIENT.TRANSPORT_SCOPE)
+        transport = build_gateway_locust_http_transport(self.user.environment)
+        self.users_gateway_client = build_users_gateway_locust_http_client(self.user.environment, transport)
+        self.cards_gateway_client = build_cards_gateway_locust_http_client(self.user.environment, transport)
+        self.accounts_gateway_client = build_accounts_gateway_locust_http_client(self.user.environment, transport)
+        self.documents_gateway_client = build_documents_gateway_locust_http_client(self.user.environment, transport)
+        self.operations_gateway_client = build_operations_gateway_locust_http_client(self.user.environment, transport)
@@ -1,4 +1,4 @@
-from httpx import Response, QueryParams
+from httpx import Response, QueryParams, BaseTransport
 from locust.env import Environment
 
 from clients.http.client import HTTPClient, HTTPClientExtensions
@@ -25,8 +25,20 @@ from clients.http.gateway.operations.schema import (
     MakeBillPaymentOperationResponseSchema,
     MakeCashWithdrawalOperationResponseSchema
 )
+from clients.http.templates import JSONBodyTemplate
+from config import settings
 from tools.routes import APIRoutes
 
+# Шаблоны тел запросов make_*_operation: ключи сериализуются один раз, на вызов подставляются значения полей.
+# Тело совпадает по байтам с json=Make*OperationRequestSchema(...).model_dump(by_alias=True)
+MAKE_FEE_OPERATION_TEMPLATE = JSONBodyTemplate(MakeFeeOperationRequestSchema)
+MAKE_TOP_UP_OPERATION_TEMPLATE = JSONBodyTemplate(MakeTopUpOperationRequestSchema)
+MAKE_CASHBACK_OPERATION_TEMPLATE = JSONBodyTemplate(MakeCashbackOperationRequestSchema)
+MAKE_TRANSFER_OPERATION_TEMPLATE = JSONBodyTemplate(MakeTransferOperationRequestSchema)
+MAKE_PURCHASE_OPERATION_TEMPLATE = JSONBodyTemplate(MakePurchaseOperationRequestSchema)
+MAKE_BILL_PAYMENT_OPERATION_TEMPLATE = JSONBodyTemplate(MakeBillPaymentOperationRequestSchema)
+MAKE_CASH_WITHDRAWAL_OPERATION_TEMPLATE = JSONBodyTemplate(MakeCashWithdrawalOperationRequestSchema)
+
 
 class OperationsGatewayHTTPClient(HTTPClient):
 
@@ -153,85 +165,78 @@ class OperationsGatewayHTTPClient(HTTPClient):
 
     def get_operation(self, operation_id: str) -> GetOperationResponseSchema:
         response = self.get_operation_api(operation_id=operation_id)
-        return GetOperationResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, GetOperationResponseSchema)
 
     def get_operation_receipt(self, operation_id: str) -> GetOperationReceiptResponseSchema:
         response = self.get_operation_receipt_api(operation_id=operation_id)
-        return GetOperationReceiptResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, GetOperationReceiptResponseSchema)
 
     def get_operations(self, account_id: str) -> GetOperationsResponseSchema:
         query = GetOperationsQuerySchema(account_id=account_id)
         response = self.get_operations_api(query)
-        return GetOperationsResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, GetOperationsResponseSchema)
 
     def get_operations_summary(self, account_id: str) -> GetOperationsSummaryResponseSchema:
         query = GetOperationsSummaryQuerySchema(account_id=account_id)
         response = self.get_operations_summary_api(query)
-        return GetOperationsSummaryResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, GetOperationsSummaryResponseSchema)
 
     def make_fee_operation(self, card_id: str, account_id: str) -> MakeFeeOperationResponseSchema:
-        request = MakeFeeOperationRequestSchema(
-            card_id=card_id,
-            account_id=account_id
+        response = self.post(
+            f"{APIRoutes.OPERATIONS}/make-fee-operation",
+            content=MAKE_FEE_OPERATION_TEMPLATE.render(card_id=card_id, account_id=account_id)
         )
-        response = self.make_fee_operation_api(request)
-        return MakeFeeOperationResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, MakeFeeOperationResponseSchema)
 
     def make_top_up_operation(self, card_id: str, account_id: str) -> MakeTopUpOperationResponseSchema:
-        request = MakeTopUpOperationRequestSchema(
-            card_id=card_id,
-            account_id=account_id
+        response = self.post(
+            f"{APIRoutes.OPERATIONS}/make-top-up-operation",
+            content=MAKE_TOP_UP_OPERATION_TEMPLATE.render(card_id=card_id, account_id=account_id)
         )
-        response = self.make_top_up_operation_api(request)
-        return MakeTopUpOperationResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, MakeTopUpOperationResponseSchema)
 
     def make_cashback_operation(self, card_id: str, account_id: str) -> MakeCashbackOperationResponseSchema:
-        request = MakeCashbackOperationRequestSchema(
-            card_id=card_id,
-            account_id=account_id
+        response = self.post(
+            f"{APIRoutes.OPERATIONS}/make-cashback-operation",
+            content=MAKE_CASHBACK_OPERATION_TEMPLATE.render(card_id=card_id, account_id=account_id)
         )
-        response = self.make_cashback_operation_api(request)
-        return MakeCashbackOperationResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, MakeCashbackOperationResponseSchema)
 
     def make_transfer_operation(self, card_id: str, account_id: str) -> MakeTransferOperationResponseSchema:
-        request = MakeTransferOperationRequestSchema(
-            card_id=card_id,
-            account_id=account_id
+        response = self.post(
+            f"{APIRoutes.OPERATIONS}/make-transfer-operation",
+            content=MAKE_TRANSFER_OPERATION_TEMPLATE.render(card_id=card_id, account_id=account_id)
         )
-        response = self.make_transfer_operation_api(request)
-        return MakeTransferOperationResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, MakeTransferOperationResponseSchema)
 
     def make_purchase_operation(
             self,
             card_id: str,
             account_id: str
     ) -> MakePurchaseOperationResponseSchema:
-        request = MakePurchaseOperationRequestSchema(
-            card_id=card_id,
-            account_id=account_id
+        response = self.post(
+            f"{APIRoutes.OPERATIONS}/make-purchase-operation",
+            content=MAKE_PURCHASE_OPERATION_TEMPLATE.render(card_id=card_id, account_id=account_id)
         )
-        response = self.make_purchase_operation_api(request)
-        return MakePurchaseOperationResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, MakePurchaseOperationResponseSchema)
 
     def make_bill_payment_operation(self, card_id: str, account_id: str) -> MakeBillPaymentOperationResponseSchema:
-        request = MakeBillPaymentOperationRequestSchema(
-            card_id=card_id,
-            account_id=account_id
+        response = self.post(
+            f"{APIRoutes.OPERATIONS}/make-bill-payment-operation",
+            content=MAKE_BILL_PAYMENT_OPERATION_TEMPLATE.render(card_id=card_id, account_id=account_id)
         )
-        response = self.make_bill_payment_operation_api(request)
-        return MakeBillPaymentOperationResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, MakeBillPaymentOperationResponseSchema)
 
     def make_cash_withdrawal_operation(
             self,
             card_id: str,
             account_id: str
     ) -> MakeCashWithdrawalOperationResponseSchema:
-        request = MakeCashWithdrawalOperationRequestSchema(
-            card_id=card_id,
-            account_id=account_id
+        response = self.post(
+            f"{APIRoutes.OPERATIONS}/make-cash-withdrawal-operation",
+            content=MAKE_CASH_WITHDRAWAL_OPERATION_TEMPLATE.render(card_id=card_id, account_id=account_id)
         )
-        response = self.make_cash_withdrawal_operation_api(request)
-        return MakeCashWithdrawalOperationResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, MakeCashWithdrawalOperationResponseSchema)
 
 def build_operations_gateway_http_client() -> OperationsGatewayHTTPClient:
     """
@@ -241,14 +246,22 @@ def build_operations_gateway_http_client() -> OperationsGatewayHTTPClient:
     """
     return OperationsGatewayHTTPClient(client=build_gateway_http_client())
 
-def build_operations_gateway_locust_http_client(environment: Environment) -> OperationsGatewayHTTPClient:
+def build_operations_gateway_locust_http_client(
+        environment: Environment,
+        transport: BaseTransport | None = None
+) -> OperationsGatewayHTTPClient:
     """
     Функция создаёт экземпляр OperationsGatewayHTTPClient адаптированного под Locust.
 
     Клиент автоматически собирает метрики и передаёт их в Locust через хуки.
     Используется исключительно в нагрузочных тестах.
+    Ответы разбираются в доверенном режиме при GATEWAY_HTTP_CLIENT.TRUSTED_RESPONSES=true.
 
     :param environment: объект окружения Locust.
+    :param transport: общий пул соединений клиентов виртуального пользователя.
     :return: экземпляр OperationsGatewayHTTPClient с хуками сбора метрик.
     """
-    return OperationsGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
\ No newline at end of file
+    return OperationsGatewayHTTPClient(
+        client=build_gateway_locust_http_client(environment, transport),
+        trusted=settings.gateway_http_client.trusted_responses
+    )
\ No newline at end of file
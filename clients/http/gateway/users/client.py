@@ -1,4 +1,4 @@
-from httpx import Response
+from httpx import Response, BaseTransport
 from locust.env import Environment
 
 from clients.http.client import HTTPClient, HTTPClientExtensions
@@ -8,6 +8,7 @@ from clients.http.gateway.users.schema import (
     CreateUserRequestSchema,
     CreateUserResponseSchema
 )
+from config import settings
 from tools.routes import APIRoutes
 
 class UsersGatewayHTTPClient(HTTPClient):
@@ -40,13 +41,13 @@ class UsersGatewayHTTPClient(HTTPClient):
 
     def get_user(self, user_id: str) -> GetUserResponseSchema:
         response = self.get_user_api(user_id)
-        # Инициализируем модель через валидацию JSON строки
-        return GetUserResponseSchema.model_validate_json(response.text)
+        # Валидируем модель прямо из байтов ответа
+        return self.parse_response(response, GetUserResponseSchema)
 
     def create_user(self) -> CreateUserResponseSchema:
         request = CreateUserRequestSchema()
         response = self.create_user_api(request)
-        return CreateUserResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, CreateUserResponseSchema)
 
 
 def build_users_gateway_http_client() -> UsersGatewayHTTPClient:
@@ -58,14 +59,22 @@ def build_users_gateway_http_client() -> UsersGatewayHTTPClient:
     return UsersGatewayHTTPClient(client=build_gateway_http_client())
 
 # Новый билдер для нагрузочного тестирования
-def build_users_gateway_locust_http_client(environment: Environment) -> UsersGatewayHTTPClient:
+def build_users_gateway_locust_http_client(
+        environment: Environment,
+        transport: BaseTransport | None = None
+) -> UsersGatewayHTTPClient:
     """
     Функция создаёт экземпляр UsersGatewayHTTPClient адаптированного под Locust.
 
     Клиент автоматически собирает метрики и передаёт их в Locust через хуки.
     Используется исключительно в нагрузочных тестах.
+    Ответы разбираются в доверенном режиме при GATEWAY_HTTP_CLIENT.TRUSTED_RESPONSES=true.
 
     :param environment: объект окружения Locust.
+    :param transport: общий пул соединений клиентов виртуального пользователя.
     :return: экземпляр UsersGatewayHTTPClient с хуками сбора метрик.
     """
-    return UsersGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
\ No newline at end of file
+    return UsersGatewayHTTPClient(
+        client=build_gateway_locust_http_client(environment, transport),
+        trusted=settings.gateway_http_client.trusted_responses
+    )
\ No newline at end of file
@@ -0,0 +1,86 @@
+import math
+from enum import Enum
+from json.encoder import encode_basestring
+from typing import Any, Callable
+
+from pydantic import BaseModel
+
+
+def encode_float(value: float) -> str:
+    # Как json.dumps(allow_nan=False) в httpx: repr для конечных чисел, ошибка для NaN и бесконечностей
+    value = float(value)
+    if not math.isfinite(value):
+        raise ValueError(f"Out of range float values are not JSON compliant: {value!r}")
+    return float.__repr__(value)
+
+
+def get_field_encoder(annotation: Any) -> Callable[[Any], str]:
+    """
+    Кодировщик значения поля в JSON, совпадающий по байтам с json.dumps(ensure_ascii=False) в httpx.
+
+    :param annotation: Тип поля схемы.
+    :return: Функция, которая превращает значение поля в фрагмент JSON.
+    :raises TypeError: Тип поля не поддерживается шаблонами.
+    """
+    if isinstance(annotation, type) and issubclass(annotation, Enum) and issubclass(annotation, str):
+        # Строка приводится к члену перечисления, как при валидации pydantic
+        return lambda value: encode_basestring(annotation(value))
+    if annotation is str:
+        return encode_basestring
+    if annotation is float:
+        return encode_float
+    if annotation is bool:
+        return lambda value: "true" if value else "false"
+    if annotation is int:
+        return int.__repr__
+
+    raise TypeError(f"Unsupported field type for JSON body template: {annotation!r}")
+
+
+class JSONBodyTemplate:
+    """
+    Предкомпилированный шаблон JSON-тела запроса по плоской pydantic-схеме.
+
+    Ключи (алиасы полей), разделители и кодировщики значений готовятся один раз при создании
+    шаблона; на каждый вызов render только кодируются и подставляются значения полей. Поля,
+    не переданные в render, заполняются значениями по умолчанию схемы (default_factory с Faker)
+    в порядке полей схемы —
+    так же, как при создании модели, поэтому при одинаковом состоянии генератора тело совпадает
+    по байтам с json=Schema(...).model_dump(by_alias=True) в httpx, но без валидации модели,
+    model_dump и json.dumps.
+
+    :param schema: Схема запроса с полями простых типов (str, перечисление-строка, float, int, bool).
+    :raises TypeError: В схеме есть поле неподдерживаемого типа.
+    """
+
+    def __init__(self, schema: type[BaseModel]):
+        self.schema = schema
+        # (фрагмент JSON перед значением, имя поля, кодировщик, значение по умолчанию или None для обязательного поля)
+        self.fields: list[tuple[str, str, Callable[[Any], str], Callable[[], Any] | None]] = []
+
+        for index, (name, field) in enumerate(schema.model_fields.items()):
+            key = encode_basestring(field.alias or name)
+            prefix = f"{'{' if index == 0 else ','}{key}:"
+
+            default = field.default_factory
+            if default is None and not field.is_required():
+                default = lambda value=field.default: value
+
+            self.fields.append((prefix, name, get_field_encoder(field.annotation), default))
+
+    def render(self, **values: Any) -> bytes:
+        """
+        Собирает тело запроса.
+
+        :param values: Значения полей по именам полей схемы (например, card_id, account_id, amount).
+        :return: JSON-тело запроса в UTF-8.
+        :raises KeyError: Не передано обязательное поле.
+        """
+        parts = []
+        for prefix, name, encoder, default in self.fields:
+            value = values[name] if name in values or default is None else default()
+            parts.append(prefix)
+            parts.append(encoder(value))
+        parts.append("}" if parts else "{}")
+
+        return "".join(parts).encode()
@@ -0,0 +1,183 @@
+import socket
+
+from geventhttpclient import HTTPClient as GeventHTTPClient
+from geventhttpclient.connectionpool import ConnectionPool, SSLConnectionPool
+from geventhttpclient.response import HTTPParseError
+from httpx import (
+    BaseTransport,
+    ByteStream,
+    ConnectError,
+    ConnectTimeout,
+    ReadError,
+    ReadTimeout,
+    RemoteProtocolError,
+    Request,
+    Response
+)
+
+# Порты по умолчанию, если в URL порт не указан
+DEFAULT_PORTS = {"http": 80, "https": 443}
+# Размер пула для max_connections=None: у пула geventhttpclient всегда есть размер,
+# поэтому «без ограничения» заменяется заведомо большим количеством соединений
+UNLIMITED_CONNECTIONS = 10_000
+
+
+class GeventConnectError(Exception):
+    """
+    Ошибка установки соединения в пуле geventhttpclient. Исходная ошибка сокета — в __cause__.
+    Отделяет ошибки подключения от ошибок чтения: у geventhttpclient это одни и те же исключения сокета.
+    """
+
+
+# Написано под geventhttpclient 2.5.1 (см. requirements.txt): переопределяется ConnectionPool._create_socket —
+# метод, который разрешает адрес, создаёт и подключает новый сокет. При обновлении библиотеки его нужно сверить
+class GeventConnectErrorMixin:
+    """
+    Помечает ошибки установки соединения пула geventhttpclient исключением GeventConnectError.
+    """
+
+    def _create_socket(self):
+        try:
+            return super()._create_socket()
+        except OSError as error:
+            raise GeventConnectError(str(error)) from error
+
+
+class GeventConnectionPool(GeventConnectErrorMixin, ConnectionPool):
+    pass
+
+
+class GeventSSLConnectionPool(GeventConnectErrorMixin, SSLConnectionPool):
+    pass
+
+
+class GeventPoolHTTPClient(GeventHTTPClient):
+    """
+    geventhttpclient.HTTPClient с пулом GeventConnectionPool (или GeventSSLConnectionPool для https).
+
+    В geventhttpclient 2.5.1 у HTTPClient нет параметра для класса пула: пул создаётся прямо в __init__,
+    поэтому после базовой инициализации он заменяется пулом с теми же параметрами. Соединений
+    базовый пул ещё не открывал, замена ничего не теряет.
+
+    :param host: Хост.
+    :param port: Порт.
+    :param ssl: Подключаться по TLS.
+    :param concurrency: Размер пула соединений.
+    :param connection_timeout: Таймаут подключения в секундах.
+    :param network_timeout: Таймаут чтения в секундах.
+    """
+
+    def __init__(
+            self,
+            host: str,
+            port: int,
+            ssl: bool,
+            concurrency: int,
+            connection_timeout: float,
+            network_timeout: float
+    ):
+        super().__init__(
+            host,
+            port,
+            ssl=ssl,
+            concurrency=concurrency,
+            connection_timeout=connection_timeout,
+            network_timeout=network_timeout
+        )
+
+        options = {"ssl_options": {}} if ssl else {}
+        pool_class = GeventSSLConnectionPool if ssl else GeventConnectionPool
+        self._connection_pool = pool_class(
+            host,
+            port,
+            host,
+            port,
+            size=concurrency,
+            connection_timeout=connection_timeout,
+            network_timeout=network_timeout,
+            **options
+        )
+
+
+class GeventHTTPTransport(BaseTransport):
+    """
+    Транспорт httpx поверх geventhttpclient — движка FastHttpUser из Locust.
+
+    httpx.Client по-прежнему собирает запрос (base_url, параметры, JSON, extensions вроде route)
+    и вызывает event hooks, а отправку запроса, пул соединений и разбор ответа выполняет
+    geventhttpclient: парсер HTTP на C и сокеты gevent вместо httpcore и h11. Поэтому HTTPClient,
+    его методы get/post и хуки Locust работают без изменений.
+
+    На каждый хост (схема, хост, порт) создаётся отдельный geventhttpclient.HTTPClient со своим пулом.
+
+    :param max_connections: Размер пула соединений одного хоста. None — без ограничения (UNLIMITED_CONNECTIONS).
+    :param timeout: Таймаут подключения и чтения в секундах.
+    """
+
+    def __init__(self, max_connections: int | None = 1, timeout: float = 100.0):
+        self.max_connections = UNLIMITED_CONNECTIONS if max_connections is None else max_connections
+        self.timeout = timeout
+        self.clients: dict[tuple[str, str, int], GeventPoolHTTPClient] = {}
+
+    def get_client(self, scheme: str, host: str, port: int | None) -> GeventPoolHTTPClient:
+        port = port or DEFAULT_PORTS[scheme]
+        key = (scheme, host, port)
+        if key not in self.clients:
+            self.clients[key] = GeventPoolHTTPClient(
+                host,
+                port,
+                ssl=scheme == "https",
+                concurrency=self.max_connections,
+                connection_timeout=self.timeout,
+                network_timeout=self.timeout
+            )
+
+        return self.clients[key]
+
+    def handle_request(self, request: Request) -> Response:
+        """
+        Отправляет запрос через geventhttpclient и возвращает ответ httpx с уже прочитанным телом.
+        Ошибки сети и протокола приводятся к исключениям httpx, как в httpx.HTTPTransport:
+        ошибки подключения — к ConnectTimeout и ConnectError, ошибки чтения — к ReadTimeout и ReadError.
+
+        :param request: Запрос, собранный httpx.Client.
+        :return: Ответ httpx.
+        """
+        url = request.url
+        client = self.get_client(url.scheme, url.host, url.port)
+
+        try:
+            response = client.request(
+                request.method,
+                url.raw_path.decode("ascii"),
+                body=request.read(),
+                headers=request.headers
+            )
+            try:
+                content = response.read()
+            finally:
+                # Возвращаем соединение в пул (или закрываем его, если сервер не держит keep-alive)
+                response.release()
+        except GeventConnectError as error:
+            if isinstance(error.__cause__, socket.timeout):
+                raise ConnectTimeout(str(error), request=request) from error.__cause__
+            raise ConnectError(str(error), request=request) from error.__cause__
+        except socket.timeout as error:
+            raise ReadTimeout(str(error), request=request) from error
+        except HTTPParseError as error:
+            raise RemoteProtocolError(str(error), request=request) from error
+        except OSError as error:
+            raise ReadError(str(error), request=request) from error
+
+        return Response(
+            status_code=response.status_code,
+            headers=list(response.items()),
+            stream=ByteStream(content),
+            extensions={"http_version": b"HTTP/1.1"}
+        )
+
+    def close(self) -> None:
+        for client in self.clients.values():
+            client.close()
+
+        self.clients.clear()
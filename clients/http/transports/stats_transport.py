@@ -0,0 +1,105 @@
+from weakref import WeakKeyDictionary
+
+from httpx import BaseTransport, Request, Response
+from pydantic import BaseModel
+
+from tools.logger import get_logger
+
+logger = get_logger("HTTP_CONNECTION_STATS")
+
+
+class HTTPConnectionStats(BaseModel):
+    """
+    Статистика одного соединения.
+
+    Attributes:
+        connection (int): Порядковый номер соединения в процессе.
+        http_version (str): Версия протокола соединения (HTTP/1.1 или HTTP/2).
+        streams (int): Сколько запросов (потоков HTTP/2) выполнено через соединение.
+        max_concurrent_streams (int): Максимальное количество одновременных запросов в соединении.
+            Для HTTP/1.1 всегда 1: соединение выполняет запросы по одному.
+    """
+    connection: int
+    http_version: str
+    streams: int = 0
+    max_concurrent_streams: int = 0
+
+
+class HTTPConnectionStatsCollector:
+    """
+    Статистика потоков по соединениям всех транспортов процесса.
+
+    Соединение определяется по сетевому потоку httpcore из extensions ответа (network_stream),
+    поэтому статистика собирается только для backend=httpx.
+    """
+
+    def __init__(self):
+        self.connections: list[HTTPConnectionStats] = []
+        # Сетевой поток httpcore → статистика его соединения. Закрытые соединения удаляются сборщиком
+        # мусора, их статистика остаётся в connections
+        self.streams: WeakKeyDictionary[object, HTTPConnectionStats] = WeakKeyDictionary()
+
+    def record(self, response: Response, concurrent_streams: int) -> None:
+        """
+        Учитывает выполненный запрос в статистике его соединения.
+
+        :param response: Ответ транспорта httpx.
+        :param concurrent_streams: Сколько запросов выполнялось через транспорт одновременно с этим,
+                                   включая его. Пул с HTTP/2 держит одно соединение на хост,
+                                   поэтому для HTTP/2 это параллельные потоки соединения.
+        """
+        network_stream = response.extensions.get("network_stream")
+        if network_stream is None:
+            return
+
+        stats = self.streams.get(network_stream)
+        if stats is None:
+            http_version = response.extensions.get("http_version", b"HTTP/1.1").decode()
+            stats = HTTPConnectionStats(connection=len(self.connections), http_version=http_version)
+            self.connections.append(stats)
+            self.streams[network_stream] = stats
+
+        stats.streams += 1
+        if stats.http_version != "HTTP/2":
+            concurrent_streams = 1
+        stats.max_concurrent_streams = max(stats.max_concurrent_streams, concurrent_streams)
+
+    def log_stats(self) -> None:
+        for http_version in sorted({stats.http_version for stats in self.connections}):
+            connections = [stats for stats in self.connections if stats.http_version == http_version]
+            streams = [stats.streams for stats in connections]
+            logger.info(
+                f"HTTP connection stats {http_version}: {len(connections)} connections, "
+                f"{sum(streams)} streams, streams per connection avg {sum(streams) / len(connections):.1f} "
+                f"max {max(streams)}, max concurrent streams "
+                f"{max(stats.max_concurrent_streams for stats in connections)}"
+            )
+
+
+class HTTPConnectionStatsTransport(BaseTransport):
+    """
+    Транспорт-обёртка, который считает одновременные запросы и передаёт статистику соединений
+    в HTTPConnectionStatsCollector. Запросы выполняет вложенный транспорт.
+
+    :param transport: Транспорт, который выполняет запросы.
+    :param stats: Статистика соединений процесса.
+    """
+
+    def __init__(self, transport: BaseTransport, stats: HTTPConnectionStatsCollector):
+        self.transport = transport
+        self.stats = stats
+        self.active_requests = 0
+
+    def handle_request(self, request: Request) -> Response:
+        self.active_requests += 1
+        concurrent_streams = self.active_requests
+        try:
+            response = self.transport.handle_request(request)
+        finally:
+            self.active_requests -= 1
+
+        self.stats.record(response, concurrent_streams)
+        return response
+
+    def close(self) -> None:
+        self.transport.close()
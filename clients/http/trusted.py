@@ -0,0 +1,57 @@
+from functools import cache
+from typing import Any, get_args, get_origin
+
+from pydantic import BaseModel, Field, create_model
+
+
+def is_identifier_field(name: str) -> bool:
+    # Идентификаторы (id, account_id, card_id, ...) — то, что следующие задачи сценария передают в запросы
+    return name == "id" or name.endswith("_id")
+
+
+def get_trusted_annotation(name: str, annotation: Any) -> Any | None:
+    """
+    Тип поля доверенной схемы: вложенные модели и списки моделей сокращаются рекурсивно,
+    идентификаторы сохраняются как есть, остальные поля отбрасываются.
+
+    :param name: Имя поля.
+    :param annotation: Тип поля исходной схемы.
+    :return: Тип поля доверенной схемы или None, если поле не нужно.
+    """
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        schema = get_trusted_schema(annotation)
+        return schema if schema.model_fields else None
+
+    if get_origin(annotation) is list:
+        (item,) = get_args(annotation)
+        if isinstance(item, type) and issubclass(item, BaseModel):
+            schema = get_trusted_schema(item)
+            return list[schema] if schema.model_fields else None
+
+    if is_identifier_field(name):
+        return annotation
+
+    return None
+
+
+@cache
+def get_trusted_schema(schema: type[BaseModel]) -> type[BaseModel]:
+    """
+    Строит по схеме ответа доверенную схему, в которой остались только идентификаторы и путь к ним:
+    например, operation.id у MakeTopUpOperationResponseSchema или account.id и account.cards[*].id
+    у OpenDebitCardAccountResponseSchema. Отброшенные поля пропускаются парсером JSON без валидации
+    (email, перечисления, даты, суммы), поэтому разбор ответа дешевле.
+
+    Доверенная схема не проверяет ответ на соответствие контракту — её используют только
+    в нагрузочных тестах, где корректность ответов проверяют функциональные тесты.
+
+    :param schema: Схема ответа.
+    :return: Доверенная схема (кешируется для каждой схемы ответа).
+    """
+    fields = {}
+    for name, field in schema.model_fields.items():
+        annotation = get_trusted_annotation(name, field.annotation)
+        if annotation is not None:
+            fields[name] = (annotation, Field(alias=field.alias))
+
+    return create_model(f"Trusted{schema.__name__}", **fields)
@@ -1,25 +1,10 @@
-import locust.stats
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 # Импортируем вложенные модели
 from tools.config.grpc import GRPCClientConfig
 from tools.config.http import HTTPClientConfig
 from tools.config.locust import LocustUserConfig
-
-# Настройка списка процентилей, которые будут попадать в отчёты Locust
-locust.stats.PERCENTILES_TO_REPORT = [0.50, 0.60, 0.70, 0.80, 0.90, 0.95, 0.99, 1.0]
-
-# Интервал (в секундах) между записями агрегированной статистики в CSV
-locust.stats.CSV_STATS_INTERVAL_SEC = 5
-
-# Интервал (в секундах) между записями "исторической" статистики (динамика значений)
-locust.stats.HISTORY_STATS_INTERVAL_SEC = 5
-
-# Интервал (в секундах) между обновлением статистики в консоли Locust
-locust.stats.CONSOLE_STATS_INTERVAL_SEC = 5
-
-# Интервал (в секундах) между принудительной записью CSV на диск
-locust.stats.CSV_STATS_FLUSH_INTERVAL_SEC = 5
+from tools.config.seeds import SeedsConfig
 
 
 class Settings(BaseSettings):
@@ -35,6 +20,12 @@ class Settings(BaseSettings):
     locust_user: LocustUserConfig  # Настройки виртуального пользователя
     gateway_http_client: HTTPClientConfig  # Настройки HTTP-клиента
     gateway_grpc_client: GRPCClientConfig  # Настройки gRPC-клиента
+    # Адреса внутренних сервисов. Нужны только для сидинга в обход gateway (SEEDS.BACKEND=services)
+    users_grpc_client: GRPCClientConfig | None = None
+    accounts_grpc_client: GRPCClientConfig | None = None
+    cards_grpc_client: GRPCClientConfig | None = None
+    operations_grpc_client: GRPCClientConfig | None = None
+    seeds: SeedsConfig  # Настройки сидинга
 
 
 # Глобальный объект настроек — его можно импортировать в любом месте проекта
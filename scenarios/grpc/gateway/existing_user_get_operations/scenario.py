@@ -2,6 +2,9 @@ from locust import task, events
 from locust.env import Environment
 
 from clients.grpc.gateway.locust import GatewayGRPCTaskSet
+from seeds.index import SeedsUserIndex
+from seeds.locust import init_seeds_pool
+from seeds.pool import SeedsLease
 from seeds.scenarios.existing_user_get_operations import ExistingUserGetOperationsSeedsScenario
 from seeds.schema.result import SeedUserResult
 from tools.locust.user import LocustBaseUser
@@ -10,17 +13,28 @@ from tools.locust.user import LocustBaseUser
 @events.init.add_listener
 def init(environment: Environment, **kwargs):
     seeds_scenario = ExistingUserGetOperationsSeedsScenario()
-    seeds_scenario.build()
-
-    environment.seeds = seeds_scenario.load()
+    # Сидинг и загрузка пользователей в пул environment.seeds.
+    # При распределённом запуске сидинг выполняет только мастер, а воркеры получают свою часть пользователей
+    init_seeds_pool(environment, seeds_scenario)
 
 
 class GetOperationsTaskSet(GatewayGRPCTaskSet):
     seed_user: SeedUserResult
+    seed_lease: SeedsLease
+    seed_index: SeedsUserIndex  # Счета, карты и операции только арендованного пользователя
 
     def on_start(self) -> None:
         super().on_start()
-        self.seed_user = self.user.environment.seeds.get_random_user()
+
+        # Арендуем сид-пользователя из пула: пока аренда не возвращена, другие виртуальные
+        # пользователи его не получат (если пул не исчерпан, см. SEEDS.POOL_POLICY)
+        self.seed_lease = self.user.environment.seeds.acquire()
+        self.seed_user = self.seed_lease.user
+        self.seed_index = self.seed_lease.index_view
+
+    def on_stop(self) -> None:
+        # Возвращаем сид-пользователя в пул
+        self.seed_lease.release()
 
     @task(1)
     def get_accounts(self):
@@ -31,14 +45,14 @@ class GetOperationsTaskSet(GatewayGRPCTaskSet):
     def get_operations(self):
         # Несколько раз обновляет список операций
         self.operations_gateway_client.get_operations(
-            account_id=self.seed_user.credit_card_accounts[0].account_id
+            account_id=self.seed_index.random_account("credit_card_accounts")
         )
 
     @task(2)
     def get_operations_summary(self):
         # Получаем статистику по операциям пользователя
         self.operations_gateway_client.get_operations_summary(
-            account_id=self.seed_user.credit_card_accounts[0].account_id
+            account_id=self.seed_index.random_account("credit_card_accounts")
         )
 
 
@@ -2,6 +2,9 @@ from locust import task, events
 from locust.env import Environment
 
 from clients.grpc.gateway.locust import GatewayGRPCTaskSet
+from seeds.index import SeedsUserIndex
+from seeds.locust import init_seeds_pool
+from seeds.pool import SeedsLease
 from seeds.scenarios.existing_user_make_purchase_operation import ExistingUserMakePurchaseOperationSeedsScenario
 from seeds.schema.result import SeedUserResult
 from tools.locust.user import LocustBaseUser
@@ -12,27 +15,37 @@ from tools.locust.user import LocustBaseUser
 def init(environment: Environment, **kwargs):
     # Выполняем сидинг
     seeds_scenario = ExistingUserMakePurchaseOperationSeedsScenario()
-    seeds_scenario.build()  # создаём пользователей, счета, карты и операции
-
-    # Загружаем результат сидинга (из файла JSON)
-    environment.seeds = seeds_scenario.load()
+    # Сидинг и загрузка пользователей в пул environment.seeds.
+    # При распределённом запуске сидинг выполняет только мастер, а воркеры получают свою часть пользователей
+    init_seeds_pool(environment, seeds_scenario)
 
 
 # TaskSet — сценарий пользователя. Каждый виртуальный пользователь выполняет эти задачи
 class MakePurchaseOperationSequentialTaskSet(GatewayGRPCTaskSet):
     seed_user: SeedUserResult  # Типизированная ссылка на данные из сидинга
+    seed_lease: SeedsLease
+    seed_index: SeedsUserIndex  # Счета, карты и операции только арендованного пользователя
 
     def on_start(self) -> None:
         super().on_start()
-        # Получаем случайного пользователя из подготовленного списка
-        self.seed_user = self.user.environment.seeds.get_random_user()
+
+        # Арендуем сид-пользователя из пула: пока аренда не возвращена, другие виртуальные
+        # пользователи его не получат (если пул не исчерпан, см. SEEDS.POOL_POLICY)
+        self.seed_lease = self.user.environment.seeds.acquire()
+        self.seed_user = self.seed_lease.user
+        self.seed_index = self.seed_lease.index_view
+
+    def on_stop(self) -> None:
+        # Возвращаем сид-пользователя в пул
+        self.seed_lease.release()
 
     @task(1)
     def make_purchase_operation(self):
-        # Совершаем покупку по первой карте пользователя
+        # Совершаем покупку по случайной карте кредитного счёта пользователя
+        account_id = self.seed_index.random_account("credit_card_accounts")
         self.operations_gateway_client.make_purchase_operation(
-            card_id=self.seed_user.credit_card_accounts[0].physical_cards[0].card_id,
-            account_id=self.seed_user.credit_card_accounts[0].account_id
+            card_id=self.seed_index.random_card(account_id),
+            account_id=account_id
         )
 
     @task(2)
@@ -44,14 +57,14 @@ class MakePurchaseOperationSequentialTaskSet(GatewayGRPCTaskSet):
     def get_operations(self):
         # Получаем список операций по счёту
         self.operations_gateway_client.get_operations(
-            account_id=self.seed_user.credit_card_accounts[0].account_id
+            account_id=self.seed_index.random_account("credit_card_accounts")
         )
 
     @task(2)
     def get_operations_summary(self):
         # Получаем статистику по операциям пользователя
         self.operations_gateway_client.get_operations_summary(
-            account_id=self.seed_user.credit_card_accounts[0].account_id
+            account_id=self.seed_index.random_account("credit_card_accounts")
         )
 
 
@@ -2,6 +2,9 @@ from locust import task, events
 from locust.env import Environment
 
 from clients.http.gateway.locust import GatewayHTTPTaskSet
+from seeds.index import SeedsUserIndex
+from seeds.locust import init_seeds_pool
+from seeds.pool import SeedsLease
 from seeds.scenarios.existing_user_get_documents import ExistingUserGetDocumentsSeedsScenario
 from seeds.schema.result import SeedUserResult
 from tools.locust.user import LocustBaseUser
@@ -14,24 +17,31 @@ def init(environment: Environment, **kwargs):
     # Создаем экземпляр сидинг-сценария
     seeds_scenario = ExistingUserGetDocumentsSeedsScenario()
 
-    # Выполняем генерацию данных, если они ещё не созданы
-    seeds_scenario.build()
-
-    # Загружаем сгенерированных пользователей в окружение Locust
-    environment.seeds = seeds_scenario.load()
+    # Сидинг и загрузка пользователей в пул environment.seeds.
+    # При распределённом запуске сидинг выполняет только мастер, а воркеры получают свою часть пользователей
+    init_seeds_pool(environment, seeds_scenario)
 
 
 # Набор задач (TaskSet), который будет выполняться виртуальными пользователями.
 class GetDocumentsTaskSet(GatewayHTTPTaskSet):
     # Типизируем объект пользователя из сидинга
     seed_user: SeedUserResult
+    seed_lease: SeedsLease
+    seed_index: SeedsUserIndex  # Счета, карты и операции только арендованного пользователя
 
     # Метод вызывается при запуске каждой сессии пользователя (до начала задач)
     def on_start(self) -> None:
         super().on_start()
 
-        # Получаем следующего пользователя из списка (по порядку!)
-        self.seed_user = self.user.environment.seeds.get_next_user()
+        # Арендуем сид-пользователя из пула: пока аренда не возвращена, другие виртуальные
+        # пользователи его не получат (если пул не исчерпан, см. SEEDS.POOL_POLICY)
+        self.seed_lease = self.user.environment.seeds.acquire()
+        self.seed_user = self.seed_lease.user
+        self.seed_index = self.seed_lease.index_view
+
+    def on_stop(self) -> None:
+        # Возвращаем сид-пользователя в пул
+        self.seed_lease.release()
 
     @task(1)
     def get_accounts(self):
@@ -42,14 +52,14 @@ class GetDocumentsTaskSet(GatewayHTTPTaskSet):
     def get_tariff_document(self):
         # Загружаем тарифный документ по сберегательному счёту
         self.documents_gateway_client.get_tariff_document(
-            account_id=self.seed_user.savings_accounts[0].account_id
+            account_id=self.seed_index.random_account("savings_accounts")
         )
 
     @task(2)
     def get_contract_document(self):
         # Загружаем договор по дебетовой карте
         self.documents_gateway_client.get_contract_document(
-            account_id=self.seed_user.debit_card_accounts[0].account_id
+            account_id=self.seed_index.random_account("debit_card_accounts")
         )
 
 
@@ -0,0 +1,606 @@
+"""
+Асинхронный сидинг через grpc.aio и httpx.AsyncClient.
+
+Модуль намеренно не импортирует locust и gRPC-клиенты из clients/grpc: Locust выполняет
+gevent monkey patching, а clients/grpc/client.py переводит gRPC в gevent-режим. В таком процессе
+asyncio, grpc.aio и httpx.AsyncClient не работают, поэтому асинхронный сидинг запускается
+в отдельном процессе: python -m seeds.async_builder --scenario <name> --protocol grpc < plan.json
+"""
+import argparse
+import asyncio
+import random
+import sys
+import time
+from typing import Awaitable, Callable, TypeVar
+
+import grpc
+from httpx import AsyncClient, Limits, Response
+from pydantic import BaseModel
+
+from clients.http.gateway.accounts.schema import (
+    OpenDepositAccountRequestSchema,
+    OpenSavingsAccountRequestSchema,
+    OpenDepositAccountResponseSchema,
+    OpenSavingsAccountResponseSchema,
+    OpenDebitCardAccountRequestSchema,
+    OpenDebitCardAccountResponseSchema,
+    OpenCreditCardAccountRequestSchema,
+    OpenCreditCardAccountResponseSchema
+)
+from clients.http.gateway.cards.schema import (
+    IssueVirtualCardRequestSchema,
+    IssuePhysicalCardRequestSchema,
+    IssueVirtualCardResponseSchema,
+    IssuePhysicalCardResponseSchema
+)
+from clients.http.gateway.operations.schema import (
+    MakeTopUpOperationRequestSchema,
+    MakeTopUpOperationResponseSchema,
+    MakeTransferOperationRequestSchema,
+    MakePurchaseOperationRequestSchema,
+    MakeTransferOperationResponseSchema,
+    MakePurchaseOperationResponseSchema,
+    MakeCashWithdrawalOperationRequestSchema,
+    MakeCashWithdrawalOperationResponseSchema
+)
+from clients.http.gateway.users.schema import CreateUserRequestSchema, CreateUserResponseSchema
+from config import settings
+from contracts.services.gateway.accounts.accounts_gateway_service_pb2_grpc import AccountsGatewayServiceStub
+from contracts.services.gateway.accounts.rpc_open_credit_card_account_pb2 import OpenCreditCardAccountRequest
+from contracts.services.gateway.accounts.rpc_open_debit_card_account_pb2 import OpenDebitCardAccountRequest
+from contracts.services.gateway.accounts.rpc_open_deposit_account_pb2 import OpenDepositAccountRequest
+from contracts.services.gateway.accounts.rpc_open_savings_account_pb2 import OpenSavingsAccountRequest
+from contracts.services.gateway.cards.cards_gateway_service_pb2_grpc import CardsGatewayServiceStub
+from contracts.services.gateway.cards.rpc_issue_physical_card_pb2 import IssuePhysicalCardRequest
+from contracts.services.gateway.cards.rpc_issue_virtual_card_pb2 import IssueVirtualCardRequest
+from contracts.services.gateway.operations.operations_gateway_service_pb2_grpc import OperationsGatewayServiceStub
+from contracts.services.gateway.operations.rpc_make_cash_withdrawal_operation_pb2 import (
+    MakeCashWithdrawalOperationRequest
+)
+from contracts.services.gateway.operations.rpc_make_purchase_operation_pb2 import MakePurchaseOperationRequest
+from contracts.services.gateway.operations.rpc_make_top_up_operation_pb2 import MakeTopUpOperationRequest
+from contracts.services.gateway.operations.rpc_make_transfer_operation_pb2 import MakeTransferOperationRequest
+from contracts.services.gateway.users.rpc_create_user_pb2 import CreateUserRequest
+from contracts.services.gateway.users.users_gateway_service_pb2_grpc import UsersGatewayServiceStub
+from contracts.services.operations.operation_pb2 import OperationStatus
+from seeds.dumps import (
+    save_seeds_result,
+    save_seeds_stats,
+    load_seeds_journal,
+    open_seeds_journal,
+    commit_seeds_journal,
+    remove_seeds_journal
+)
+from seeds.dag import SeedsNode, compile_seeds_plan, get_seeds_random
+from seeds.limiter import (
+    SeedsAIMDLimiter,
+    SeedsRateLimiter,
+    build_seeds_aimd_limiter,
+    build_seeds_rate_limiter,
+    is_seeds_error_transient
+)
+from seeds.schema.plan import SeedsPlan, SeedUsersPlan
+from seeds.schema.result import SeedsResult, SeedUserResult
+from seeds.schema.stats import SeedsStatsSummary
+from seeds.stats import SeedsStats
+from tools.config.seeds import SeedsDumpFormat, SeedsCompression
+from tools.fakers import fake
+from tools.logger import get_logger
+from tools.routes import APIRoutes
+
+logger = get_logger("ASYNC_SEEDS_BUILDER")
+
+T = TypeVar("T")
+
+
+class AsyncSeedsGatewayGRPCClient:
+    """
+    Асинхронный клиент grpc-gateway, содержащий только вызовы, необходимые для сидинга.
+    Запросы формируются так же, как в gRPC-клиентах из clients/grpc/gateway.
+
+    :param channel: Канал grpc.aio. Один канал мультиплексирует все запросы по HTTP/2.
+    """
+
+    def __init__(self, channel: grpc.aio.Channel):
+        self.channel = channel
+
+        self.users_stub = UsersGatewayServiceStub(channel)
+        self.cards_stub = CardsGatewayServiceStub(channel)
+        self.accounts_stub = AccountsGatewayServiceStub(channel)
+        self.operations_stub = OperationsGatewayServiceStub(channel)
+
+    async def create_user(self):
+        request = CreateUserRequest(
+            email=fake.email(),
+            last_name=fake.last_name(),
+            first_name=fake.first_name(),
+            middle_name=fake.middle_name(),
+            phone_number=fake.phone_number()
+        )
+        return await self.users_stub.CreateUser(request)
+
+    async def open_savings_account(self, user_id: str):
+        return await self.accounts_stub.OpenSavingsAccount(OpenSavingsAccountRequest(user_id=user_id))
+
+    async def open_deposit_account(self, user_id: str):
+        return await self.accounts_stub.OpenDepositAccount(OpenDepositAccountRequest(user_id=user_id))
+
+    async def open_debit_card_account(self, user_id: str):
+        return await self.accounts_stub.OpenDebitCardAccount(OpenDebitCardAccountRequest(user_id=user_id))
+
+    async def open_credit_card_account(self, user_id: str):
+        return await self.accounts_stub.OpenCreditCardAccount(OpenCreditCardAccountRequest(user_id=user_id))
+
+    async def issue_physical_card(self, user_id: str, account_id: str):
+        request = IssuePhysicalCardRequest(user_id=user_id, account_id=account_id)
+        return await self.cards_stub.IssuePhysicalCard(request)
+
+    async def issue_virtual_card(self, user_id: str, account_id: str):
+        request = IssueVirtualCardRequest(user_id=user_id, account_id=account_id)
+        return await self.cards_stub.IssueVirtualCard(request)
+
+    async def make_top_up_operation(self, card_id: str, account_id: str):
+        request = MakeTopUpOperationRequest(
+            card_id=card_id,
+            account_id=account_id,
+            amount=fake.amount(),
+            status=fake.proto_enum(OperationStatus)
+        )
+        return await self.operations_stub.MakeTopUpOperation(request)
+
+    async def make_purchase_operation(self, card_id: str, account_id: str):
+        request = MakePurchaseOperationRequest(
+            card_id=card_id,
+            account_id=account_id,
+            amount=fake.amount(),
+            status=fake.proto_enum(OperationStatus)
+        )
+        return await self.operations_stub.MakePurchaseOperation(request)
+
+    async def make_transfer_operation(self, card_id: str, account_id: str):
+        request = MakeTransferOperationRequest(
+            card_id=card_id,
+            account_id=account_id,
+            amount=fake.amount(),
+            status=fake.proto_enum(OperationStatus)
+        )
+        return await self.operations_stub.MakeTransferOperation(request)
+
+    async def make_cash_withdrawal_operation(self, card_id: str, account_id: str):
+        request = MakeCashWithdrawalOperationRequest(
+            card_id=card_id,
+            account_id=account_id,
+            amount=fake.amount(),
+            status=fake.proto_enum(OperationStatus)
+        )
+        return await self.operations_stub.MakeCashWithdrawalOperation(request)
+
+    async def close(self) -> None:
+        await self.channel.close()
+
+
+class AsyncSeedsGatewayHTTPClient:
+    """
+    Асинхронный клиент http-gateway, содержащий только вызовы, необходимые для сидинга.
+    Использует те же Pydantic-схемы запросов и ответов, что и HTTP-клиенты из clients/http/gateway.
+
+    :param client: Экземпляр httpx.AsyncClient.
+    """
+
+    def __init__(self, client: AsyncClient):
+        self.client = client
+
+    async def post(self, url: str, request) -> Response:
+        response = await self.client.post(url, json=request.model_dump(by_alias=True))
+        return response.raise_for_status()
+
+    async def create_user(self) -> CreateUserResponseSchema:
+        response = await self.post(APIRoutes.USERS, CreateUserRequestSchema())
+        return CreateUserResponseSchema.model_validate_json(response.content)
+
+    async def open_savings_account(self, user_id: str) -> OpenSavingsAccountResponseSchema:
+        request = OpenSavingsAccountRequestSchema(user_id=user_id)
+        response = await self.post(f"{APIRoutes.ACCOUNTS}/open-savings-account", request)
+        return OpenSavingsAccountResponseSchema.model_validate_json(response.content)
+
+    async def open_deposit_account(self, user_id: str) -> OpenDepositAccountResponseSchema:
+        request = OpenDepositAccountRequestSchema(user_id=user_id)
+        response = await self.post(f"{APIRoutes.ACCOUNTS}/open-deposit-account", request)
+        return OpenDepositAccountResponseSchema.model_validate_json(response.content)
+
+    async def open_debit_card_account(self, user_id: str) -> OpenDebitCardAccountResponseSchema:
+        request = OpenDebitCardAccountRequestSchema(user_id=user_id)
+        response = await self.post(f"{APIRoutes.ACCOUNTS}/open-debit-card-account", request)
+        return OpenDebitCardAccountResponseSchema.model_validate_json(response.content)
+
+    async def open_credit_card_account(self, user_id: str) -> OpenCreditCardAccountResponseSchema:
+        request = OpenCreditCardAccountRequestSchema(user_id=user_id)
+        response = await self.post(f"{APIRoutes.ACCOUNTS}/open-credit-card-account", request)
+        return OpenCreditCardAccountResponseSchema.model_validate_json(response.content)
+
+    async def issue_physical_card(self, user_id: str, account_id: str) -> IssuePhysicalCardResponseSchema:
+        request = IssuePhysicalCardRequestSchema(user_id=user_id, account_id=account_id)
+        response = await self.post(f"{APIRoutes.CARDS}/issue-physical-card", request)
+        return IssuePhysicalCardResponseSchema.model_validate_json(response.content)
+
+    async def issue_virtual_card(self, user_id: str, account_id: str) -> IssueVirtualCardResponseSchema:
+        request = IssueVirtualCardRequestSchema(user_id=user_id, account_id=account_id)
+        response = await self.post(f"{APIRoutes.CARDS}/issue-virtual-card", request)
+        return IssueVirtualCardResponseSchema.model_validate_json(response.content)
+
+    async def make_top_up_operation(self, card_id: str, account_id: str) -> MakeTopUpOperationResponseSchema:
+        request = MakeTopUpOperationRequestSchema(card_id=card_id, account_id=account_id)
+        response = await self.post(f"{APIRoutes.OPERATIONS}/make-top-up-operation", request)
+        return MakeTopUpOperationResponseSchema.model_validate_json(response.content)
+
+    async def make_purchase_operation(self, card_id: str, account_id: str) -> MakePurchaseOperationResponseSchema:
+        request = MakePurchaseOperationRequestSchema(card_id=card_id, account_id=account_id)
+        response = await self.post(f"{APIRoutes.OPERATIONS}/make-purchase-operation", request)
+        return MakePurchaseOperationResponseSchema.model_validate_json(response.content)
+
+    async def make_transfer_operation(self, card_id: str, account_id: str) -> MakeTransferOperationResponseSchema:
+        request = MakeTransferOperationRequestSchema(card_id=card_id, account_id=account_id)
+        response = await self.post(f"{APIRoutes.OPERATIONS}/make-transfer-operation", request)
+        return MakeTransferOperationResponseSchema.model_validate_json(response.content)
+
+    async def make_cash_withdrawal_operation(
+            self,
+            card_id: str,
+            account_id: str
+    ) -> MakeCashWithdrawalOperationResponseSchema:
+        request = MakeCashWithdrawalOperationRequestSchema(card_id=card_id, account_id=account_id)
+        response = await self.post(f"{APIRoutes.OPERATIONS}/make-cash-withdrawal-operation", request)
+        return MakeCashWithdrawalOperationResponseSchema.model_validate_json(response.content)
+
+    async def close(self) -> None:
+        await self.client.aclose()
+
+
+class AsyncSeedsBuilder:
+    """
+    AsyncSeedsBuilder — асинхронный аналог SeedsBuilder. Принимает тот же SeedsPlan
+    и возвращает тот же SeedsResult, но выполняет запросы через asyncio, что позволяет
+    держать тысячи запросов "в полёте" из одного процесса.
+
+    Attributes:
+        gateway_client: Асинхронный клиент gateway (gRPC или HTTP)
+        max_concurrency: Максимальное количество одновременно выполняемых запросов
+        rpc_concurrency: Лимиты одновременных запросов для отдельных методов gateway
+        limiter: Адаптивный (AIMD) лимит одновременных запросов в пределах max_concurrency
+        rate_limiter: Жёсткий потолок запросов в секунду
+        retries: Количество повторов запроса, завершившегося ошибкой
+        retry_backoff: Пауза перед первым повтором в секундах, каждый следующий повтор ждёт вдвое дольше
+    """
+
+    def __init__(
+            self,
+            gateway_client: AsyncSeedsGatewayGRPCClient | AsyncSeedsGatewayHTTPClient,
+            max_concurrency: int = 1,
+            rpc_concurrency: dict[str, int] | None = None,
+            limiter: SeedsAIMDLimiter | None = None,
+            rate_limiter: SeedsRateLimiter | None = None,
+            retries: int = 0,
+            retry_backoff: float = 0.5
+    ):
+        self.gateway_client = gateway_client
+
+        self.max_concurrency = max(max_concurrency, 1)
+        self.semaphore = asyncio.Semaphore(self.max_concurrency)
+        self.limiter = limiter
+        # Будит запросы, ожидающие слота адаптивного лимита
+        self.limiter_released = asyncio.Event()
+        self.rate_limiter = rate_limiter
+        self.retries = max(retries, 0)
+        self.retry_backoff = retry_backoff
+        self.rpc_semaphores = {
+            rpc: asyncio.Semaphore(limit) for rpc, limit in (rpc_concurrency or {}).items() if limit > 0
+        }
+        # Статистика последнего запуска build
+        self.stats = SeedsStats()
+
+    async def acquire_limits(self) -> None:
+        """
+        Ждёт слота адаптивного лимита и очередного момента по потолку запросов в секунду.
+        """
+        if self.rate_limiter:
+            await asyncio.sleep(self.rate_limiter.reserve())
+
+        if self.limiter:
+            while not self.limiter.try_acquire():
+                self.limiter_released.clear()
+                await self.limiter_released.wait()
+
+    def cancel_limits(self) -> None:
+        # Слот адаптивного лимита занят, но запрос так и не был отправлен
+        if self.limiter:
+            self.limiter.cancel()
+            self.limiter_released.set()
+
+    def release_limits(self, started: float, latency: float, error: bool) -> None:
+        if self.limiter:
+            self.limiter.release(started, latency, error)
+            self.limiter_released.set()
+
+    async def send(self, method: Callable[..., Awaitable[T]], **kwargs) -> T:
+        """
+        Выполняет одну попытку запроса к gateway с учётом ограничений на количество одновременных
+        запросов и запросов в секунду. Длительность запроса и время ожидания записываются в статистику.
+
+        Args:
+            method: Асинхронный метод клиента (например, gateway_client.create_user)
+            **kwargs: Аргументы метода
+
+        Returns:
+            T: Ответ клиента
+        """
+        started = time.perf_counter()
+        # Момент по потолку RPS и слот адаптивного лимита ожидаются до общего семафора:
+        # запрос, который ждёт своей очереди, не занимает слот max_concurrency
+        await self.acquire_limits()
+        try:
+            await self.semaphore.acquire()
+        except BaseException:
+            self.cancel_limits()
+            raise
+
+        acquired = time.perf_counter()
+        error = True
+        try:
+            result = await method(**kwargs)
+            error = False
+            return result
+        finally:
+            self.semaphore.release()
+            latency = time.perf_counter() - acquired
+            self.stats.record(method.__name__, latency, acquired - started, error=error)
+            self.release_limits(acquired, latency, error)
+
+    async def call(self, method: Callable[..., Awaitable[T]], **kwargs) -> T:
+        """
+        Выполняет запрос к gateway, повторяя его при временной ошибке (is_seeds_error_transient)
+        до retries раз с экспоненциальной паузой. Постоянные ошибки не повторяются.
+
+        Args:
+            method: Асинхронный метод клиента (например, gateway_client.create_user)
+            **kwargs: Аргументы метода
+
+        Returns:
+            T: Ответ клиента
+        """
+        for attempt in range(self.retries):
+            try:
+                return await self.send(method, **kwargs)
+            except Exception as error:
+                if not is_seeds_error_transient(error):
+                    raise
+
+                delay = self.retry_backoff * 2 ** attempt
+                logger.warning(f"{method.__name__} failed ({error!r}), retry {attempt + 1}/{self.retries} in {delay:.1f}s")
+                await asyncio.sleep(delay)
+
+        return await self.send(method, **kwargs)
+
+    async def request(self, node: SeedsNode, context: dict[str, str]):
+        method = getattr(self.gateway_client, node.rpc)
+        semaphore = self.rpc_semaphores.get(node.rpc)
+        if semaphore is None:
+            return await self.call(method, **node.kwargs(context))
+
+        # Семафор метода захватывается до общего, чтобы ожидающий свой лимит вызов не занимал общий слот
+        async with semaphore:
+            return await self.call(method, **node.kwargs(context))
+
+    async def execute(
+            self,
+            node: SeedsNode,
+            context: dict[str, str] | None = None,
+            rng: random.Random | None = None
+    ) -> BaseModel:
+        """
+        Выполняет узел графа сидинга и конкурентно — всё его поддерево.
+        При ошибке в любом дочернем узле остальные отменяются.
+
+        Args:
+            node: Узел графа
+            context: Идентификаторы, полученные родительскими узлами
+            rng: Генератор случайных чисел экземпляра узла для распределений дочерних узлов
+
+        Returns:
+            BaseModel: Модель результата узла
+        """
+        context = node.context(context or {}, await self.request(node, context or {}))
+
+        async with asyncio.TaskGroup() as group:
+            tasks = {
+                child.field: [group.create_task(self.execute(child, context, child_rng)) for child_rng in rngs]
+                for child, rngs in node.sample_children(rng)
+            }
+
+        return node.result(context, {field: [task.result() for task in children] for field, children in tasks.items()})
+
+    async def build_user(self, plan: SeedUsersPlan | SeedsNode, rng: random.Random | None = None) -> SeedUserResult:
+        """
+        Создаёт пользователя со всеми счетами, картами и операциями по графу зависимостей плана.
+
+        Args:
+            plan: План генерации пользователя или уже скомпилированный граф
+            rng: Генератор случайных чисел пользователя для распределений количества карт и операций
+
+        Returns:
+            SeedUserResult: Результат с ID пользователя и всеми созданными сущностями
+        """
+        graph = plan if isinstance(plan, SeedsNode) else compile_seeds_plan(plan)
+        return await self.execute(graph, rng=rng)
+
+    async def build(
+            self,
+            plan: SeedsPlan,
+            completed: list[SeedUserResult] | None = None,
+            on_user_built: Callable[[SeedUserResult], None] | None = None
+    ) -> SeedsResult:
+        """
+        Генерирует полную структуру данных на основе плана.
+
+        Пользователи строятся max_concurrency воркерами, которые по очереди забирают
+        индексы из общего итератора. Так количество одновременно существующих корутин
+        не зависит от размера плана, а порядок пользователей в результате сохраняется.
+
+        Args:
+            plan: Полный план генерации данных
+            completed: Пользователи, уже созданные ранее (например, восстановленные из журнала)
+            on_user_built: Вызывается для каждого полностью созданного пользователя
+
+        Returns:
+            SeedsResult: Результат с данными всех созданных пользователей
+        """
+        completed = completed or []
+        count = max(plan.users.count - len(completed), 0)
+        self.stats = SeedsStats(total=count, report_interval=settings.seeds.stats_report_interval)
+
+        graph = compile_seeds_plan(plan.users)
+
+        users: list[SeedUserResult | None] = [None] * count
+        indexes = iter(range(count))
+
+        async def worker() -> None:
+            for index in indexes:
+                users[index] = await self.build_user(
+                    plan=graph, rng=get_seeds_random(settings.seeds.random_seed, len(completed) + index)
+                )
+                self.stats.user_built()
+                if on_user_built:
+                    on_user_built(users[index])
+
+        async with asyncio.TaskGroup() as group:
+            for _ in range(min(self.max_concurrency, count)):
+                group.create_task(worker())
+
+        if self.limiter:
+            self.limiter.log_stats()
+
+        return SeedsResult(users=completed + users)
+
+    async def close(self) -> None:
+        await self.gateway_client.close()
+
+
+def build_grpc_async_seeds_builder() -> AsyncSeedsBuilder:
+    """
+    Фабрика для создания асинхронного сидера с использованием канала grpc.aio.
+
+    Returns:
+        AsyncSeedsBuilder: Инициализированный сидер с gRPC-клиентом
+    """
+    return AsyncSeedsBuilder(
+        gateway_client=AsyncSeedsGatewayGRPCClient(
+            channel=grpc.aio.insecure_channel(settings.gateway_grpc_client.client_url)
+        ),
+        max_concurrency=settings.seeds.max_concurrency,
+        rpc_concurrency=settings.seeds.rpc_concurrency,
+        limiter=build_seeds_aimd_limiter(),
+        rate_limiter=build_seeds_rate_limiter(),
+        retries=settings.seeds.retries,
+        retry_backoff=settings.seeds.retry_backoff
+    )
+
+
+def build_http_async_seeds_builder() -> AsyncSeedsBuilder:
+    """
+    Фабрика для создания асинхронного сидера с использованием httpx.AsyncClient.
+    Размер пула соединений совпадает с лимитом одновременных запросов.
+
+    Returns:
+        AsyncSeedsBuilder: Инициализированный сидер с HTTP-клиентом
+    """
+    return AsyncSeedsBuilder(
+        gateway_client=AsyncSeedsGatewayHTTPClient(
+            client=AsyncClient(
+                limits=Limits(max_connections=settings.seeds.max_concurrency),
+                timeout=settings.gateway_http_client.timeout,
+                base_url=settings.gateway_http_client.client_url
+            )
+        ),
+        max_concurrency=settings.seeds.max_concurrency,
+        rpc_concurrency=settings.seeds.rpc_concurrency,
+        limiter=build_seeds_aimd_limiter(),
+        rate_limiter=build_seeds_rate_limiter(),
+        retries=settings.seeds.retries,
+        retry_backoff=settings.seeds.retry_backoff
+    )
+
+
+async def build_seeds(
+        plan: SeedsPlan,
+        protocol: str,
+        completed: list[SeedUserResult] | None = None,
+        on_user_built: Callable[[SeedUserResult], None] | None = None
+) -> tuple[SeedsResult, SeedsStatsSummary]:
+    """
+    Выполняет асинхронный сидинг по плану и закрывает соединения клиента.
+
+    :param plan: План сидинга.
+    :param protocol: Протокол gateway: grpc или http.
+    :param completed: Пользователи, уже созданные ранее.
+    :param on_user_built: Вызывается для каждого полностью созданного пользователя.
+    :return: Результат сидинга и его статистика.
+    """
+    builder = build_grpc_async_seeds_builder() if protocol == "grpc" else build_http_async_seeds_builder()
+    try:
+        result = await builder.build(plan, completed=completed, on_user_built=on_user_built)
+        builder.stats.report()
+        return result, builder.stats.summary()
+    finally:
+        await builder.close()
+
+
+if __name__ == '__main__':
+    # План сидинга передаётся в stdin в виде JSON, результат сохраняется в dumps/{scenario}_seeds.{dump_format}
+    parser = argparse.ArgumentParser(description="Асинхронный сидинг по плану из stdin")
+    parser.add_argument("--scenario", required=True)
+    parser.add_argument("--protocol", choices=["grpc", "http"], default="grpc")
+    parser.add_argument("--fingerprint", default="", help="Отпечаток плана для журнала сидинга")
+    parser.add_argument("--dump-format", type=SeedsDumpFormat, default=SeedsDumpFormat.JSON)
+    parser.add_argument("--compression", type=SeedsCompression, default=SeedsCompression.NONE)
+    parser.add_argument(
+        "--stats-name",
+        default=None,
+        help="Имя, под которым сохраняется статистика сидинга (по умолчанию --scenario)"
+    )
+    arguments = parser.parse_args()
+
+    seeds_plan = SeedsPlan.model_validate_json(sys.stdin.read())
+    logger.info(f"[{arguments.scenario}] Starting async seeding via {arguments.protocol}")
+
+    # Продолжаем сидинг с последнего зафиксированного в журнале пользователя
+    journal = load_seeds_journal(scenario=arguments.scenario, fingerprint=arguments.fingerprint)
+    if journal:
+        logger.info(f"[{arguments.scenario}] Resuming seeding from journal: {len(journal)} users already created")
+
+    with open_seeds_journal(
+            scenario=arguments.scenario,
+            fingerprint=arguments.fingerprint,
+            resume=bool(journal)
+    ) as writer:
+        seeds_result, seeds_stats = asyncio.run(
+            build_seeds(
+                plan=seeds_plan,
+                protocol=arguments.protocol,
+                completed=journal,
+                on_user_built=writer.write
+            )
+        )
+
+    if arguments.dump_format == SeedsDumpFormat.JSONL:
+        # Журнал уже в формате JSONL-дампа
+        commit_seeds_journal(scenario=arguments.scenario, compression=arguments.compression)
+    else:
+        save_seeds_result(
+            result=seeds_result,
+            scenario=arguments.scenario,
+            dump_format=arguments.dump_format,
+            compression=arguments.compression
+        )
+        remove_seeds_journal(scenario=arguments.scenario)
+
+    save_seeds_stats(summary=seeds_stats, scenario=arguments.stats_name or arguments.scenario)
+    logger.info(f"[{arguments.scenario}] Async seeding completed: {len(seeds_result.users)} users")
@@ -1,3 +1,12 @@
+import random
+import time
+from typing import Callable, TypeVar
+
+import gevent
+from gevent.event import Event
+from gevent.lock import BoundedSemaphore
+from gevent.pool import Pool
+
 from clients.grpc.gateway.accounts.client import build_accounts_gateway_grpc_client, AccountsGatewayGRPCClient
 from clients.grpc.gateway.cards.client import build_cards_gateway_grpc_client, CardsGatewayGRPCClient
 from clients.grpc.gateway.operations.client import build_operations_gateway_grpc_client, OperationsGatewayGRPCClient
@@ -6,318 +15,244 @@ from clients.http.gateway.accounts.client import build_accounts_gateway_http_cli
 from clients.http.gateway.cards.client import build_cards_gateway_http_client, CardsGatewayHTTPClient
 from clients.http.gateway.operations.client import build_operations_gateway_http_client, OperationsGatewayHTTPClient
 from clients.http.gateway.users.client import build_users_gateway_http_client, UsersGatewayHTTPClient
-from seeds.schema.plan import (
-    SeedsPlan,
-    SeedUsersPlan,
-    SeedAccountsPlan,
-)
-from seeds.schema.result import (
-    SeedsResult,
-    SeedUserResult,
-    SeedCardResult,
-    SeedAccountResult,
-    SeedOperationResult
+from seeds.dag import SEEDS_RPC, SeedsNode, SeedsDAGExecutor, compile_seeds_plan, get_seeds_random
+from seeds.limiter import (
+    SeedsAIMDLimiter,
+    SeedsRateLimiter,
+    build_seeds_aimd_limiter,
+    build_seeds_rate_limiter,
+    is_seeds_error_transient
 )
+from seeds.schema.plan import SeedsPlan, SeedUsersPlan
+from seeds.schema.result import SeedsResult, SeedUserResult
+from seeds.services import SeedsServicesClient, build_seeds_services_client
+from seeds.stats import SeedsStats
+from config import settings
+from tools.logger import get_logger
+
+logger = get_logger("SEEDS_BUILDER")
+
+T = TypeVar("T")
 
 
 class SeedsBuilder:
     """
     SeedsBuilder — генератор (сидер), формирующий необходимые тестовые или демонстрационные данные
-    на основании входного плана. Работает одинаково как с HTTP, так и с gRPC клиентами.
+    на основании входного плана. Работает одинаково как с HTTP, так и с gRPC клиентами,
+    а также с SeedsServicesClient (сидинг напрямую через внутренние сервисы).
 
     Attributes:
         users_gateway_client: Клиент для работы с пользователями (HTTP или gRPC)
         cards_gateway_client: Клиент для выпуска карт
         accounts_gateway_client: Клиент для открытия счетов
         operations_gateway_client: Клиент для операций (топ-ап, покупки и т.д.)
+        max_concurrency: Максимальное количество одновременно выполняемых запросов к gateway.
+            При значении больше 1 независимые пользователи, а также карты и операции
+            в рамках одного счёта создаются параллельно (в greenlet'ах).
+        rpc_concurrency: Лимиты одновременных запросов для отдельных методов gateway
+            (например, {"make_purchase_operation": 5}), действуют вместе с max_concurrency.
+        limiter: Адаптивный (AIMD) лимит одновременных запросов в пределах max_concurrency.
+            Снижается при ошибках и медленных ответах gateway и растёт, пока стенд справляется.
+        rate_limiter: Жёсткий потолок запросов в секунду.
+        retries: Количество повторов запроса, завершившегося ошибкой.
+        retry_backoff: Пауза перед первым повтором в секундах, каждый следующий повтор ждёт вдвое дольше.
     """
 
     def __init__(
             self,
-            users_gateway_client: UsersGatewayGRPCClient | UsersGatewayHTTPClient,
-            cards_gateway_client: CardsGatewayGRPCClient | CardsGatewayHTTPClient,
-            accounts_gateway_client: AccountsGatewayGRPCClient | AccountsGatewayHTTPClient,
-            operations_gateway_client: OperationsGatewayGRPCClient | OperationsGatewayHTTPClient
+            users_gateway_client: UsersGatewayGRPCClient | UsersGatewayHTTPClient | SeedsServicesClient,
+            cards_gateway_client: CardsGatewayGRPCClient | CardsGatewayHTTPClient | SeedsServicesClient,
+            accounts_gateway_client: AccountsGatewayGRPCClient | AccountsGatewayHTTPClient | SeedsServicesClient,
+            operations_gateway_client: OperationsGatewayGRPCClient | OperationsGatewayHTTPClient | SeedsServicesClient,
+            max_concurrency: int = 1,
+            rpc_concurrency: dict[str, int] | None = None,
+            limiter: SeedsAIMDLimiter | None = None,
+            rate_limiter: SeedsRateLimiter | None = None,
+            retries: int = 0,
+            retry_backoff: float = 0.5
     ):
         self.users_gateway_client = users_gateway_client
         self.cards_gateway_client = cards_gateway_client
         self.accounts_gateway_client = accounts_gateway_client
         self.operations_gateway_client = operations_gateway_client
 
-    def build_physical_card_result(self, user_id: str, account_id: str) -> SeedCardResult:
+        self.max_concurrency = max(max_concurrency, 1)
+        # Семафор ограничивает количество запросов, одновременно находящихся "в полёте"
+        self.semaphore = BoundedSemaphore(self.max_concurrency)
+        self.limiter = limiter
+        # Будит запросы, ожидающие слота адаптивного лимита
+        self.limiter_released = Event()
+        self.rate_limiter = rate_limiter
+        self.retries = max(retries, 0)
+        self.retry_backoff = retry_backoff
+        # Статистика последнего запуска build
+        self.stats = SeedsStats()
+        # Исполнитель графа сидинга: общий лимит и статистику обеспечивает self.call
+        self.executor = SeedsDAGExecutor(resolve=self.resolve, call=self.call, rpc_concurrency=rpc_concurrency)
+
+    def acquire_limits(self) -> None:
         """
-        Выпускает физическую карту для заданного пользователя и счёта.
-
-        Args:
-            user_id: Идентификатор пользователя
-            account_id: Идентификатор счёта
-
-        Returns:
-            SeedCardResult: Результат с ID выпущенной карты
+        Ждёт слота адаптивного лимита и очередного момента по потолку запросов в секунду.
         """
-        response = self.cards_gateway_client.issue_physical_card(
-            user_id=user_id,
-            account_id=account_id
-        )
-        return SeedCardResult(card_id=response.card.id)
-
-    def build_virtual_card_result(self, user_id: str, account_id: str) -> SeedCardResult:
+        if self.rate_limiter:
+            gevent.sleep(self.rate_limiter.reserve())
+
+        if self.limiter:
+            while not self.limiter.try_acquire():
+                self.limiter_released.clear()
+                self.limiter_released.wait()
+
+    def cancel_limits(self) -> None:
+        # Слот адаптивного лимита занят, но запрос так и не был отправлен
+        if self.limiter:
+            self.limiter.cancel()
+            self.limiter_released.set()
+
+    def release_limits(self, started: float, latency: float, error: bool) -> None:
+        if self.limiter:
+            self.limiter.release(started, latency, error)
+            self.limiter_released.set()
+
+    def send(self, method: Callable[..., T], **kwargs) -> T:
         """
-        Выпускает виртуальную карту для заданного пользователя и счёта.
+        Выполняет одну попытку запроса к gateway с учётом ограничений на количество одновременных
+        запросов и запросов в секунду. Длительность запроса и время ожидания записываются в статистику.
 
         Args:
-            user_id: Идентификатор пользователя
-            account_id: Идентификатор счёта
+            method: Метод клиента (например, users_gateway_client.create_user)
+            **kwargs: Аргументы метода
 
         Returns:
-            SeedCardResult: Результат с ID выпущенной карты
+            T: Ответ клиента
         """
-        response = self.cards_gateway_client.issue_virtual_card(
-            user_id=user_id,
-            account_id=account_id
-        )
-        return SeedCardResult(card_id=response.card.id)
-
-    def build_top_up_operation_result(self, card_id: str, account_id: str) -> SeedOperationResult:
+        started = time.perf_counter()
+        # Момент по потолку RPS и слот адаптивного лимита ожидаются до общего семафора:
+        # запрос, который ждёт своей очереди, не занимает слот max_concurrency
+        self.acquire_limits()
+        try:
+            self.semaphore.acquire()
+        except BaseException:
+            self.cancel_limits()
+            raise
+
+        acquired = time.perf_counter()
+        error = True
+        try:
+            result = method(**kwargs)
+            error = False
+            return result
+        finally:
+            self.semaphore.release()
+            latency = time.perf_counter() - acquired
+            self.stats.record(method.__name__, latency, acquired - started, error=error)
+            self.release_limits(acquired, latency, error)
+
+    def call(self, method: Callable[..., T], **kwargs) -> T:
         """
-        Выполняет операцию пополнения на карту.
+        Выполняет запрос к gateway, повторяя его при временной ошибке (is_seeds_error_transient)
+        до retries раз с экспоненциальной паузой. Постоянные ошибки не повторяются.
 
         Args:
-            card_id: Идентификатор карты
-            account_id: Идентификатор счёта
+            method: Метод клиента (например, users_gateway_client.create_user)
+            **kwargs: Аргументы метода
 
         Returns:
-            SeedOperationResult: Результат с ID выполненной операции
-        """
-        response = self.operations_gateway_client.make_top_up_operation(
-            card_id=card_id,
-            account_id=account_id
-        )
-        return SeedOperationResult(operation_id=response.operation.id)
-
-    def build_purchase_operation_result(self, card_id: str, account_id: str) -> SeedOperationResult:
+            T: Ответ клиента
         """
-        Выполняет операцию покупки по карте.
+        for attempt in range(self.retries):
+            try:
+                return self.send(method, **kwargs)
+            except Exception as error:
+                if not is_seeds_error_transient(error):
+                    raise
 
-        Args:
-            card_id: Идентификатор карты
-            account_id: Идентификатор счёта
+                delay = self.retry_backoff * 2 ** attempt
+                logger.warning(f"{method.__name__} failed ({error!r}), retry {attempt + 1}/{self.retries} in {delay:.1f}s")
+                gevent.sleep(delay)
 
-        Returns:
-            SeedOperationResult: Результат с ID выполненной операции
-        """
-        response = self.operations_gateway_client.make_purchase_operation(
-            card_id=card_id,
-            account_id=account_id
-        )
-        return SeedOperationResult(operation_id=response.operation.id)
+        return self.send(method, **kwargs)
 
-    def build_transfer_operation_result(self, card_id: str, account_id: str) -> SeedOperationResult:
+    def resolve(self, rpc: str) -> Callable:
         """
-        Выполняет операцию перевода по карте.
+        Возвращает метод клиента gateway по имени вызова из графа сидинга.
 
         Args:
-            card_id: Идентификатор карты
-            account_id: Идентификатор счёта
+            rpc: Имя вызова (например, open_credit_card_account)
 
         Returns:
-            SeedOperationResult: Результат с ID выполненной операции
+            Callable: Метод соответствующего клиента
         """
-        response = self.operations_gateway_client.make_transfer_operation(
-            card_id=card_id,
-            account_id=account_id
-        )
-        return SeedOperationResult(operation_id=response.operation.id)
+        return getattr(getattr(self, SEEDS_RPC[rpc].client), rpc)
 
-    def build_cash_withdrawal_operation_result(self, card_id: str, account_id: str) -> SeedOperationResult:
+    def build_user(self, plan: SeedUsersPlan | SeedsNode, rng: random.Random | None = None) -> SeedUserResult:
         """
-        Выполняет операцию снятия наличных по карте.
+        Создаёт пользователя со всеми счетами, картами и операциями согласно плану.
 
-        Args:
-            card_id: Идентификатор карты
-            account_id: Идентификатор счёта
-
-        Returns:
-            SeedOperationResult: Результат с ID выполненной операции
-        """
-        response = self.operations_gateway_client.make_cash_withdrawal_operation(
-            card_id=card_id,
-            account_id=account_id
-        )
-        return SeedOperationResult(operation_id=response.operation.id)
-
-
-    def build_savings_account_result(self, user_id: str) -> SeedAccountResult:
-        """
-        Открывает сберегательный счёт для пользователя.
+        План компилируется в граф зависимостей (create_user → счета → карты и операции),
+        каждый вызов запускается сразу после того, как выполнен вызов, от которого он зависит.
 
         Args:
-            user_id: Идентификатор пользователя
+            plan: План генерации пользователя или уже скомпилированный граф
+            rng: Генератор случайных чисел пользователя для распределений количества карт и операций
 
         Returns:
-            SeedAccountResult: Результат с ID созданного счёта
-        """
-        response = self.accounts_gateway_client.open_savings_account(user_id=user_id)
-        return SeedAccountResult(account_id=response.account.id)
-
-    def build_deposit_account_result(self, user_id: str) -> SeedAccountResult:
+            SeedUserResult: Результат с ID пользователя и всеми созданными сущностями
         """
-        Открывает депозитный счёт для пользователя.
-
-        Args:
-            user_id: Идентификатор пользователя
+        graph = plan if isinstance(plan, SeedsNode) else compile_seeds_plan(plan)
+        return self.executor.execute(graph, rng=rng)
 
-        Returns:
-            SeedAccountResult: Результат с ID созданного счёта
+    def build(
+            self,
+            plan: SeedsPlan,
+            completed: list[SeedUserResult] | None = None,
+            on_user_built: Callable[[SeedUserResult], None] | None = None
+    ) -> SeedsResult:
         """
-        response = self.accounts_gateway_client.open_deposit_account(user_id=user_id)
-        return SeedAccountResult(account_id=response.account.id)
+        Генерирует полную структуру данных на основе плана:
+        - создаёт указанное количество пользователей
+        - каждому пользователю присваиваются счета, карты и операции
 
-    def build_debit_card_account_result(self, plan: SeedAccountsPlan, user_id: str) -> SeedAccountResult:
-        """
-        Открывает дебетовый счёт для пользователя и при необходимости:
-        - выпускает физические карты
-        - выпускает виртуальные карты
-        - выполняет операции пополнения (top-up)
-        - выполняет операции покупки
-        - выполняет операции перевода
-        - выполняет операции снятия наличных
+        План пользователя компилируется в граф один раз. Пользователи независимы друг от друга,
+        поэтому строятся в пуле greenlet'ов размером max_concurrency.
+        Порядок пользователей в результате совпадает с порядком создания задач.
+        Количества из распределений плана выбираются генератором случайных чисел пользователя,
+        производным от SEEDS.RANDOM_SEED и порядкового номера пользователя.
 
         Args:
-            plan: План создания дебетового счёта (кол-во карт, операций и т.п.)
-            user_id: Идентификатор пользователя
+            plan: Полный план генерации данных
+            completed: Пользователи, уже созданные ранее (например, восстановленные из журнала).
+                Создаётся только недостающее до plan.users.count количество пользователей.
+            on_user_built: Вызывается для каждого полностью созданного пользователя
+                (например, для записи в журнал сидинга)
 
         Returns:
-            SeedAccountResult: Результат с ID счёта и дополнительными действиями (карты, операции)
-        """
-        response = self.accounts_gateway_client.open_debit_card_account(user_id=user_id)
-        card_id = response.account.cards[0].id
-        account_id = response.account.id
-
-        return SeedAccountResult(
-            account_id=response.account.id,
-            physical_cards=[
-                self.build_physical_card_result(user_id=user_id, account_id=response.account.id)
-                for _ in range(plan.physical_cards.count)
-            ],
-            virtual_cards=[
-                self.build_virtual_card_result(user_id=user_id, account_id=account_id)
-                for _ in range(plan.virtual_cards.count)
-            ],
-            top_up_operations=[
-                self.build_top_up_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.top_up_operations.count)
-            ],
-            purchase_operations=[
-                self.build_purchase_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.purchase_operations.count)
-            ],
-            transfer_operations=[
-                self.build_transfer_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.transfer_operations.count)
-            ],
-            cash_withdrawal_operations=[
-                self.build_cash_withdrawal_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.cash_withdrawal_operations.count)
-            ]
-        )
-
-    def build_credit_card_account_result(self, plan: SeedAccountsPlan, user_id: str) -> SeedAccountResult:
+            SeedsResult: Результат с данными всех созданных пользователей
         """
-        Открывает кредитный счёт и выполняет действия согласно плану:
-        - выпускает физические карты
-        - выпускает виртуальные карты
-        - выполняет операции пополнения (top-up)
-        - выполняет операции покупки
-        - выполняет операции перевода
-        - выполняет операции снятия наличных
+        completed = completed or []
+        missing = max(plan.users.count - len(completed), 0)
+        self.stats = SeedsStats(total=missing, report_interval=settings.seeds.stats_report_interval)
+        graph = compile_seeds_plan(plan.users)
 
-        Args:
-            plan: План создания кредитного счёта
-            user_id: Идентификатор пользователя
+        def build_user(index: int) -> SeedUserResult:
+            user = self.build_user(plan=graph, rng=get_seeds_random(settings.seeds.random_seed, len(completed) + index))
+            self.stats.user_built()
+            if on_user_built:
+                on_user_built(user)
 
-        Returns:
-            SeedAccountResult: Результат с ID счёта и деталями операций
-        """
-        response = self.accounts_gateway_client.open_credit_card_account(user_id=user_id)
-        card_id = response.account.cards[0].id
-        account_id = response.account.id
-
-        return SeedAccountResult(
-            account_id=response.account.id,
-            physical_cards=[
-                self.build_physical_card_result(user_id=user_id, account_id=account_id)
-                for _ in range(plan.physical_cards.count)
-            ],
-            virtual_cards=[
-                self.build_virtual_card_result(user_id=user_id, account_id=account_id)
-                for _ in range(plan.virtual_cards.count)
-            ],
-            top_up_operations=[
-                self.build_top_up_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.top_up_operations.count)
-            ],
-            purchase_operations=[
-                self.build_purchase_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.purchase_operations.count)
-            ],
-            transfer_operations=[
-                self.build_transfer_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.transfer_operations.count)
-            ],
-            cash_withdrawal_operations=[
-                self.build_cash_withdrawal_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.cash_withdrawal_operations.count)
-            ]
-        )
-
-    def build_user(self, plan: SeedUsersPlan) -> SeedUserResult:
-        """
-        Создаёт пользователя и согласно переданному плану:
-        - открывает сберегательные и депозитные счета
-        - создаёт дебетовые и кредитные счета с картами и операциями
+            return user
 
-        Args:
-            plan: План генерации пользователя
+        pool = Pool(self.max_concurrency)
+        try:
+            users = pool.map(build_user, range(missing))
+        except BaseException:
+            # Останавливаем остальных пользователей, чтобы они не писали в уже закрытый журнал
+            pool.kill()
+            raise
 
-        Returns:
-            SeedUserResult: Результат с ID пользователя и всеми созданными сущностями
-        """
-        response = self.users_gateway_client.create_user()
-
-        return SeedUserResult(
-            user_id=response.user.id,
-            savings_accounts=[
-                self.build_savings_account_result(user_id=response.user.id)
-                for _ in range(plan.savings_accounts.count)
-            ],
-            deposit_accounts=[
-                self.build_deposit_account_result(user_id=response.user.id)
-                for _ in range(plan.deposit_accounts.count)
-            ],
-            debit_card_accounts=[
-                self.build_debit_card_account_result(plan=plan.debit_card_accounts, user_id=response.user.id)
-                for _ in range(plan.debit_card_accounts.count)
-            ],
-            credit_card_accounts=[
-                self.build_credit_card_account_result(plan=plan.credit_card_accounts, user_id=response.user.id)
-                for _ in range(plan.credit_card_accounts.count)
-            ]
-        )
-
-    def build(self, plan: SeedsPlan) -> SeedsResult:
-        """
-        Генерирует полную структуру данных на основе плана:
-        - создаёт указанное количество пользователей
-        - каждому пользователю присваиваются счета, карты и операции
-
-        Args:
-            plan: Полный план генерации данных
+        if self.limiter:
+            self.limiter.log_stats()
 
-        Returns:
-            SeedsResult: Результат с данными всех созданных пользователей
-        """
-        return SeedsResult(users=[self.build_user(plan=plan.users) for _ in range(plan.users.count)])
+        return SeedsResult(users=completed + users)
 
 
 def build_grpc_seeds_builder() -> SeedsBuilder:
@@ -331,7 +266,13 @@ def build_grpc_seeds_builder() -> SeedsBuilder:
         users_gateway_client=build_users_gateway_grpc_client(),
         cards_gateway_client=build_cards_gateway_grpc_client(),
         accounts_gateway_client=build_accounts_gateway_grpc_client(),
-        operations_gateway_client=build_operations_gateway_grpc_client()
+        operations_gateway_client=build_operations_gateway_grpc_client(),
+        max_concurrency=settings.seeds.max_concurrency,
+        rpc_concurrency=settings.seeds.rpc_concurrency,
+        limiter=build_seeds_aimd_limiter(),
+        rate_limiter=build_seeds_rate_limiter(),
+        retries=settings.seeds.retries,
+        retry_backoff=settings.seeds.retry_backoff
     )
 
 
@@ -346,5 +287,34 @@ def build_http_seeds_builder():
         users_gateway_client=build_users_gateway_http_client(),
         cards_gateway_client=build_cards_gateway_http_client(),
         accounts_gateway_client=build_accounts_gateway_http_client(),
-        operations_gateway_client=build_operations_gateway_http_client()
+        operations_gateway_client=build_operations_gateway_http_client(),
+        max_concurrency=settings.seeds.max_concurrency,
+        rpc_concurrency=settings.seeds.rpc_concurrency,
+        limiter=build_seeds_aimd_limiter(),
+        rate_limiter=build_seeds_rate_limiter(),
+        retries=settings.seeds.retries,
+        retry_backoff=settings.seeds.retry_backoff
+    )
+
+
+def build_services_seeds_builder() -> SeedsBuilder:
+    """
+    Фабрика для создания сидера, который создаёт сущности напрямую во внутренних сервисах,
+    минуя gateway. Один SeedsServicesClient заменяет все четыре gateway-клиента.
+
+    Returns:
+        SeedsBuilder: Инициализированный сидер с клиентом внутренних сервисов
+    """
+    services_client = build_seeds_services_client()
+    return SeedsBuilder(
+        users_gateway_client=services_client,
+        cards_gateway_client=services_client,
+        accounts_gateway_client=services_client,
+        operations_gateway_client=services_client,
+        max_concurrency=settings.seeds.max_concurrency,
+        rpc_concurrency=settings.seeds.rpc_concurrency,
+        limiter=build_seeds_aimd_limiter(),
+        rate_limiter=build_seeds_rate_limiter(),
+        retries=settings.seeds.retries,
+        retry_backoff=settings.seeds.retry_backoff
     )
@@ -0,0 +1,419 @@
+"""
+Граф зависимостей сидинга.
+
+SeedsPlan компилируется в дерево узлов: каждый узел — вызов gateway, дочерние узлы зависят
+от его результата: create_user → open_*_account → {issue_*_card, make_*_operation}.
+Исполнитель запускает каждый узел, как только выполнен родитель, с учётом общего лимита
+конкурентности и лимитов по отдельным методам.
+
+Количество карт и операций может задаваться распределением: оно выбирается для каждого счёта
+генератором случайных чисел этого счёта. Генератор счёта порождается генератором родителя
+до запуска дочерних узлов, поэтому при одном и том же SEEDS.RANDOM_SEED структура каждого
+пользователя не зависит от порядка, в котором конкурентно завершаются вызовы.
+"""
+import random
+from typing import Any, Callable, Iterator, NamedTuple
+
+import gevent
+from gevent.lock import BoundedSemaphore
+from pydantic import BaseModel
+
+from seeds.schema.distribution import SeedsDistribution
+from seeds.schema.estimate import SeedsPlanEstimate
+from seeds.schema.plan import SeedUsersPlan, SeedAccountsPlan
+from seeds.schema.result import SeedUserResult, SeedAccountResult, SeedCardResult, SeedOperationResult
+
+# Длительность вызова gateway по умолчанию (секунды), если нет статистики прошлого сидинга
+DEFAULT_RPC_LATENCY = 0.05
+
+
+class SeedsRPC(NamedTuple):
+    """
+    Описание вызова gateway, используемого в сидинге.
+
+    client: Атрибут билдера с клиентом, у которого есть метод с именем вызова.
+    params: Имена значений контекста (user_id, account_id, card_id), передаваемых в вызов.
+    produces: Извлекает из ответа значения, которые становятся контекстом дочерних узлов.
+    model: Модель результата узла.
+    id_field: Поле модели результата с идентификатором созданной сущности.
+    """
+    client: str
+    params: tuple[str, ...]
+    produces: Callable[[Any], dict[str, str]]
+    model: type[BaseModel]
+    id_field: str
+
+
+def produces_account(response) -> dict[str, str]:
+    return {"account_id": response.account.id}
+
+
+def produces_card_account(response) -> dict[str, str]:
+    # Карточный счёт открывается сразу с картой, по ней выполняются операции
+    return {"account_id": response.account.id, "card_id": response.account.cards[0].id}
+
+
+def produces_card(response) -> dict[str, str]:
+    return {"card_id": response.card.id}
+
+
+def produces_operation(response) -> dict[str, str]:
+    return {"operation_id": response.operation.id}
+
+
+SEEDS_RPC: dict[str, SeedsRPC] = {
+    "create_user": SeedsRPC(
+        "users_gateway_client", (), lambda response: {"user_id": response.user.id}, SeedUserResult, "user_id"
+    ),
+    "open_deposit_account": SeedsRPC(
+        "accounts_gateway_client", ("user_id",), produces_account, SeedAccountResult, "account_id"
+    ),
+    "open_savings_account": SeedsRPC(
+        "accounts_gateway_client", ("user_id",), produces_account, SeedAccountResult, "account_id"
+    ),
+    "open_debit_card_account": SeedsRPC(
+        "accounts_gateway_client", ("user_id",), produces_card_account, SeedAccountResult, "account_id"
+    ),
+    "open_credit_card_account": SeedsRPC(
+        "accounts_gateway_client", ("user_id",), produces_card_account, SeedAccountResult, "account_id"
+    ),
+    "issue_physical_card": SeedsRPC(
+        "cards_gateway_client", ("user_id", "account_id"), produces_card, SeedCardResult, "card_id"
+    ),
+    "issue_virtual_card": SeedsRPC(
+        "cards_gateway_client", ("user_id", "account_id"), produces_card, SeedCardResult, "card_id"
+    ),
+    "make_top_up_operation": SeedsRPC(
+        "operations_gateway_client", ("card_id", "account_id"), produces_operation, SeedOperationResult, "operation_id"
+    ),
+    "make_purchase_operation": SeedsRPC(
+        "operations_gateway_client", ("card_id", "account_id"), produces_operation, SeedOperationResult, "operation_id"
+    ),
+    "make_transfer_operation": SeedsRPC(
+        "operations_gateway_client", ("card_id", "account_id"), produces_operation, SeedOperationResult, "operation_id"
+    ),
+    "make_cash_withdrawal_operation": SeedsRPC(
+        "operations_gateway_client", ("card_id", "account_id"), produces_operation, SeedOperationResult, "operation_id"
+    ),
+}
+
+# Карты и операции карточного счёта: поле плана/результата → вызов gateway
+CARD_ACCOUNT_CHILDREN = {
+    "physical_cards": "issue_physical_card",
+    "virtual_cards": "issue_virtual_card",
+    "top_up_operations": "make_top_up_operation",
+    "purchase_operations": "make_purchase_operation",
+    "transfer_operations": "make_transfer_operation",
+    "cash_withdrawal_operations": "make_cash_withdrawal_operation",
+}
+
+# Счета пользователя: поле плана/результата → вызов gateway и есть ли у счёта карты и операции
+USER_CHILDREN = {
+    "savings_accounts": ("open_savings_account", False),
+    "deposit_accounts": ("open_deposit_account", False),
+    "debit_card_accounts": ("open_debit_card_account", True),
+    "credit_card_accounts": ("open_credit_card_account", True),
+}
+
+
+class SeedsNode:
+    """
+    Узел графа сидинга: вызов gateway, выполняемый count раз для каждого экземпляра родителя.
+
+    :param rpc: Имя вызова из SEEDS_RPC.
+    :param field: Поле результата родителя, в которое попадают результаты узла.
+    :param count: Количество экземпляров узла на один экземпляр родителя.
+    :param children: Узлы, зависящие от результата этого узла.
+    :param distribution: Распределение количества экземпляров на один экземпляр родителя.
+                         Если задано, count не используется.
+    """
+    __slots__ = ("rpc", "field", "count", "children", "distribution")
+
+    def __init__(
+            self,
+            rpc: str,
+            field: str,
+            count: int = 1,
+            children: list["SeedsNode"] | None = None,
+            distribution: SeedsDistribution | None = None
+    ):
+        self.rpc = rpc
+        self.field = field
+        self.count = count
+        self.children = children or []
+        self.distribution = distribution
+
+    @property
+    def mean(self) -> float:
+        """
+        Среднее количество экземпляров узла на один экземпляр родителя.
+        """
+        return self.count if self.distribution is None else self.distribution.mean
+
+    def sample(self, rng: random.Random | None) -> int:
+        """
+        Количество экземпляров узла для одного экземпляра родителя.
+        """
+        if self.distribution is None:
+            return self.count
+
+        return self.distribution.sample(rng or random)
+
+    def sample_children(self, rng: random.Random | None) -> Iterator[tuple["SeedsNode", list[random.Random | None]]]:
+        """
+        Выбирает количество экземпляров каждого дочернего узла и порождает генераторы случайных чисел
+        для экземпляров, у которых есть свои дочерние узлы.
+
+        :param rng: Генератор случайных чисел экземпляра этого узла.
+        :return: Пары (дочерний узел, генераторы его экземпляров); длина списка — количество экземпляров.
+        """
+        for child in self.children:
+            count = child.sample(rng)
+            if rng is None or not child.children:
+                yield child, [None] * count
+            else:
+                yield child, [random.Random(rng.getrandbits(64)) for _ in range(count)]
+
+    @property
+    def spec(self) -> SeedsRPC:
+        return SEEDS_RPC[self.rpc]
+
+    def kwargs(self, context: dict[str, str]) -> dict[str, str]:
+        """
+        Аргументы вызова gateway из контекста родителей.
+        """
+        return {param: context[param] for param in self.spec.params}
+
+    def context(self, context: dict[str, str], response) -> dict[str, str]:
+        """
+        Контекст для дочерних узлов: контекст родителей плюс идентификаторы из ответа.
+        """
+        return {**context, **self.spec.produces(response)}
+
+    def result(self, context: dict[str, str], children: dict[str, list]) -> BaseModel:
+        """
+        Собирает модель результата узла из его идентификатора и результатов дочерних узлов.
+        """
+        return self.spec.model(**{self.spec.id_field: context[self.spec.id_field]}, **children)
+
+
+def compile_card_account(rpc: str, field: str, plan: SeedAccountsPlan) -> SeedsNode:
+    children = [
+        SeedsNode(
+            rpc=child_rpc,
+            field=child_field,
+            count=getattr(plan, child_field).count,
+            distribution=getattr(plan, child_field).distribution
+        )
+        for child_field, child_rpc in CARD_ACCOUNT_CHILDREN.items()
+        if getattr(plan, child_field).count > 0 or getattr(plan, child_field).distribution is not None
+    ]
+    return SeedsNode(rpc=rpc, field=field, count=plan.count, children=children)
+
+
+def get_seeds_random(seed: int | None, index: int) -> random.Random:
+    """
+    Генератор случайных чисел пользователя с порядковым номером index в плане.
+
+    :param seed: SEEDS.RANDOM_SEED. None — невоспроизводимый генератор.
+    :param index: Порядковый номер пользователя, включая созданных ранее (из журнала или общего пула).
+    :return: Генератор, из которого выбираются количества карт и операций пользователя.
+    """
+    return random.Random() if seed is None else random.Random(f"{seed}:{index}")
+
+
+def compile_seeds_plan(plan: SeedUsersPlan) -> SeedsNode:
+    """
+    Компилирует план пользователя в граф вызовов gateway.
+
+    Сберегательные и депозитные счета только открываются: карты и операции
+    создаются лишь для карточных (дебетовых и кредитных) счетов.
+
+    :param plan: План генерации пользователя.
+    :return: Корневой узел create_user.
+    """
+    children = []
+    for field, (rpc, with_cards) in USER_CHILDREN.items():
+        account_plan: SeedAccountsPlan = getattr(plan, field)
+        if account_plan.count <= 0:
+            continue
+
+        if with_cards:
+            children.append(compile_card_account(rpc, field, account_plan))
+        else:
+            children.append(SeedsNode(rpc=rpc, field=field, count=account_plan.count))
+
+    return SeedsNode(rpc="create_user", field="users", children=children)
+
+
+def count_seeds_rpc(
+        node: SeedsNode,
+        multiplier: float = 1,
+        counts: dict[str, float] | None = None
+) -> dict[str, float]:
+    """
+    Считает вызовы gateway в графе с учётом кратности узлов.
+    Для узлов с распределением учитывается среднее количество экземпляров.
+    """
+    counts = {} if counts is None else counts
+    total = multiplier * node.mean
+    counts[node.rpc] = counts.get(node.rpc, 0) + total
+
+    for child in node.children:
+        count_seeds_rpc(child, total, counts)
+
+    return counts
+
+
+# Тип сущности, которую создаёт вызов, по модели результата узла
+SEEDS_ENTITIES = {
+    SeedUserResult: "users",
+    SeedAccountResult: "accounts",
+    SeedCardResult: "cards",
+    SeedOperationResult: "operations",
+}
+
+
+def count_seeds_entities(counts: dict[str, int]) -> dict[str, int]:
+    """
+    Считает создаваемые сущности по количеству вызовов gateway.
+    Карточный счёт открывается сразу с картой, поэтому он создаёт и счёт, и карту.
+    """
+    entities = dict.fromkeys(SEEDS_ENTITIES.values(), 0)
+    for rpc, count in counts.items():
+        spec = SEEDS_RPC[rpc]
+        entities[SEEDS_ENTITIES[spec.model]] += count
+        if spec.produces is produces_card_account:
+            entities["cards"] += count
+
+    return entities
+
+
+def critical_path(node: SeedsNode, latencies: dict[str, float]) -> tuple[int, float]:
+    """
+    Критический путь от узла до самого длинного листа: (количество вызовов, секунды).
+    Дочерние узлы выполняются параллельно, поэтому учитывается только самый долгий из них.
+    """
+    latency = latencies.get(node.rpc, DEFAULT_RPC_LATENCY)
+    paths = [critical_path(child, latencies) for child in node.children]
+    rpcs, seconds = max(paths, key=lambda path: path[1], default=(0, 0.0))
+
+    return rpcs + 1, seconds + latency
+
+
+def estimate_seeds_graph(
+        graph: SeedsNode,
+        users: int,
+        max_concurrency: int = 1,
+        rpc_concurrency: dict[str, int] | None = None,
+        latencies: dict[str, float] | None = None,
+        rps_limit: float | None = None
+) -> SeedsPlanEstimate:
+    """
+    Оценивает граф сидинга: количество вызовов, критический путь и нижнюю границу длительности.
+
+    Нижняя граница — максимум из критического пути одного пользователя, суммарной длительности
+    вызовов, делённой на общий лимит, того же для каждого метода с собственным лимитом
+    и количества вызовов, делённого на потолок запросов в секунду.
+
+    :param graph: Корневой узел графа.
+    :param users: Количество пользователей.
+    :param max_concurrency: Общий лимит одновременных вызовов.
+    :param rpc_concurrency: Лимиты одновременных вызовов по методам.
+    :param latencies: Средние длительности вызовов в секундах из статистики прошлого сидинга.
+    :param rps_limit: Потолок запросов в секунду.
+    :return: Оценка плана.
+    """
+    rpc_concurrency = rpc_concurrency or {}
+    measured = bool(latencies)
+    latencies = latencies or {}
+
+    counts = {rpc: round(count) for rpc, count in count_seeds_rpc(graph, users).items()}
+    path_rpcs, path_seconds = critical_path(graph, latencies)
+
+    work_by_rpc = {rpc: count * latencies.get(rpc, DEFAULT_RPC_LATENCY) for rpc, count in counts.items()}
+    work = sum(work_by_rpc.values())
+
+    bounds = [path_seconds if users else 0.0, work / max(max_concurrency, 1)]
+    bounds.extend(work_by_rpc[rpc] / limit for rpc, limit in rpc_concurrency.items() if rpc in work_by_rpc and limit > 0)
+    if rps_limit:
+        bounds.append(sum(counts.values()) / rps_limit)
+
+    return SeedsPlanEstimate(
+        users=users,
+        rpc_count=sum(counts.values()),
+        rpc=counts,
+        entities=count_seeds_entities(counts),
+        critical_path_rpcs=path_rpcs,
+        critical_path=round(path_seconds, 3),
+        work=round(work, 3),
+        lower_bound=round(max(bounds), 3),
+        measured=measured
+    )
+
+
+class SeedsDAGExecutor:
+    """
+    Исполнитель графа сидинга на greenlet'ах: каждый экземпляр узла запускается отдельным
+    greenlet'ом сразу после завершения родителя.
+
+    Общий лимит конкурентности и статистика обеспечиваются функцией call (SeedsBuilder.call),
+    лимиты по методам — семафорами исполнителя. Семафор метода захватывается до общего,
+    чтобы ожидающий свой лимит вызов не занимал общий слот.
+
+    :param resolve: Возвращает метод клиента по имени вызова.
+    :param call: Выполняет метод клиента с учётом общего лимита.
+    :param rpc_concurrency: Лимиты одновременных вызовов по методам.
+    """
+
+    def __init__(
+            self,
+            resolve: Callable[[str], Callable],
+            call: Callable[..., Any],
+            rpc_concurrency: dict[str, int] | None = None
+    ):
+        self.resolve = resolve
+        self.call = call
+        self.semaphores = {
+            rpc: BoundedSemaphore(limit) for rpc, limit in (rpc_concurrency or {}).items() if limit > 0
+        }
+
+    def request(self, node: SeedsNode, context: dict[str, str]):
+        semaphore = self.semaphores.get(node.rpc)
+        if semaphore is None:
+            return self.call(self.resolve(node.rpc), **node.kwargs(context))
+
+        with semaphore:
+            return self.call(self.resolve(node.rpc), **node.kwargs(context))
+
+    def execute(
+            self,
+            node: SeedsNode,
+            context: dict[str, str] | None = None,
+            rng: random.Random | None = None
+    ) -> BaseModel:
+        """
+        Выполняет узел и всё его поддерево.
+        При ошибке в любом дочернем узле остальные останавливаются, а ошибка пробрасывается.
+
+        :param node: Узел графа.
+        :param context: Идентификаторы, полученные родительскими узлами.
+        :param rng: Генератор случайных чисел экземпляра узла для распределений дочерних узлов.
+        :return: Модель результата узла.
+        """
+        context = node.context(context or {}, self.request(node, context or {}))
+
+        greenlets = {
+            child.field: [gevent.spawn(self.execute, child, context, child_rng) for child_rng in rngs]
+            for child, rngs in node.sample_children(rng)
+        }
+        everything = [greenlet for group in greenlets.values() for greenlet in group]
+        try:
+            gevent.joinall(everything, raise_error=True)
+        except BaseException:
+            gevent.killall(everything)
+            raise
+
+        return node.result(context, {
+            field: [greenlet.value for greenlet in group] for field, group in greenlets.items()
+        })
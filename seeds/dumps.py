@@ -1,45 +1,607 @@
+import gzip
+import json
+import lzma
 import os
+import re
+import shutil
+from typing import IO, Any, Iterator, Sequence, TextIO
 
-from seeds.schema.result import SeedsResult
+from pydantic import ValidationError
+
+from seeds.mapped import SeedsMappedWriter, MappedSeedsResult
+
+from seeds.schema.meta import SeedsMeta
+from seeds.schema.registry import SeedsUsage
+from seeds.schema.result import SeedsResult, SeedUserResult
+from seeds.schema.stats import SeedsStatsSummary
+from tools.config.seeds import SeedsDumpFormat, SeedsCompression
 from tools.logger import get_logger
 
 logger = get_logger("SEEDS_DUMPS")
 
+# Расширения сжатых дампов
+COMPRESSION_SUFFIXES = {SeedsCompression.NONE: "", SeedsCompression.GZIP: ".gz", SeedsCompression.LZMA: ".xz"}
+# Уровень gzip: 6 сжимает почти как 9, но заметно быстрее
+GZIP_LEVEL = 6
+# Размер блока, которым хвост журнала читается при поиске недописанной строки
+JOURNAL_TAIL_BLOCK = 64 * 1024
+# Размер блока (в символах), которым читается JSON-дамп при потоковом разборе
+JSON_READ_BLOCK = 1024 * 1024
+# Пробельные символы между токенами JSON
+JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+def get_seeds_file(
+        scenario: str,
+        dump_format: SeedsDumpFormat = SeedsDumpFormat.JSON,
+        compression: SeedsCompression = SeedsCompression.NONE
+) -> str:
+    """
+    Возвращает путь к файлу дампа сидинга.
+
+    :param scenario: Название сценария нагрузки.
+    :param dump_format: Формат дампа: json (один документ), jsonl (строка на пользователя)
+                        или mmap (бинарный дамп с таблицей смещений).
+    :param compression: Сжатие дампа. Дамп mmap не сжимается.
+    :return: Путь вида ./dumps/{scenario}_seeds.{format}[.gz|.xz].
+    """
+    if dump_format == SeedsDumpFormat.MMAP:
+        compression = SeedsCompression.NONE
+
+    return f"./dumps/{scenario}_seeds.{dump_format}{COMPRESSION_SUFFIXES[compression]}"
+
+
+def open_seeds_file(file: str, mode: str, compression: SeedsCompression = SeedsCompression.NONE) -> IO:
+    """
+    Открывает файл дампа с потоковым сжатием: данные сжимаются при записи и распаковываются
+    при чтении небольшими блоками, несжатое содержимое файла целиком в памяти не собирается.
+
+    :param file: Путь к файлу.
+    :param mode: Режим открытия: r, w или a, с суффиксом b для бинарного режима.
+    :param compression: Сжатие файла.
+    :return: Файловый объект (текстовый, если в mode нет b).
+    """
+    binary = "b" in mode
+    encoding = None if binary else "utf-8"
+
+    if compression == SeedsCompression.GZIP:
+        return gzip.open(file, mode if binary else f"{mode}t", encoding=encoding, compresslevel=GZIP_LEVEL)
+
+    if compression == SeedsCompression.LZMA:
+        return lzma.open(file, mode if binary else f"{mode}t", encoding=encoding)
+
+    return open(file, mode, encoding=encoding)
+
+
+def get_seeds_journal_file(scenario: str) -> str:
+    """
+    Возвращает путь к журналу сидинга.
+
+    :param scenario: Название сценария нагрузки.
+    :return: Путь вида ./dumps/{scenario}_seeds.journal.jsonl.
+    """
+    return f"./dumps/{scenario}_seeds.journal.jsonl"
+
 
-def save_seeds_result(result: SeedsResult, scenario: str):
+class SeedsJSONLWriter:
     """
-    Сохраняет результат сидинга (SeedsResult) в JSON-файл.
+    Потоковый писатель дампа в формате JSONL: первая строка — заголовок с отпечатком плана,
+    далее по одной строке JSON на пользователя. Позволяет билдеру сохранять пользователей
+    по мере создания, не собирая весь результат в одну строку.
+
+    Этот же формат используется для журнала сидинга, поэтому завершённый журнал
+    становится JSONL-дампом простым переименованием файла.
+
+    :param file: Путь к файлу.
+    :param fingerprint: Отпечаток плана сидинга, записывается в заголовок.
+    :param append: Дописывать в существующий файл (заголовок уже записан).
+    :param compression: Сжатие файла. Журнал не сжимается: его строки должны сразу попадать на диск.
+    """
+
+    def __init__(
+            self,
+            file: str,
+            fingerprint: str = "",
+            append: bool = False,
+            compression: SeedsCompression = SeedsCompression.NONE
+    ):
+        if not os.path.exists("dumps"):
+            os.mkdir("dumps")
+
+        self.file = file
+        if compression == SeedsCompression.NONE:
+            # Построчная буферизация: каждая завершённая строка сразу попадает в файл
+            self.stream: TextIO = open(file, 'a' if append else 'w+', encoding="utf-8", buffering=1)
+        else:
+            self.stream: TextIO = open_seeds_file(file, 'a' if append else 'w', compression)
+
+        if not append:
+            self.stream.write(json.dumps({"fingerprint": fingerprint}) + "\n")
+
+    def write(self, user: SeedUserResult) -> None:
+        """
+        Записывает пользователя одной строкой JSON.
+
+        :param user: Созданный пользователь со всеми счетами, картами и операциями.
+        """
+        self.stream.write(user.model_dump_json() + "\n")
+
+    def close(self) -> None:
+        self.stream.close()
+
+    def __enter__(self) -> "SeedsJSONLWriter":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+def iter_seeds_jsonl(
+        file: str,
+        compression: SeedsCompression = SeedsCompression.NONE,
+        journal: bool = False
+) -> Iterator[SeedUserResult]:
+    """
+    Лениво читает пользователей из JSONL-файла: каждый SeedUserResult создаётся только
+    при обращении к нему, весь файл в память не загружается. Заголовок пропускается.
+
+    Недописанной может быть только последняя строка журнала (процесс упал во время записи),
+    она отбрасывается. Завершённый дамп записан полностью, поэтому любая повреждённая строка
+    в нём — ошибка: иначе пул молча получил бы меньше пользователей, чем записано в метаданных.
+
+    :param file: Путь к JSONL-файлу.
+    :param compression: Сжатие файла.
+    :param journal: Файл — журнал сидинга, недописанная последняя строка допустима.
+    :return: Итератор по пользователям.
+    :raises ValueError: В файле есть повреждённая строка (в журнале — не последняя).
+    """
+    with open_seeds_file(file, 'r', compression) as stream:
+        # Первая строка — заголовок с отпечатком плана
+        stream.readline()
+
+        for number, line in enumerate(stream, start=2):
+            try:
+                user = SeedUserResult.model_validate_json(line)
+            except ValidationError as error:
+                if journal and not stream.readline():
+                    logger.debug(f"Seeding journal {file} has a truncated record, dropping it.")
+                    return
+
+                raise ValueError(f"Seeding file {file} has an invalid record at line {number}") from error
+
+            yield user
+
+
+class SeedsJSONReader:
+    """
+    Потоковый разбор JSON-дампа {"users": [...]}: документ читается (и распаковывается) блоками
+    по JSON_READ_BLOCK символов, а пользователи разбираются по одному. В памяти одновременно
+    находятся только текущий блок и разбираемый пользователь, а не весь текст дампа.
+
+    :param file: Путь к файлу (для сообщений об ошибках).
+    :param stream: Текстовый поток дампа.
+    """
+
+    def __init__(self, file: str, stream: TextIO):
+        self.file = file
+        self.stream = stream
+        self.decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.position = 0
+
+    def fill(self) -> bool:
+        """
+        Дочитывает следующий блок, отбрасывая уже разобранную часть буфера.
+
+        :return: False, если файл закончился.
+        """
+        block = self.stream.read(JSON_READ_BLOCK)
+        self.buffer = self.buffer[self.position:] + block
+        self.position = 0
+        return bool(block)
+
+    def peek(self) -> str:
+        """
+        Пропускает пробелы и возвращает следующий символ, не разбирая его.
+
+        :return: Следующий символ или пустая строка в конце файла.
+        """
+        while True:
+            self.position = JSON_WHITESPACE.match(self.buffer, self.position).end()
+            if self.position < len(self.buffer):
+                return self.buffer[self.position]
+            if not self.fill():
+                return ""
+
+    def expect(self, token: str) -> None:
+        if self.peek() != token:
+            raise ValueError(f"Seeding file {self.file} is not a seeds JSON dump: expected {token!r}")
+        self.position += 1
+
+    def read_value(self) -> Any:
+        """
+        Разбирает следующее значение JSON, дочитывая блоки, пока значение не будет получено целиком.
+
+        :return: Разобранное значение.
+        :raises ValueError: Файл закончился посередине значения или значение повреждено.
+        """
+        self.peek()
+        while True:
+            try:
+                value, self.position = self.decoder.raw_decode(self.buffer, self.position)
+                return value
+            except json.JSONDecodeError as error:
+                if not self.fill():
+                    raise ValueError(f"Seeding file {self.file} has an invalid or truncated record") from error
+
+    def __iter__(self) -> Iterator[SeedUserResult]:
+        self.expect("{")
+        if self.read_value() != "users":
+            raise ValueError(f"Seeding file {self.file} is not a seeds JSON dump: expected 'users'")
+        self.expect(":")
+        self.expect("[")
+
+        if self.peek() != "]":
+            while True:
+                yield SeedUserResult.model_validate(self.read_value())
+                if self.peek() == "]":
+                    break
+                self.expect(",")
+
+        self.expect("]")
+        self.expect("}")
+
+
+def iter_seeds_json(file: str, compression: SeedsCompression = SeedsCompression.NONE) -> Iterator[SeedUserResult]:
+    """
+    Лениво читает пользователей из JSON-дампа потоковым разбором (SeedsJSONReader):
+    ни сжатый, ни обычный дамп не распаковывается и не читается в память целиком.
+
+    :param file: Путь к JSON-файлу.
+    :param compression: Сжатие файла.
+    :return: Итератор по пользователям.
+    :raises ValueError: Файл не является JSON-дампом сидинга или оборван.
+    """
+    with open_seeds_file(file, 'r', compression) as stream:
+        yield from SeedsJSONReader(file, stream)
+
+
+def read_seeds_jsonl_fingerprint(file: str) -> str | None:
+    """
+    Читает отпечаток плана из заголовка JSONL-файла.
+
+    :param file: Путь к JSONL-файлу.
+    :return: Отпечаток или None, если заголовок повреждён.
+    """
+    with open(file, 'r', encoding="utf-8") as stream:
+        try:
+            return json.loads(stream.readline()).get("fingerprint")
+        except json.JSONDecodeError:
+            return None
+
+
+def save_seeds_result(
+        result: SeedsResult,
+        scenario: str,
+        dump_format: SeedsDumpFormat = SeedsDumpFormat.JSON,
+        fingerprint: str = "",
+        compression: SeedsCompression = SeedsCompression.NONE
+):
+    """
+    Сохраняет результат сидинга (SeedsResult) в файл. Пользователи записываются по одному,
+    поэтому JSON всего результата не собирается в памяти ни для сжатого, ни для обычного дампа.
 
     :param result: Результат сидинга, сгенерированный билдером.
     :param scenario: Название сценария нагрузки, для которого создаются данные.
                      Используется для генерации имени файла (например, "credit_card_test").
+    :param dump_format: Формат дампа (json, jsonl или mmap).
+    :param fingerprint: Отпечаток плана, записывается в заголовок JSONL-дампа.
+    :param compression: Сжатие дампа json или jsonl.
     """
     # Убедимся, что папка dumps существует
     if not os.path.exists("dumps"):
         os.mkdir("dumps")
 
-    seed_file = f"./dumps/{scenario}_seeds.json"
+    seed_file = get_seeds_file(scenario, dump_format, compression)
 
-    # Сохраняем результат сидинга в файл с именем {scenario}_seeds.json
-    with open(seed_file, 'w+', encoding="utf-8") as file:
-        file.write(result.model_dump_json())
+    if dump_format == SeedsDumpFormat.JSONL:
+        # Пишем построчно, не формируя в памяти JSON всего результата
+        with SeedsJSONLWriter(seed_file, fingerprint=fingerprint, compression=compression) as writer:
+            for user in result.users:
+                writer.write(user)
+    elif dump_format == SeedsDumpFormat.MMAP:
+        with SeedsMappedWriter(seed_file) as writer:
+            for user in result.users:
+                writer.write(user)
+    else:
+        # Сохраняем результат сидинга в файл с именем {scenario}_seeds.json[.gz|.xz]
+        # тем же документом, что и SeedsResult.model_dump_json(), но по одному пользователю
+        with open_seeds_file(seed_file, 'w', compression) as file:
+            file.write('{"users":[')
+            for index, user in enumerate(result.users):
+                file.write(f",{user.model_dump_json()}" if index else user.model_dump_json())
+            file.write(']}')
 
-    logger.debug(f"Seeding result saved to file: {seed_file}.")
+    logger.debug(f"Seeding result saved to file: {seed_file} ({os.path.getsize(seed_file) / 2 ** 20:.1f} MiB).")
 
 
-def load_seeds_result(scenario: str) -> SeedsResult:
+def load_seeds_result(
+        scenario: str,
+        dump_format: SeedsDumpFormat = SeedsDumpFormat.JSON,
+        compression: SeedsCompression = SeedsCompression.NONE
+) -> SeedsResult:
     """
-    Загружает результат сидинга из JSON-файла.
+    Загружает результат сидинга из файла. Сжатые дампы распаковываются и разбираются потоково,
+    по одному пользователю: распакованный текст дампа целиком в памяти не собирается.
+    Несжатый JSON-дамп валидируется из байтов файла целиком — так быстрее, чем потоковый разбор.
 
     :param scenario: Название сценария нагрузки, данные которого нужно загрузить.
+    :param dump_format: Формат дампа (json, jsonl или mmap).
+    :param compression: Сжатие дампа json или jsonl.
     :return: Объект SeedsResult, восстановленный из файла.
     """
-    seed_file = f"./dumps/{scenario}_seeds.json"
+    seed_file = get_seeds_file(scenario, dump_format, compression)
 
-    # Открываем файл и валидируем его как объект SeedsResult
-    with open(seed_file, 'r', encoding="utf-8") as file:
-        seed_result = SeedsResult.model_validate_json(file.read())
+    if dump_format == SeedsDumpFormat.JSONL:
+        seed_result = SeedsResult(users=list(iter_seeds_jsonl(seed_file, compression)))
+    elif dump_format == SeedsDumpFormat.MMAP:
+        seed_result = SeedsResult(users=list(load_seeds_mapped(scenario)))
+    elif compression != SeedsCompression.NONE:
+        seed_result = SeedsResult(users=list(iter_seeds_json(seed_file, compression)))
+    else:
+        # Открываем файл и валидируем его как объект SeedsResult (байты без декодирования в str)
+        with open(seed_file, 'rb') as file:
+            seed_result = SeedsResult.model_validate_json(file.read())
 
     logger.debug(f"Seeding result loaded from file: {seed_file}.")
 
     return seed_result
+
+
+def iter_seeds_result(
+        scenario: str,
+        dump_format: SeedsDumpFormat = SeedsDumpFormat.JSONL,
+        compression: SeedsCompression = SeedsCompression.NONE
+) -> Iterator[SeedUserResult]:
+    """
+    Лениво итерирует пользователей из JSONL- или JSON-дампа сценария.
+
+    :param scenario: Название сценария нагрузки.
+    :param dump_format: Формат дампа (json или jsonl).
+    :param compression: Сжатие дампа.
+    :return: Итератор по пользователям дампа.
+    """
+    seed_file = get_seeds_file(scenario, dump_format, compression)
+    if dump_format == SeedsDumpFormat.JSON:
+        return iter_seeds_json(seed_file, compression)
+
+    return iter_seeds_jsonl(seed_file, compression)
+
+
+def load_seeds_mapped(scenario: str, indexes: Sequence[int] | None = None) -> MappedSeedsResult:
+    """
+    Отображает бинарный дамп сценария в память. Пользователи не читаются с диска,
+    пока к ним не обратятся.
+
+    :param scenario: Название сценария нагрузки.
+    :param indexes: Позиции пользователей дампа, которые войдут в результат. None — все.
+    :return: Объект MappedSeedsResult.
+    """
+    seed_file = get_seeds_file(scenario, SeedsDumpFormat.MMAP)
+    seed_result = MappedSeedsResult(seed_file, indexes=indexes)
+
+    logger.debug(f"Seeding result mapped from file: {seed_file}, users: {len(seed_result)}.")
+
+    return seed_result
+
+
+def save_seeds_meta(meta: SeedsMeta, scenario: str):
+    """
+    Сохраняет метаданные дампа (отпечаток плана и время создания) рядом с файлом сидинга.
+
+    :param meta: Метаданные дампа.
+    :param scenario: Название сценария нагрузки.
+    """
+    if not os.path.exists("dumps"):
+        os.mkdir("dumps")
+
+    meta_file = f"./dumps/{scenario}_seeds.meta.json"
+
+    with open(meta_file, 'w+', encoding="utf-8") as file:
+        file.write(meta.model_dump_json())
+
+    logger.debug(f"Seeding meta saved to file: {meta_file}.")
+
+
+def load_seeds_meta(
+        scenario: str,
+        dump_format: SeedsDumpFormat = SeedsDumpFormat.JSON,
+        compression: SeedsCompression = SeedsCompression.NONE
+) -> SeedsMeta | None:
+    """
+    Загружает метаданные дампа сидинга.
+
+    :param scenario: Название сценария нагрузки.
+    :param dump_format: Формат дампа, наличие которого нужно проверить.
+    :param compression: Сжатие дампа, наличие которого нужно проверить.
+    :return: Объект SeedsMeta или None, если дампа или его метаданных нет.
+    """
+    seed_file = get_seeds_file(scenario, dump_format, compression)
+    meta_file = f"./dumps/{scenario}_seeds.meta.json"
+
+    # Метаданные без самого дампа бесполезны
+    if not (os.path.exists(seed_file) and os.path.exists(meta_file)):
+        return None
+
+    with open(meta_file, 'r', encoding="utf-8") as file:
+        return SeedsMeta.model_validate_json(file.read())
+
+
+def save_seeds_stats(summary: SeedsStatsSummary, scenario: str):
+    """
+    Сохраняет статистику сидинга (скорость, количество сущностей, длительности вызовов gateway)
+    рядом с файлом сидинга.
+
+    :param summary: Итоговая статистика сидинга.
+    :param scenario: Название сценария нагрузки.
+    """
+    if not os.path.exists("dumps"):
+        os.mkdir("dumps")
+
+    stats_file = f"./dumps/{scenario}_seeds.stats.json"
+
+    with open(stats_file, 'w+', encoding="utf-8") as file:
+        file.write(summary.model_dump_json(indent=2))
+
+    logger.debug(f"Seeding stats saved to file: {stats_file}.")
+
+
+def load_seeds_stats(scenario: str) -> SeedsStatsSummary | None:
+    """
+    Загружает статистику прошлого сидинга сценария.
+
+    :param scenario: Название сценария нагрузки.
+    :return: Объект SeedsStatsSummary или None, если сидинг ещё не выполнялся.
+    """
+    stats_file = f"./dumps/{scenario}_seeds.stats.json"
+    if not os.path.exists(stats_file):
+        return None
+
+    with open(stats_file, 'r', encoding="utf-8") as file:
+        return SeedsStatsSummary.model_validate_json(file.read())
+
+
+def save_seeds_usage(usage: SeedsUsage, scenario: str):
+    """
+    Сохраняет счётчики использования пользователей общего пула сидинга.
+
+    :param usage: Счётчики использования.
+    :param scenario: Имя пула.
+    """
+    if not os.path.exists("dumps"):
+        os.mkdir("dumps")
+
+    usage_file = f"./dumps/{scenario}_seeds.usage.json"
+
+    with open(usage_file, 'w+', encoding="utf-8") as file:
+        file.write(usage.model_dump_json())
+
+    logger.debug(f"Seeding usage saved to file: {usage_file}.")
+
+
+def load_seeds_usage(scenario: str) -> SeedsUsage:
+    """
+    Загружает счётчики использования пользователей общего пула сидинга.
+
+    :param scenario: Имя пула.
+    :return: Объект SeedsUsage (пустой, если пул ещё не использовался).
+    """
+    usage_file = f"./dumps/{scenario}_seeds.usage.json"
+    if not os.path.exists(usage_file):
+        return SeedsUsage()
+
+    with open(usage_file, 'r', encoding="utf-8") as file:
+        return SeedsUsage.model_validate_json(file.read())
+
+
+def open_seeds_journal(scenario: str, fingerprint: str, resume: bool = False) -> SeedsJSONLWriter:
+    """
+    Открывает журнал сидинга на запись. Журнал — это JSONL-файл, в который каждый полностью
+    созданный пользователь дописывается сразу после создания (append-only).
+
+    :param scenario: Название сценария нагрузки.
+    :param fingerprint: Отпечаток плана сидинга, записывается в заголовок журнала,
+                        чтобы не продолжить сидинг по журналу другого плана.
+    :param resume: Продолжить существующий журнал вместо создания нового. Недописанная последняя
+                   строка (процесс упал во время записи) перед продолжением удаляется из файла.
+    :return: Писатель журнала.
+    """
+    journal_file = get_seeds_journal_file(scenario)
+    if resume:
+        truncate_seeds_journal(journal_file)
+
+    return SeedsJSONLWriter(journal_file, fingerprint=fingerprint, append=resume)
+
+
+def truncate_seeds_journal(file: str) -> None:
+    """
+    Обрезает журнал до конца последней завершённой строки. Строка пользователя записывается
+    вместе с переводом строки, поэтому всё после последнего перевода строки — недописанная запись.
+    Файл читается блоками с конца, целиком в память не загружается.
+
+    :param file: Путь к журналу.
+    """
+    with open(file, 'rb+') as stream:
+        end = stream.seek(0, os.SEEK_END)
+        position = end
+        while position > 0:
+            start = max(position - JOURNAL_TAIL_BLOCK, 0)
+            stream.seek(start)
+            newline = stream.read(position - start).rfind(b"\n")
+            if newline != -1:
+                position = start + newline + 1
+                break
+            position = start
+
+        if position != end:
+            stream.truncate(position)
+            logger.debug(f"Seeding journal {file} has a truncated record, removed {end - position} bytes.")
+
+
+def load_seeds_journal(scenario: str, fingerprint: str) -> list[SeedUserResult]:
+    """
+    Загружает пользователей, зафиксированных в журнале сидинга.
+
+    Если журнала нет или он записан для другого плана, возвращается пустой список.
+
+    :param scenario: Название сценария нагрузки.
+    :param fingerprint: Отпечаток текущего плана сидинга.
+    :return: Список пользователей, созданных до остановки сидинга.
+    """
+    journal_file = get_seeds_journal_file(scenario)
+
+    if not os.path.exists(journal_file):
+        return []
+
+    if read_seeds_jsonl_fingerprint(journal_file) != fingerprint:
+        logger.debug(f"Seeding journal {journal_file} was written for another plan, ignoring it.")
+        return []
+
+    users = list(iter_seeds_jsonl(journal_file, journal=True))
+    logger.debug(f"Seeding journal loaded from file: {journal_file}, users: {len(users)}.")
+
+    return users
+
+
+def commit_seeds_journal(scenario: str, compression: SeedsCompression = SeedsCompression.NONE):
+    """
+    Превращает завершённый журнал сидинга в JSONL-дамп переименованием файла:
+    формат журнала и JSONL-дампа совпадает, поэтому повторная запись не нужна.
+    Для сжатого дампа журнал потоково сжимается в файл дампа и удаляется.
+
+    :param scenario: Название сценария нагрузки.
+    :param compression: Сжатие дампа.
+    """
+    journal_file = get_seeds_journal_file(scenario)
+    seed_file = get_seeds_file(scenario, SeedsDumpFormat.JSONL, compression)
+
+    if compression == SeedsCompression.NONE:
+        os.replace(journal_file, seed_file)
+    else:
+        with open(journal_file, 'rb') as source, open_seeds_file(seed_file, 'wb', compression) as target:
+            shutil.copyfileobj(source, target)
+        os.remove(journal_file)
+
+    logger.debug(f"Seeding journal committed to file: {seed_file}.")
+
+
+def remove_seeds_journal(scenario: str):
+    """
+    Удаляет журнал сидинга после того, как итоговый результат сохранён.
+
+    :param scenario: Название сценария нагрузки.
+    """
+    journal_file = get_seeds_journal_file(scenario)
+
+    if os.path.exists(journal_file):
+        os.remove(journal_file)
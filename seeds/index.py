@@ -0,0 +1,238 @@
+import random
+from typing import Iterable
+
+from seeds.schema.result import SeedUserResult
+from seeds.store import ACCOUNT_KINDS, CARD_KINDS, OPERATION_KINDS
+
+
+class SeedsIndex:
+    """
+    Плоские индексы сид-данных для выборки за O(1) внутри задач Locust:
+    счета по типу, карты по счёту, операции по типу и владелец счёта.
+
+    Индексы строятся один раз при загрузке (или пополнении) пула, поэтому задачам не нужно
+    обходить дерево пользователей. Выборки с условием (например, дебетовый счёт с не менее чем
+    5 покупками) вычисляются при первом запросе и кешируются до следующего add_user.
+
+    Пользователи передаются как модели SeedUserResult или представления CompactSeedsResult:
+    у них одинаковые атрибуты.
+
+    Выборки random_* идут по всему пулу и не учитывают аренды SeedsPool.acquire: они подходят
+    только для запросов, которым не важен владелец данных. Задачи арендованного пользователя
+    выбирают его счета, карты и операции через представление view (SeedsLease.index_view).
+    """
+
+    def __init__(self):
+        # Тип счёта (debit_card_accounts и т.д.) → идентификаторы счетов
+        self.accounts: dict[str, list[str]] = {kind: [] for kind in ACCOUNT_KINDS}
+        # Счёт → владелец
+        self.account_users: dict[str, str] = {}
+        # Все карты и карты каждого счёта
+        self.cards: list[str] = []
+        self.account_cards: dict[str, list[str]] = {}
+        # Тип операции (purchase_operations и т.д.) → идентификаторы операций
+        self.operations: dict[str, list[str]] = {kind: [] for kind in OPERATION_KINDS}
+        # Счёт → количество операций каждого типа в порядке OPERATION_KINDS
+        self.account_operation_counts: dict[str, tuple[int, ...]] = {}
+        # Кеш выборок счетов с условием: (тип счёта, тип операции, минимум операций) → счета
+        self.queries: dict[tuple[str, str | None, int], list[str]] = {}
+        # Позиция пользователя в пуле → начала его отрезков в плоских списках (порядок flat_lists).
+        # Пользователи добавляются по порядку, поэтому данные каждого лежат в списках подряд
+        self.user_offsets: list[tuple[int, ...]] = []
+
+    def flat_lists(self) -> list[list[str]]:
+        """
+        Плоские списки в порядке user_offsets: счета по типам, карты, операции по типам.
+        """
+        return [
+            *(self.accounts[kind] for kind in ACCOUNT_KINDS),
+            self.cards,
+            *(self.operations[kind] for kind in OPERATION_KINDS)
+        ]
+
+    def add_user(self, user: SeedUserResult) -> None:
+        """
+        Добавляет пользователя в индексы.
+
+        :param user: Пользователь со счетами, картами и операциями.
+        """
+        self.queries.clear()
+        self.user_offsets.append(tuple(len(items) for items in self.flat_lists()))
+
+        for account_kind in ACCOUNT_KINDS:
+            for account in getattr(user, account_kind):
+                account_id = account.account_id
+                self.accounts[account_kind].append(account_id)
+                self.account_users[account_id] = user.user_id
+
+                cards = [card.card_id for card_kind in CARD_KINDS for card in getattr(account, card_kind)]
+                self.account_cards[account_id] = cards
+                self.cards.extend(cards)
+
+                counts = []
+                for operation_kind in OPERATION_KINDS:
+                    operations = getattr(account, operation_kind)
+                    self.operations[operation_kind].extend(operation.operation_id for operation in operations)
+                    counts.append(len(operations))
+                self.account_operation_counts[account_id] = tuple(counts)
+
+    @classmethod
+    def from_users(cls, users: Iterable[SeedUserResult]) -> "SeedsIndex":
+        """
+        Строит индексы по пользователям из SeedsResult или CompactSeedsResult.
+
+        :param users: Итерируемый источник пользователей.
+        :return: Заполненные индексы.
+        """
+        index = cls()
+        for user in users:
+            index.add_user(user)
+
+        return index
+
+    def get_user_slice(self, position: int, list_position: int) -> slice:
+        """
+        Отрезок пользователя в плоском списке.
+
+        :param position: Позиция пользователя в пуле (порядок add_user).
+        :param list_position: Номер списка в порядке flat_lists.
+        :return: Границы данных пользователя.
+        """
+        start = self.user_offsets[position][list_position]
+        if position + 1 < len(self.user_offsets):
+            return slice(start, self.user_offsets[position + 1][list_position])
+
+        return slice(start, len(self.flat_lists()[list_position]))
+
+    def view(self, position: int) -> "SeedsUserIndex":
+        """
+        Представление индексов, ограниченное одним пользователем пула.
+
+        :param position: Позиция пользователя в пуле (SeedsLease.index).
+        :raises IndexError: Пользователя с такой позицией в индексах нет.
+        """
+        if not 0 <= position < len(self.user_offsets):
+            raise IndexError(f"Seeds index has no user at position {position}")
+
+        return SeedsUserIndex(index=self, position=position)
+
+    def find_accounts(self, kind: str, operation: str | None = None, min_operations: int = 0) -> list[str]:
+        """
+        Возвращает счета типа kind, у которых не меньше min_operations операций типа operation.
+        Результат кешируется.
+
+        :param kind: Тип счёта, например debit_card_accounts.
+        :param operation: Тип операции, например purchase_operations. None — без условия.
+        :param min_operations: Минимальное количество операций.
+        :return: Идентификаторы подходящих счетов.
+        """
+        if operation is None:
+            return self.accounts[kind]
+
+        key = (kind, operation, min_operations)
+        if key not in self.queries:
+            position = OPERATION_KINDS.index(operation)
+            self.queries[key] = [
+                account_id for account_id in self.accounts[kind]
+                if self.account_operation_counts[account_id][position] >= min_operations
+            ]
+
+        return self.queries[key]
+
+    def random_account(self, kind: str, operation: str | None = None, min_operations: int = 0) -> str:
+        """
+        Случайный счёт типа kind, при необходимости с условием на количество операций.
+
+        :raises IndexError: Подходящих счетов нет.
+        """
+        return random.choice(self.find_accounts(kind, operation, min_operations))
+
+    def random_card(self, account_id: str | None = None) -> str:
+        """
+        Случайная карта: любая или карта указанного счёта.
+
+        :raises IndexError: Подходящих карт нет.
+        """
+        return random.choice(self.cards if account_id is None else self.account_cards[account_id])
+
+    def random_operation(self, kind: str) -> str:
+        """
+        Случайная операция типа kind, например purchase_operations.
+
+        :raises IndexError: Операций этого типа нет.
+        """
+        return random.choice(self.operations[kind])
+
+    def get_account_user(self, account_id: str) -> str:
+        """
+        Владелец счёта.
+        """
+        return self.account_users[account_id]
+
+
+class SeedsUserIndex:
+    """
+    Индексы одного сид-пользователя: выборки возвращают только его счета, карты и операции.
+    Так задачи Locust не выходят за пределы арендованного пользователя (SeedsPool.acquire).
+
+    У пользователя единицы счетов, поэтому выборки с условием вычисляются без кеша.
+
+    :param index: Индексы пула.
+    :param position: Позиция пользователя в пуле.
+    """
+    __slots__ = ("index", "position")
+
+    def __init__(self, index: SeedsIndex, position: int):
+        self.index = index
+        self.position = position
+
+    def get_accounts(self, kind: str) -> list[str]:
+        list_position = ACCOUNT_KINDS.index(kind)
+        return self.index.accounts[kind][self.index.get_user_slice(self.position, list_position)]
+
+    def find_accounts(self, kind: str, operation: str | None = None, min_operations: int = 0) -> list[str]:
+        """
+        Счета пользователя типа kind, у которых не меньше min_operations операций типа operation.
+        """
+        accounts = self.get_accounts(kind)
+        if operation is None:
+            return accounts
+
+        position = OPERATION_KINDS.index(operation)
+        return [
+            account_id for account_id in accounts
+            if self.index.account_operation_counts[account_id][position] >= min_operations
+        ]
+
+    def random_account(self, kind: str, operation: str | None = None, min_operations: int = 0) -> str:
+        """
+        Случайный счёт пользователя типа kind, при необходимости с условием на количество операций.
+
+        :raises IndexError: Подходящих счетов у пользователя нет.
+        """
+        return random.choice(self.find_accounts(kind, operation, min_operations))
+
+    def random_card(self, account_id: str | None = None) -> str:
+        """
+        Случайная карта пользователя: любая или карта указанного счёта.
+
+        :raises IndexError: Подходящих карт нет.
+        :raises KeyError: Счёт account_id принадлежит другому пользователю.
+        """
+        if account_id is None:
+            cards = self.index.cards[self.index.get_user_slice(self.position, len(ACCOUNT_KINDS))]
+            return random.choice(cards)
+
+        if not any(account_id in self.get_accounts(kind) for kind in ACCOUNT_KINDS):
+            raise KeyError(f"Account {account_id} does not belong to the leased seeds user")
+
+        return random.choice(self.index.account_cards[account_id])
+
+    def random_operation(self, kind: str) -> str:
+        """
+        Случайная операция пользователя типа kind, например purchase_operations.
+
+        :raises IndexError: Операций этого типа у пользователя нет.
+        """
+        list_position = len(ACCOUNT_KINDS) + 1 + OPERATION_KINDS.index(kind)
+        return random.choice(self.index.operations[kind][self.index.get_user_slice(self.position, list_position)])
@@ -0,0 +1,171 @@
+"""
+Управление темпом сидинга.
+
+Ограничители не зависят от движка: они только считают, можно ли выполнить запрос сейчас
+и сколько нужно подождать. Ожидание реализует билдер — через gevent или asyncio.
+Там же билдер решает, можно ли повторить запрос (is_seeds_error_transient).
+"""
+import time
+
+import grpc
+from httpx import HTTPStatusError, TransportError
+
+from config import settings
+from tools.logger import get_logger
+
+logger = get_logger("SEEDS_LIMITER")
+
+# Статусы gRPC, при которых запрос можно повторить: стенд недоступен, перегружен или не успел ответить.
+# Ошибки соединения клиент gRPC возвращает как UNAVAILABLE
+TRANSIENT_GRPC_CODES = frozenset({
+    grpc.StatusCode.UNAVAILABLE,
+    grpc.StatusCode.DEADLINE_EXCEEDED,
+    grpc.StatusCode.RESOURCE_EXHAUSTED
+})
+# То же для gateway по HTTP
+TRANSIENT_HTTP_STATUSES = frozenset({429, 502, 503, 504})
+
+
+def is_seeds_error_transient(error: BaseException) -> bool:
+    """
+    Проверяет, что ошибка запроса сидинга временная и запрос можно повторить.
+    Постоянные ошибки (INVALID_ARGUMENT, ALREADY_EXISTS, 4xx) при повторе не исчезнут.
+
+    :param error: Исключение, которым завершился запрос.
+    :return: True для ошибок соединения, таймаутов и перегрузки стенда.
+    """
+    if isinstance(error, grpc.RpcError) and hasattr(error, "code"):
+        return error.code() in TRANSIENT_GRPC_CODES
+    if isinstance(error, HTTPStatusError):
+        return error.response.status_code in TRANSIENT_HTTP_STATUSES
+
+    return isinstance(error, TransportError)
+
+
+class SeedsAIMDLimiter:
+    """
+    Адаптивный лимит одновременных запросов (AIMD — additive increase, multiplicative decrease).
+
+    Каждый успешный быстрый запрос увеличивает лимит на 1 / limit, то есть примерно на единицу
+    за "окно" из limit запросов. Ошибка или запрос дольше latency_threshold уменьшают лимит
+    в backoff раз. Запросы, начатые до последнего уменьшения, лимит повторно не уменьшают:
+    иначе одна волна таймаутов сбросила бы лимит до минимума.
+
+    :param min_limit: Нижняя граница лимита.
+    :param max_limit: Верхняя граница лимита (SEEDS.MAX_CONCURRENCY).
+    :param latency_threshold: Длительность запроса в секундах, после которой стенд считается перегруженным.
+    :param backoff: Множитель уменьшения лимита.
+    """
+
+    def __init__(self, min_limit: int, max_limit: int, latency_threshold: float, backoff: float = 0.5):
+        self.min_limit = max(min_limit, 1)
+        self.max_limit = max(max_limit, self.min_limit)
+        self.latency_threshold = latency_threshold
+        self.backoff = backoff
+
+        self.limit = float(self.min_limit)
+        self.in_flight = 0
+        self.decreased_at = 0.0
+        self.decreases = 0
+        self.max_reached = self.min_limit
+
+    @property
+    def current(self) -> int:
+        return int(self.limit)
+
+    def try_acquire(self) -> bool:
+        """
+        Занимает слот, если количество запросов "в полёте" меньше текущего лимита.
+
+        :return: True, если слот занят.
+        """
+        if self.in_flight >= self.current:
+            return False
+
+        self.in_flight += 1
+        return True
+
+    def cancel(self) -> None:
+        """
+        Освобождает слот запроса, который так и не был отправлен. Лимит не меняется.
+        """
+        self.in_flight -= 1
+
+    def release(self, started: float, latency: float, error: bool = False) -> None:
+        """
+        Освобождает слот и пересчитывает лимит по результату запроса.
+
+        :param started: Момент начала запроса (time.perf_counter).
+        :param latency: Длительность запроса в секундах.
+        :param error: Запрос завершился ошибкой.
+        """
+        self.in_flight -= 1
+
+        if error or latency > self.latency_threshold:
+            if started >= self.decreased_at:
+                self.limit = max(self.min_limit, self.limit * self.backoff)
+                self.decreased_at = time.perf_counter()
+                self.decreases += 1
+            return
+
+        self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+        self.max_reached = max(self.max_reached, self.current)
+
+    def log_stats(self) -> None:
+        logger.info(
+            f"Adaptive concurrency: limit {self.current} (max reached {self.max_reached}, "
+            f"bounds {self.min_limit}..{self.max_limit}), {self.decreases} decreases"
+        )
+
+
+class SeedsRateLimiter:
+    """
+    Жёсткий потолок запросов в секунду: запросы распределяются равномерно,
+    каждый следующий не раньше чем через 1 / rate после предыдущего.
+
+    :param rate: Максимальное количество запросов в секунду.
+    """
+
+    def __init__(self, rate: float):
+        self.interval = 1 / rate
+        self.next_slot = 0.0
+
+    def reserve(self) -> float:
+        """
+        Резервирует ближайший свободный момент для запроса.
+
+        :return: Сколько секунд нужно подождать перед запросом.
+        """
+        now = time.perf_counter()
+        slot = max(self.next_slot, now)
+        self.next_slot = slot + self.interval
+
+        return slot - now
+
+
+def build_seeds_aimd_limiter() -> SeedsAIMDLimiter | None:
+    """
+    Фабрика адаптивного лимита по настройкам SEEDS.ADAPTIVE_*.
+
+    :return: Ограничитель или None, если адаптивная конкурентность выключена.
+    """
+    if not settings.seeds.adaptive_concurrency:
+        return None
+
+    return SeedsAIMDLimiter(
+        min_limit=settings.seeds.adaptive_min_concurrency,
+        max_limit=settings.seeds.max_concurrency,
+        latency_threshold=settings.seeds.adaptive_latency_threshold
+    )
+
+
+def build_seeds_rate_limiter() -> SeedsRateLimiter | None:
+    """
+    Фабрика потолка запросов в секунду по настройке SEEDS.RPS_LIMIT.
+
+    :return: Ограничитель или None, если потолок не задан.
+    """
+    if not settings.seeds.rps_limit:
+        return None
+
+    return SeedsRateLimiter(rate=settings.seeds.rps_limit)
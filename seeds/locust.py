@@ -0,0 +1,128 @@
+from locust.env import Environment
+from locust.runners import MasterRunner, WorkerRunner, STATE_MISSING
+
+from config import settings
+from seeds.dumps import load_seeds_mapped
+from seeds.mapped import MappedSeedsResult
+from seeds.pipeline import SeedsPipeline
+from seeds.pool import build_seeds_pool
+from seeds.scenario import SeedsScenario
+from seeds.schema.result import SeedsResult, SeedUserResult
+from tools.config.seeds import SeedsEngine, SeedsDumpFormat
+from tools.logger import get_logger
+
+logger = get_logger("SEEDS_LOCUST")
+
+# Тип сообщения, которым мастер передаёт воркеру его часть сид-пользователей
+SEEDS_MESSAGE = "seeds"
+
+
+def send_seeds_partitions(
+        environment: Environment,
+        seeds_scenario: SeedsScenario,
+        result: SeedsResult | MappedSeedsResult | None = None
+) -> None:
+    """
+    Делит пользователей из дампа между подключёнными воркерами (пользователь с индексом i
+    достаётся воркеру i % N) и отправляет каждому воркеру его часть через канал сообщений Locust.
+
+    Для бинарного дампа (SEEDS.DUMP_FORMAT=mmap) отправляются только позиции пользователей в дампе:
+    воркер отображает тот же файл в память и читает только своих пользователей. Файл дампа должен
+    быть доступен воркерам по тому же пути (воркеры на той же машине или общий том).
+
+    :param environment: Окружение Locust мастера.
+    :param seeds_scenario: Сценарий сидинга, дамп которого нужно разделить.
+    :param result: Проверенный на стенде результат сидинга (SEEDS.VERIFY=true), делятся только его
+                   пользователи. None — пользователи читаются из дампа (SeedsScenario.iter_users).
+    """
+    runner: MasterRunner = environment.runner
+    workers = sorted(worker.id for worker in runner.clients.all if worker.state != STATE_MISSING)
+    if not workers:
+        logger.warning(f"[{seeds_scenario.scenario}] No workers connected, seeding data is not sent.")
+        return
+
+    if settings.seeds.dump_format == SeedsDumpFormat.MMAP:
+        selected = seeds_scenario.select_users() if result is None else result.indexes
+        if selected is None:
+            mapped = load_seeds_mapped(scenario=seeds_scenario.dump_name)
+            selected = range(len(mapped))
+            mapped.close()
+
+        partitions = [list(selected[index::len(workers)]) for index in range(len(workers))]
+        for worker, indexes in zip(workers, partitions):
+            runner.send_message(SEEDS_MESSAGE, {"indexes": indexes}, client_id=worker)
+    else:
+        partitions: list[list[str]] = [[] for _ in workers]
+        users = seeds_scenario.iter_users() if result is None else result.users
+        for index, user in enumerate(users):
+            partitions[index % len(workers)].append(user.model_dump_json())
+
+        for worker, users in zip(workers, partitions):
+            runner.send_message(SEEDS_MESSAGE, {"users": users}, client_id=worker)
+
+    logger.info(
+        f"[{seeds_scenario.scenario}] Seeding data sent to {len(workers)} workers: "
+        f"{', '.join(str(len(users)) for users in partitions)} users."
+    )
+
+
+def init_seeds_pool(environment: Environment, seeds_scenario: SeedsScenario) -> None:
+    """
+    Готовит сид-пользователей для сценария Locust и сохраняет пул в environment.seeds.
+
+    - Локальный запуск: сидинг, загрузка дампа и создание пула в этом же процессе.
+      При SEEDS.PIPELINE=true пул наполняется в фоне, пока Locust уже запускает пользователей.
+    - Мастер (--master): сидинг выполняется один раз, на test_start каждому воркеру
+      отправляется его непересекающаяся часть пользователей. При SEEDS.VERIFY=true мастер до раздачи
+      проверяет пользователей на стенде (при устаревшем дампе — пересидинг), воркеры получают только
+      существующих пользователей.
+    - Воркер (--worker): сидинг не выполняется, пул создаётся из части, полученной от мастера
+      (для бинарного дампа — из своих пользователей общего файла, отображённого в память).
+      Мастер отправляет её до команды на запуск пользователей, поэтому к on_start пул готов.
+
+    :param environment: Окружение Locust.
+    :param seeds_scenario: Сценарий сидинга.
+    """
+    runner = environment.runner
+
+    # Счётчики пула выводятся в лог при завершении Locust
+    environment.events.quitting.add_listener(
+        lambda **kwargs: environment.seeds.log_stats() if hasattr(environment, "seeds") else None
+    )
+
+    if isinstance(runner, WorkerRunner):
+        def on_seeds(environment: Environment, msg, **kwargs):
+            if "indexes" in msg.data:
+                result = load_seeds_mapped(scenario=seeds_scenario.dump_name, indexes=msg.data["indexes"])
+            else:
+                users = (SeedUserResult.model_validate_json(user) for user in msg.data["users"])
+                result = seeds_scenario.store(users)
+
+            environment.seeds = build_seeds_pool(result)
+            logger.info(f"[{seeds_scenario.scenario}] Seeding data received from master: {len(result)} users.")
+
+        runner.register_message(SEEDS_MESSAGE, on_seeds)
+        return
+
+    force = environment.parsed_options.force_reseed
+    if settings.seeds.pipeline and not isinstance(runner, MasterRunner) and (force or not seeds_scenario.is_built()):
+        if settings.seeds.engine == SeedsEngine.GEVENT:
+            pipeline = SeedsPipeline(seeds_scenario, force=force, report_interval=settings.seeds.pipeline_report_interval)
+            environment.seeds = pipeline.start()
+            return
+
+        logger.warning(f"[{seeds_scenario.scenario}] Seeds pipeline requires gevent engine, seeding before the test.")
+
+    # Выполняем генерацию данных, если они ещё не созданы
+    seeds_scenario.build(force=force)
+
+    if isinstance(runner, MasterRunner):
+        # Воркеры не загружают дамп через SeedsScenario.load, поэтому проверка выполняется на мастере
+        result = seeds_scenario.load(store=False) if settings.seeds.verify else None
+        environment.events.test_start.add_listener(
+            lambda environment, **kwargs: send_seeds_partitions(environment, seeds_scenario, result)
+        )
+        return
+
+    # Загружаем сгенерированных пользователей в окружение Locust
+    environment.seeds = build_seeds_pool(seeds_scenario.load())
@@ -0,0 +1,153 @@
+"""
+Бинарный дамп сидинга для отображения в память (SEEDS.DUMP_FORMAT=mmap).
+
+Формат файла:
+    MAGIC | запись 0 | запись 1 | ... | смещения (N + 1 чисел uint64) | N (uint64) | начало смещений (uint64) | MAGIC
+
+Запись — JSON одного пользователя (SeedUserResult), смещения указывают на начало каждой записи
+и конец последней. Таблица смещений находится в конце файла, поэтому писатель работает потоково.
+
+MappedSeedsResult отображает файл в память через mmap и при открытии читает только хвост файла:
+загрузка не зависит от размера дампа, а страницы с пользователями подгружаются ОС при первом обращении.
+"""
+import mmap
+import os
+import random
+import struct
+import sys
+from array import array
+from typing import Iterator, Sequence
+
+from seeds.schema.result import SeedUserResult
+
+MAGIC = b"SEEDMAP1"
+# Количество пользователей и позиция таблицы смещений
+TRAILER = struct.Struct("<QQ")
+
+
+class SeedsMappedWriter:
+    """
+    Потоковый писатель бинарного дампа. Файл пишется во временный файл и атомарно заменяет
+    дамп при закрытии: процессы, уже отобразившие старый дамп в память, продолжают читать его
+    (замена файла на месте под открытым mmap привела бы к SIGBUS).
+
+    :param file: Путь к файлу дампа.
+    """
+
+    def __init__(self, file: str):
+        self.file = file
+        self.temp_file = f"{file}.tmp"
+        self.stream = open(self.temp_file, 'wb')
+        self.stream.write(MAGIC)
+        self.offsets = array('Q', [len(MAGIC)])
+
+    def write(self, user: SeedUserResult) -> None:
+        """
+        Записывает пользователя и запоминает смещение конца записи.
+
+        :param user: Созданный пользователь со всеми счетами, картами и операциями.
+        """
+        self.offsets.append(self.offsets[-1] + self.stream.write(user.model_dump_json().encode()))
+
+    def close(self) -> None:
+        index_offset = self.offsets[-1]
+        if sys.byteorder != "little":
+            self.offsets.byteswap()
+
+        self.stream.write(self.offsets.tobytes())
+        self.stream.write(TRAILER.pack(len(self.offsets) - 1, index_offset))
+        self.stream.write(MAGIC)
+        self.stream.close()
+        os.replace(self.temp_file, self.file)
+
+    def __enter__(self) -> "SeedsMappedWriter":
+        return self
+
+    def __exit__(self, exc_type, *args) -> None:
+        if exc_type is None:
+            self.close()
+            return
+
+        # Недописанный дамп не должен заменить существующий
+        self.stream.close()
+        os.remove(self.temp_file)
+
+
+class MappedSeedsResult:
+    """
+    Результат сидинга поверх бинарного дампа, отображённого в память.
+
+    Пользователь декодируется из своей записи только при обращении к нему, поэтому открытие
+    дампа занимает миллисекунды при любом количестве пользователей, а в память процесса попадают
+    только выданные пользователи. API выдачи пользователей как у SeedsResult и CompactSeedsResult.
+
+    Несколько процессов (воркеры Locust на одной машине) делят страницы файла через кеш ОС.
+
+    :param file: Путь к бинарному дампу.
+    :param indexes: Позиции пользователей дампа, которые входят в результат (часть воркера
+                    или выборка общего пула). None — все пользователи дампа.
+    :raises ValueError: Файл не является бинарным дампом сидинга или записан не полностью.
+    """
+
+    def __init__(self, file: str, indexes: Sequence[int] | None = None):
+        with open(file, 'rb') as stream:
+            self.mmap = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+
+        size = len(self.mmap)
+        tail = size - TRAILER.size - len(MAGIC)
+        if size < len(MAGIC) * 2 + TRAILER.size or self.mmap[:len(MAGIC)] != MAGIC or self.mmap[-len(MAGIC):] != MAGIC:
+            self.mmap.close()
+            raise ValueError(f"Seeding file {file} is not a complete mmap seeds dump")
+
+        count, index_offset = TRAILER.unpack_from(self.mmap, tail)
+        if sys.byteorder == "little":
+            # Таблица смещений читается прямо из отображённого файла, без копирования
+            self.offsets = memoryview(self.mmap)[index_offset:index_offset + (count + 1) * 8].cast('Q')
+        else:
+            self.offsets = array('Q', self.mmap[index_offset:index_offset + (count + 1) * 8])
+            self.offsets.byteswap()
+
+        self.file = file
+        self.indexes = range(count) if indexes is None else indexes
+        # Позиция следующего невыданного пользователя для get_next_user
+        self.cursor = 0
+
+    def get_user(self, index: int) -> SeedUserResult:
+        position = self.indexes[index]
+        return SeedUserResult.model_validate_json(self.mmap[self.offsets[position]:self.offsets[position + 1]])
+
+    def get_next_user(self) -> SeedUserResult:
+        """
+        Возвращает следующего невыданного пользователя (аналог SeedsResult.get_next_user).
+
+        :return: Пользователь.
+        :raises IndexError: Если все пользователи уже выданы.
+        """
+        if self.cursor >= len(self.indexes):
+            raise IndexError("get next user from empty mapped seeds")
+
+        self.cursor += 1
+        return self.get_user(self.cursor - 1)
+
+    def get_random_user(self) -> SeedUserResult:
+        """
+        Возвращает случайного пользователя из невыданных, без удаления (аналог SeedsResult.get_random_user).
+
+        :return: Пользователь.
+        :raises IndexError: Если невыданных пользователей нет.
+        """
+        if self.cursor >= len(self.indexes):
+            raise IndexError("get random user from empty mapped seeds")
+
+        return self.get_user(random.randrange(self.cursor, len(self.indexes)))
+
+    def close(self) -> None:
+        if isinstance(self.offsets, memoryview):
+            self.offsets.release()
+        self.mmap.close()
+
+    def __len__(self) -> int:
+        return len(self.indexes) - self.cursor
+
+    def __iter__(self) -> Iterator[SeedUserResult]:
+        return (self.get_user(index) for index in range(self.cursor, len(self.indexes)))
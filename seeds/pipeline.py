@@ -0,0 +1,99 @@
+import time
+
+import gevent
+from gevent import Greenlet
+
+from seeds.pool import SeedsPool, build_seeds_pool
+from seeds.scenario import SeedsScenario
+from seeds.schema.result import SeedUserResult
+from seeds.store import CompactSeedsResult
+from tools.logger import get_logger
+
+logger = get_logger("SEEDS_PIPELINE")
+
+
+class SeedsPipeline:
+    """
+    Конвейерный сидинг: билдер работает в фоновом greenlet'е и добавляет каждого готового
+    пользователя в пул, а Locust в это время уже запускает виртуальных пользователей.
+    Виртуальный пользователь ждёт, только если свободных сид-пользователей пока нет.
+
+    Периодически в лог выводится скорость наполнения пула и скорость его потребления (выдачи
+    пользователей). Если с прошлого отчёта виртуальным пользователям приходилось ждать
+    сид-пользователей, узкое место — сидинг.
+
+    :param seeds_scenario: Сценарий сидинга.
+    :param force: Выполнить сидинг заново, даже если актуальный дамп существует.
+    :param report_interval: Интервал между отчётами в секундах.
+    """
+
+    def __init__(self, seeds_scenario: SeedsScenario, force: bool = False, report_interval: float = 5.0):
+        self.seeds_scenario = seeds_scenario
+        self.force = force
+        self.report_interval = report_interval
+
+        self.result = seeds_scenario.store([])
+        self.pool: SeedsPool = build_seeds_pool(self.result)
+        self.started = time.perf_counter()
+        self.greenlets: list[Greenlet] = []
+        # Количество ожиданий на момент прошлого отчёта
+        self.reported_waits = 0
+
+    def add_user(self, user: SeedUserResult) -> None:
+        """
+        Добавляет готового пользователя в хранилище и делает его доступным в пуле.
+
+        :param user: Созданный пользователь.
+        """
+        if isinstance(self.result, CompactSeedsResult):
+            self.result.add_user(user)
+        else:
+            self.result.users.append(user)
+
+        if self.pool.index is not None:
+            self.pool.index.add_user(user)
+
+        self.pool.grow()
+
+    def report(self) -> None:
+        elapsed = max(time.perf_counter() - self.started, 1e-9)
+        stats = self.pool.stats
+        fill_rate = stats.size / elapsed
+        consume_rate = (stats.acquired + stats.recycled) / elapsed
+        waits = stats.waits - self.reported_waits
+        self.reported_waits = stats.waits
+
+        logger.info(
+            f"[{self.seeds_scenario.scenario}] Seeds pipeline: "
+            f"{stats.size}/{self.seeds_scenario.plan.users.count} users in {elapsed:.1f}s, "
+            f"fill {fill_rate:.1f} users/s, consumption {consume_rate:.1f} users/s, "
+            f"waits {stats.waits} ({stats.wait_time:.1f}s)"
+            f"{f', {waits} new waits, seeding is the bottleneck' if waits else ''}"
+        )
+
+    def run(self) -> None:
+        try:
+            self.seeds_scenario.build(force=self.force, on_user_built=self.add_user)
+        except Exception:
+            logger.exception(f"[{self.seeds_scenario.scenario}] Seeds pipeline failed.")
+        finally:
+            self.pool.filling = False
+            self.report()
+
+    def run_reporter(self) -> None:
+        while self.pool.filling:
+            gevent.sleep(self.report_interval)
+            if self.pool.filling:
+                self.report()
+
+    def start(self) -> SeedsPool:
+        """
+        Запускает сидинг и отчёты в фоновых greenlet'ах.
+
+        :return: Наполняемый пул сид-пользователей.
+        """
+        self.started = time.perf_counter()
+        self.pool.filling = True
+        self.greenlets = [gevent.spawn(self.run), gevent.spawn(self.run_reporter)]
+
+        return self.pool
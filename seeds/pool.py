@@ -0,0 +1,286 @@
+import time
+from collections import deque
+from typing import Callable, Generic, TypeVar
+
+from gevent.lock import Semaphore
+
+from config import settings
+from seeds.index import SeedsIndex, SeedsUserIndex
+from seeds.mapped import MappedSeedsResult
+from seeds.schema.pool import SeedsPoolStats
+from seeds.schema.result import SeedsResult
+from seeds.store import CompactSeedsResult
+from tools.config.seeds import SeedsPoolPolicy
+from tools.logger import get_logger
+
+logger = get_logger("SEEDS_POOL")
+
+T = TypeVar("T")
+
+# Как часто ожидающий виртуальный пользователь проверяет, не завершилось ли наполнение пула (секунды)
+FILLING_POLL_INTERVAL = 1.0
+
+
+class SeedsPoolExhaustedError(Exception):
+    """
+    В пуле не осталось свободных сид-пользователей (политика fail или истёк таймаут политики block).
+    """
+
+
+class SeedsLease(Generic[T]):
+    """
+    Аренда сид-пользователя из пула. Пользователь возвращается в пул вызовом release,
+    обычно в on_stop виртуального пользователя Locust.
+
+    :param pool: Пул, из которого выдан пользователь.
+    :param index: Индекс пользователя в результате сидинга.
+    :param user: Сид-пользователь.
+    :param exclusive: Выдан ли пользователь эксклюзивно. Повторно выданные (recycle)
+                      пользователи в очередь свободных не возвращаются.
+    """
+    __slots__ = ("pool", "index", "user", "exclusive", "released", "_index_view")
+
+    def __init__(self, pool: "SeedsPool[T]", index: int, user: T, exclusive: bool):
+        self.pool = pool
+        self.index = index
+        self.user = user
+        self.exclusive = exclusive
+        self.released = False
+        self._index_view: SeedsUserIndex | None = None
+
+    @property
+    def index_view(self) -> SeedsUserIndex:
+        """
+        Индексы арендованного пользователя: выборка его счетов, карт и операций.
+        """
+        if self._index_view is None:
+            self._index_view = self.pool.get_index_view(self)
+
+        return self._index_view
+
+    def release(self) -> None:
+        self.pool.release(self)
+
+
+class SeedsPool(Generic[T]):
+    """
+    Пул сид-пользователей с выдачей за O(1).
+
+    Свободные пользователи хранятся как индексы в deque, сам пользователь создаётся функцией
+    get_user только в момент выдачи, поэтому пул подходит для SeedsResult, CompactSeedsResult
+    и MappedSeedsResult.
+    Пул работает в greenlet'ах Locust: ожидание свободного пользователя идёт через gevent-семафор.
+
+    :param get_user: Функция получения пользователя по индексу.
+    :param size: Количество пользователей.
+    :param policy: Поведение при исчерпании пула (block, recycle, fail).
+    :param timeout: Максимальное время ожидания для политики block. None — без ограничения.
+    :param index: Плоские индексы пользователей пула для выборки счетов, карт и операций за O(1).
+    :param build_index: Функция построения индексов при первом обращении к SeedsPool.index
+                        (вместо готовых индексов index).
+    """
+
+    def __init__(
+            self,
+            get_user: Callable[[int], T],
+            size: int,
+            policy: SeedsPoolPolicy = SeedsPoolPolicy.RECYCLE,
+            timeout: float | None = None,
+            index: SeedsIndex | None = None,
+            build_index: Callable[[], SeedsIndex] | None = None
+    ):
+        self.get_user = get_user
+        self._index = index
+        self.build_index = build_index
+        self.policy = policy
+        self.timeout = timeout
+        self.free = deque(range(size))
+        self.semaphore = Semaphore(size)
+        self.stats = SeedsPoolStats(size=size)
+        # Позиция для повторной выдачи занятых пользователей по кругу
+        self.recycle_index = 0
+        # Пул ещё наполняется в фоне (конвейерный сидинг): пустой пул не считается исчерпанным
+        self.filling = False
+
+    @property
+    def index(self) -> SeedsIndex | None:
+        """
+        Плоские индексы пула. Отложенные индексы (build_index) строятся при первом обращении.
+        """
+        if self._index is None and self.build_index is not None:
+            self._index = self.build_index()
+            self.build_index = None
+
+        return self._index
+
+    @classmethod
+    def from_result(
+            cls,
+            result: SeedsResult | CompactSeedsResult | MappedSeedsResult,
+            policy: SeedsPoolPolicy = SeedsPoolPolicy.RECYCLE,
+            timeout: float | None = None,
+            index: bool = False
+    ) -> "SeedsPool":
+        """
+        Создаёт пул из результата сидинга.
+
+        :param result: Загруженный результат сидинга.
+        :param policy: Поведение при исчерпании пула.
+        :param timeout: Максимальное время ожидания для политики block.
+        :param index: Построить плоские индексы пользователей (SeedsPool.index). Для MappedSeedsResult
+                      индексы строятся при первом обращении к SeedsPool.index: их построение читает
+                      весь дамп, а пул должен создаваться за миллисекунды и читать только выданных пользователей.
+        :return: Пул сид-пользователей.
+        """
+        if isinstance(result, MappedSeedsResult):
+            build_index = (lambda: SeedsIndex.from_users(result)) if index else None
+            return cls(
+                get_user=result.get_user,
+                size=len(result),
+                policy=policy,
+                timeout=timeout,
+                build_index=build_index
+            )
+
+        users = result.users if isinstance(result, SeedsResult) else result
+        seeds_index = SeedsIndex.from_users(users) if index else None
+
+        if not isinstance(result, SeedsResult):
+            return cls(get_user=result.get_user, size=len(result), policy=policy, timeout=timeout, index=seeds_index)
+
+        return cls(
+            get_user=result.users.__getitem__,
+            size=len(result.users),
+            policy=policy,
+            timeout=timeout,
+            index=seeds_index
+        )
+
+    def get_index_view(self, lease: SeedsLease[T]) -> SeedsUserIndex:
+        """
+        Представление индексов пула для арендованного пользователя. Если индексы пула
+        не строятся (SEEDS.INDEX=false), индексы собираются по одному этому пользователю.
+
+        :param lease: Аренда, полученная через acquire.
+        :return: Индексы, ограниченные пользователем аренды.
+        """
+        if self.index is None:
+            return SeedsIndex.from_users([lease.user]).view(0)
+
+        return self.index.view(lease.index)
+
+    def lease(self, exclusive: bool) -> SeedsLease[T]:
+        if exclusive:
+            index = self.free.popleft()
+            self.stats.acquired += 1
+            self.stats.leased += 1
+            self.stats.max_leased = max(self.stats.max_leased, self.stats.leased)
+        else:
+            index = self.recycle_index % self.stats.size
+            self.recycle_index += 1
+            self.stats.recycled += 1
+
+        return SeedsLease(pool=self, index=index, user=self.get_user(index), exclusive=exclusive)
+
+    def acquire(self) -> SeedsLease[T]:
+        """
+        Выдаёт сид-пользователя эксклюзивно. Если свободных пользователей нет, поведение
+        определяется политикой пула. Пока пул наполняется, при любой политике ожидается
+        появление нового пользователя (recycle — только если пул ещё пуст).
+
+        :return: Аренда пользователя.
+        :raises SeedsPoolExhaustedError: Пул исчерпан (политика fail или таймаут block).
+        """
+        if self.semaphore.acquire(blocking=False):
+            return self.lease(exclusive=True)
+
+        if self.policy == SeedsPoolPolicy.RECYCLE and self.stats.size:
+            return self.lease(exclusive=False)
+
+        if self.policy == SeedsPoolPolicy.BLOCK or self.filling:
+            if self.wait():
+                return self.lease(exclusive=True)
+
+            # Наполнение завершилось во время ожидания
+            if self.policy == SeedsPoolPolicy.RECYCLE and self.stats.size:
+                return self.lease(exclusive=False)
+
+        self.stats.exhausted += 1
+        raise SeedsPoolExhaustedError(
+            f"Seeds pool exhausted: {self.stats.leased}/{self.stats.size} users leased, policy {self.policy}"
+        )
+
+    def wait(self) -> bool:
+        """
+        Ждёт свободного пользователя: возврата аренды или добавления нового пользователя в пул.
+        Пока пул наполняется, ожидание идёт при любой политике, после — только для block.
+
+        :return: True, если пользователь получен (семафор захвачен).
+        """
+        self.stats.waits += 1
+        started = time.perf_counter()
+
+        try:
+            while True:
+                if not self.filling and self.policy != SeedsPoolPolicy.BLOCK:
+                    return self.semaphore.acquire(blocking=False)
+
+                elapsed = time.perf_counter() - started
+                if self.timeout is not None and elapsed >= self.timeout:
+                    return False
+
+                remaining = None if self.timeout is None else self.timeout - elapsed
+                if self.filling:
+                    remaining = FILLING_POLL_INTERVAL if remaining is None else min(remaining, FILLING_POLL_INTERVAL)
+
+                if self.semaphore.acquire(timeout=remaining):
+                    return True
+        finally:
+            self.stats.wait_time += time.perf_counter() - started
+
+    def grow(self, count: int = 1) -> None:
+        """
+        Добавляет в пул новых пользователей с индексами size .. size + count - 1.
+        К моменту вызова они уже должны быть доступны через get_user.
+
+        :param count: Количество добавленных пользователей.
+        """
+        self.free.extend(range(self.stats.size, self.stats.size + count))
+        self.stats.size += count
+        for _ in range(count):
+            self.semaphore.release()
+
+    def release(self, lease: SeedsLease[T]) -> None:
+        """
+        Возвращает пользователя в пул. Повторный возврат той же аренды игнорируется.
+
+        :param lease: Аренда, полученная через acquire.
+        """
+        if lease.released:
+            return
+
+        lease.released = True
+        self.stats.released += 1
+
+        if lease.exclusive:
+            self.free.append(lease.index)
+            self.stats.leased -= 1
+            self.semaphore.release()
+
+    def log_stats(self) -> None:
+        logger.info(f"Seeds pool stats: {self.stats.model_dump_json()}")
+
+
+def build_seeds_pool(result: SeedsResult | CompactSeedsResult | MappedSeedsResult) -> SeedsPool:
+    """
+    Фабрика пула сид-пользователей по настройкам SEEDS.POOL_* и SEEDS.INDEX.
+
+    :param result: Загруженный результат сидинга.
+    :return: Пул сид-пользователей.
+    """
+    return SeedsPool.from_result(
+        result,
+        policy=settings.seeds.pool_policy,
+        timeout=settings.seeds.pool_timeout,
+        index=settings.seeds.index
+    )
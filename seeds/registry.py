@@ -0,0 +1,77 @@
+"""
+Реестр общих пулов сид-пользователей.
+
+Сценарии, которым нужны пользователи одной структуры (одинаковые счета, карты и операции),
+используют общий пул вместо собственного дампа. Ключ пула — нормализованный план пользователя:
+граф вызовов сидинга без количества пользователей. Сценарий, которому нужно больше пользователей,
+чем есть в пуле, досоздаёт недостающих, а каждый запуск берёт наименее использованных пользователей.
+"""
+import hashlib
+import heapq
+import json
+
+from seeds.dag import SeedsNode, compile_seeds_plan
+from seeds.schema.plan import SeedUsersPlan
+
+
+def normalize_seeds_node(node: SeedsNode) -> dict:
+    if node.distribution is None:
+        normalized = {"rpc": node.rpc, "count": node.count}
+    else:
+        # Количество выбирается из распределения, count не используется
+        normalized = {"rpc": node.rpc, "distribution": node.distribution.model_dump(mode="json")}
+
+    normalized["children"] = sorted(
+        (normalize_seeds_node(child) for child in node.children), key=lambda child: child["rpc"]
+    )
+    return normalized
+
+
+def normalize_seeds_plan(plan: SeedUsersPlan) -> dict:
+    """
+    Нормализует план пользователя: счета, карты и операции с нулевым количеством отбрасываются,
+    количество пользователей не учитывается.
+
+    :param plan: План генерации пользователя.
+    :return: Структура графа сидинга одного пользователя.
+    """
+    return normalize_seeds_node(compile_seeds_plan(plan))
+
+
+def get_seeds_plan_key(plan: SeedUsersPlan, target: str, random_seed: int | None = None) -> str:
+    """
+    Ключ общего пула: нормализованный план пользователя, адрес стенда и зерно генератора.
+
+    :param plan: План генерации пользователя.
+    :param target: Адрес стенда, на котором созданы пользователи.
+    :param random_seed: Зерно генератора распределений плана (SEEDS.RANDOM_SEED). Пользователи, созданные
+                        с другим зерном, имеют другую структуру, поэтому попадают в другой пул.
+    :return: Хеш ключа пула.
+    """
+    payload = {"plan": normalize_seeds_plan(plan), "target": target}
+    if random_seed is not None:
+        payload["random_seed"] = random_seed
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+def get_seeds_pool_name(key: str) -> str:
+    """
+    Имя общего пула, под которым хранятся его дамп, метаданные и счётчики использования.
+
+    :param key: Ключ пула.
+    :return: Имя вида pool_{первые 16 символов ключа}.
+    """
+    return f"pool_{key[:16]}"
+
+
+def select_seeds_users(usage: list[int], count: int) -> list[int]:
+    """
+    Выбирает count наименее использованных пользователей пула.
+    При равном использовании предпочтение отдаётся пользователям, созданным раньше.
+
+    :param usage: Счётчики использования пользователей пула.
+    :param count: Сколько пользователей нужно.
+    :return: Индексы выбранных пользователей в порядке дампа.
+    """
+    selected = heapq.nsmallest(count, range(len(usage)), key=lambda index: (usage[index], index))
+    return sorted(selected)
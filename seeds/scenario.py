@@ -1,13 +1,60 @@
+import hashlib
+import itertools
+import json
+import subprocess
+import sys
 from abc import ABC, abstractmethod
+from typing import Callable, Iterable, Iterator
 
-from seeds.builder import build_grpc_seeds_builder
-from seeds.dumps import save_seeds_result, load_seeds_result
+from locust import events
+from locust.argument_parser import LocustArgumentParser
+
+from config import settings
+from seeds.builder import build_grpc_seeds_builder, build_services_seeds_builder
+from seeds.dumps import (
+    save_seeds_meta,
+    load_seeds_meta,
+    save_seeds_result,
+    save_seeds_stats,
+    load_seeds_stats,
+    save_seeds_usage,
+    load_seeds_usage,
+    load_seeds_mapped,
+    iter_seeds_result,
+    load_seeds_journal,
+    open_seeds_journal,
+    commit_seeds_journal,
+    remove_seeds_journal
+)
+from seeds.dag import compile_seeds_plan, estimate_seeds_graph
+from seeds.mapped import MappedSeedsResult
+from seeds.schema.estimate import SeedsPlanEstimate
+from seeds.registry import get_seeds_plan_key, get_seeds_pool_name, select_seeds_users
+from seeds.schema.meta import SeedsMeta
 from seeds.schema.plan import SeedsPlan
-from seeds.schema.result import SeedsResult
+from seeds.schema.registry import SeedsUsage
+from seeds.schema.result import SeedsResult, SeedUserResult
+from seeds.store import CompactSeedsResult
+from seeds.verify import build_seeds_verifier
+from tools.config.seeds import SeedsEngine, SeedsBackend, SeedsDumpFormat, SeedsStore
 from tools.logger import get_logger
 
 logger = get_logger("SEEDS_SCENARIO")
 
+
+@events.init_command_line_parser.add_listener
+def init_command_line_parser(parser: LocustArgumentParser):
+    # Флаг принудительного пересидинга, даже если для текущего плана уже есть актуальный дамп.
+    # Также можно задать через переменную окружения LOCUST_FORCE_RESEED или force-reseed в .conf
+    parser.add_argument(
+        "--force-reseed",
+        action="store_true",
+        default=False,
+        env_var="LOCUST_FORCE_RESEED",
+        help="Rebuild seeding data even if a valid dump for the same plan exists"
+    )
+
+
 class SeedsScenario(ABC):
     """
     Абстрактный класс для работы со сценариями сидинга.
@@ -17,9 +64,13 @@ class SeedsScenario(ABC):
     def __init__(self):
         """
         Инициализация класса SeedsScenario.
-        Создаёт экземпляр билдера для генерации сидинговых данных через gRPC.
+        Создаёт экземпляр билдера для генерации сидинговых данных через gRPC:
+        через gateway или напрямую через внутренние сервисы (SEEDS.BACKEND).
         """
-        self.builder = build_grpc_seeds_builder()
+        if settings.seeds.backend == SeedsBackend.SERVICES:
+            self.builder = build_services_seeds_builder()
+        else:
+            self.builder = build_grpc_seeds_builder()
 
     @property
     @abstractmethod
@@ -39,36 +90,453 @@ class SeedsScenario(ABC):
         """
         ...
 
+    @property
+    def dump_name(self) -> str:
+        """
+        Имя, под которым хранится дамп сценария. При SEEDS.REGISTRY=true сценарии с одинаковым
+        нормализованным планом пользователя хранят пользователей в одном общем пуле.
+        """
+        if settings.seeds.registry:
+            return get_seeds_pool_name(self.fingerprint)
+
+        return self.scenario
+
+    @property
+    def fingerprint(self) -> str:
+        """
+        Отпечаток плана сидинга и целевого gateway.
+        Если отпечаток совпадает с сохранённым рядом с дампом, дамп можно переиспользовать.
+        В режиме общего пула это ключ пула: количество пользователей в нём не учитывается.
+        """
+        if settings.seeds.registry:
+            return get_seeds_plan_key(
+                self.plan.users, target=settings.gateway_grpc_client.client_url, random_seed=settings.seeds.random_seed
+            )
+
+        payload = {
+            "plan": self.plan.model_dump(mode="json", exclude_none=True),
+            "gateway": settings.gateway_grpc_client.client_url
+        }
+        if settings.seeds.random_seed is not None:
+            payload["random_seed"] = settings.seeds.random_seed
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+    def is_built(self) -> bool:
+        """
+        Проверяет, есть ли актуальный дамп для текущего плана: отпечаток совпадает и срок жизни не истёк.
+        В общем пуле должно быть не меньше пользователей, чем требует план.
+        """
+        meta = load_seeds_meta(
+            scenario=self.dump_name, dump_format=settings.seeds.dump_format, compression=settings.seeds.compression
+        )
+        if meta is None:
+            return False
+
+        if settings.seeds.registry and (meta.users or 0) < self.plan.users.count:
+            return False
+
+        return (meta.fingerprint == self.fingerprint) and not meta.is_expired(settings.seeds.ttl)
+
     def save(self, result: SeedsResult) -> None:
         """
         Сохраняет результат сидинга в файл.
         :param result: Объект SeedsResult, содержащий сгенерированные данные.
         """
         logger.info(f"[{self.scenario}] Saving seeding result to file.")
-        save_seeds_result(result=result, scenario=self.scenario)
+        save_seeds_result(
+            result=result,
+            scenario=self.dump_name,
+            dump_format=settings.seeds.dump_format,
+            fingerprint=self.fingerprint,
+            compression=settings.seeds.compression
+        )
         logger.info(f"[{self.scenario}] Seeding result saved successfully.")
 
-    def load(self) -> SeedsResult:
+    def iter_dump_users(self) -> Iterator[SeedUserResult]:
+        """
+        Итерирует всех пользователей из дампа. JSONL-дамп читается построчно, JSON-дамп — потоковым
+        разбором, бинарный дамп — по одной записи из отображённого в память файла.
+        :return: Итератор по пользователям дампа.
+        """
+        if settings.seeds.dump_format == SeedsDumpFormat.MMAP:
+            return iter(load_seeds_mapped(scenario=self.dump_name))
+
+        return iter_seeds_result(
+            scenario=self.dump_name, dump_format=settings.seeds.dump_format, compression=settings.seeds.compression
+        )
+
+    def load_usage(self, size: int | None = None) -> SeedsUsage:
+        """
+        Загружает счётчики использования общего пула, дополненные нулями до размера пула.
+        :param size: Количество пользователей пула. По умолчанию берётся из метаданных дампа.
+        :return: Объект SeedsUsage со счётчиком для каждого пользователя пула.
+        """
+        if size is None:
+            meta = load_seeds_meta(
+                scenario=self.dump_name, dump_format=settings.seeds.dump_format, compression=settings.seeds.compression
+            )
+            size = meta.users if meta and meta.users is not None else sum(1 for _ in self.iter_dump_users())
+
+        usage = load_seeds_usage(scenario=self.dump_name)
+        # Пользователи, досозданные после последнего запуска, ещё не использовались
+        usage.usage.extend([0] * (size - len(usage.usage)))
+        return usage
+
+    def select_users(self, record: bool = True, size: int | None = None) -> list[int] | None:
+        """
+        Выбирает позиции пользователей дампа для запуска. В режиме общего пула выбираются
+        plan.users.count наименее использованных пользователей.
+        :param record: Сразу увеличить счётчики использования выбранных пользователей (record_users).
+                       False — выборка будет учтена позже, например после проверки пользователей на стенде.
+        :param size: Количество пользователей пула. По умолчанию берётся из метаданных дампа.
+        :return: Отсортированные позиции пользователей или None — используются все пользователи дампа.
+        """
+        if not settings.seeds.registry:
+            return None
+
+        usage = self.load_usage(size=size)
+        selected = sorted(select_seeds_users(usage.usage, self.plan.users.count))
+        if record:
+            self.record_users(selected)
+
+        return selected
+
+    def record_users(self, selected: list[int] | None) -> None:
+        """
+        Увеличивает счётчики использования выбранных пользователей общего пула и количество запусков сценария.
+        :param selected: Позиции пользователей из select_users. None — общий пул не используется.
+        """
+        if selected is None:
+            return
+
+        usage = self.load_usage()
+        for index in selected:
+            usage.usage[index] += 1
+        usage.runs[self.scenario] = usage.runs.get(self.scenario, 0) + 1
+        save_seeds_usage(usage=usage, scenario=self.dump_name)
+
+        logger.info(
+            f"[{self.scenario}] Using {len(selected)}/{len(usage.usage)} users of shared pool {self.dump_name}, "
+            f"max usage {max(usage.usage, default=0)}."
+        )
+
+    def iter_users(self) -> Iterator[SeedUserResult]:
+        """
+        Итерирует пользователей для запуска: всех пользователей дампа или выборку общего пула (select_users).
+        :return: Итератор по пользователям дампа.
+        """
+        return self.iter_selected_users(self.select_users())
+
+    def iter_selected_users(self, selected: list[int] | None) -> Iterator[SeedUserResult]:
+        """
+        Итерирует пользователей дампа на выбранных позициях.
+        :param selected: Позиции пользователей из select_users. None — все пользователи дампа.
+        :return: Итератор по пользователям дампа.
+        """
+        if selected is None:
+            return self.iter_dump_users()
+
+        selected_set = set(selected)
+        return (user for index, user in enumerate(self.iter_dump_users()) if index in selected_set)
+
+    def store(self, users: Iterable[SeedUserResult]) -> SeedsResult | CompactSeedsResult:
+        """
+        Собирает пользователей в представление, заданное настройкой SEEDS.STORE:
+        SeedsResult или колоночное хранилище CompactSeedsResult с тем же API выдачи пользователей.
+        :param users: Пользователи из дампа или из сообщения мастера Locust.
+        :return: Объект SeedsResult или CompactSeedsResult.
+        """
+        if settings.seeds.store == SeedsStore.COMPACT:
+            return CompactSeedsResult.from_users(users)
+
+        return SeedsResult(users=list(users))
+
+    def load_result(
+            self,
+            selected: list[int] | None = None,
+            store: bool = True
+    ) -> SeedsResult | CompactSeedsResult | MappedSeedsResult:
+        """
+        Читает пользователей для запуска из дампа.
+        Бинарный дамп (SEEDS.DUMP_FORMAT=mmap) не читается целиком, а отображается в память.
+        :param selected: Позиции пользователей из select_users. None — все пользователи дампа.
+        :param store: Собрать пользователей в представление SEEDS.STORE (store). False — SeedsResult,
+                      например, чтобы мастер Locust отправил пользователей воркерам.
+        :return: Объект SeedsResult, CompactSeedsResult или MappedSeedsResult.
+        """
+        if settings.seeds.dump_format == SeedsDumpFormat.MMAP:
+            return load_seeds_mapped(scenario=self.dump_name, indexes=selected)
+
+        users = self.iter_selected_users(selected)
+        return self.store(users) if store else SeedsResult(users=list(users))
+
+    def verify(
+            self,
+            result: SeedsResult | CompactSeedsResult | MappedSeedsResult
+    ) -> SeedsResult | CompactSeedsResult | MappedSeedsResult | None:
+        """
+        Проверяет, что пользователи результата существуют на стенде (SEEDS.VERIFY_*).
+
+        :param result: Загруженный результат сидинга.
+        :return: Результат без отсутствующих на стенде пользователей или None, если их доля
+                 больше SEEDS.VERIFY_MAX_DEAD и нужен пересидинг.
+        """
+        if isinstance(result, SeedsResult):
+            get_user, size = result.users.__getitem__, len(result.users)
+        else:
+            get_user, size = result.get_user, len(result)
+
+        report = build_seeds_verifier().verify(get_user, size, sample=settings.seeds.verify_sample)
+        logger.info(
+            f"[{self.scenario}] Seeding data verified: {report.checked}/{report.total} users checked, "
+            f"{len(report.dead)} missing on the stand ({report.dead_share:.1%}), {report.elapsed:.2f}s."
+        )
+        if report.dead_share > settings.seeds.verify_max_dead:
+            return None
+        if not report.dead:
+            return result
+
+        dead = set(report.dead)
+        alive = [index for index in range(size) if index not in dead]
+        if isinstance(result, SeedsResult):
+            return SeedsResult(users=[result.users[index] for index in alive])
+        if isinstance(result, CompactSeedsResult):
+            return CompactSeedsResult.from_users(result.get_user(index) for index in alive)
+
+        return load_seeds_mapped(scenario=self.dump_name, indexes=[result.indexes[index] for index in alive])
+
+    def load(self, store: bool = True) -> SeedsResult | CompactSeedsResult | MappedSeedsResult:
         """
         Загружает результаты сидинга из файла.
-        :return: Объект SeedsResult, содержащий данные, загруженные из файла.
+        При SEEDS.VERIFY=true пользователи проверяются на стенде: отсутствующие исключаются,
+        а если их слишком много (дамп пережил сброс базы стенда), выполняется пересидинг.
+        Использование пользователей общего пула учитывается один раз, для итоговой выборки.
+        :param store: Собрать пользователей в представление SEEDS.STORE. False — SeedsResult (см. load_result).
+        :return: Объект SeedsResult, CompactSeedsResult или MappedSeedsResult с данными из файла.
         """
         logger.info(f"[{self.scenario}] Loading seeding result from file.")
-        result = load_seeds_result(scenario=self.scenario)
+        selected = self.select_users(record=False)
+        result = self.load_result(selected, store=store)
+
+        if settings.seeds.verify:
+            verified = self.verify(result)
+            if verified is None:
+                logger.warning(f"[{self.scenario}] Seeding dump is stale for the stand, reseeding.")
+                self.build(force=True)
+                selected = self.select_users(record=False)
+                verified = self.load_result(selected, store=store)
+            result = verified
+
+        self.record_users(selected)
+
         logger.info(f"[{self.scenario}] Seeding result loaded successfully.")
         return result
 
-    def build(self) -> None:
+    def build_async(self) -> None:
+        """
+        Генерирует данные асинхронным сидером (grpc.aio) в отдельном процессе и сохраняет результат.
+
+        Отдельный процесс нужен потому, что текущий процесс уже работает под gevent
+        (Locust и gRPC-клиенты), а asyncio и grpc.aio с gevent несовместимы.
+        План передаётся в дочерний процесс через stdin, журнал сидинга ведёт дочерний процесс.
+        """
+        subprocess.run(
+            [
+                sys.executable, "-m", "seeds.async_builder",
+                "--scenario", self.dump_name,
+                "--protocol", "grpc",
+                "--fingerprint", self.fingerprint,
+                "--dump-format", settings.seeds.dump_format,
+                "--compression", settings.seeds.compression,
+                # Статистика хранится под именем сценария, как у движка gevent: по ней оценивается план
+                "--stats-name", self.scenario
+            ],
+            input=self.plan.model_dump_json(),
+            text=True,
+            check=True
+        )
+
+    def count_missing_users(self) -> int:
+        """
+        Считает, сколько пользователей создаст сидинг: ноль, если актуальный дамп уже есть.
+        Пользователи из журнала прерванного сидинга и из общего пула повторно не создаются.
+        """
+        if self.is_built():
+            return 0
+
+        existing = len(load_seeds_journal(scenario=self.dump_name, fingerprint=self.fingerprint))
+        if not existing and settings.seeds.registry:
+            meta = load_seeds_meta(
+                scenario=self.dump_name, dump_format=settings.seeds.dump_format, compression=settings.seeds.compression
+            )
+            if meta and meta.fingerprint == self.fingerprint and not meta.is_expired(settings.seeds.ttl):
+                existing = meta.users or 0
+
+        return max(self.plan.users.count - existing, 0)
+
+    def estimate(self, users: int | None = None) -> SeedsPlanEstimate:
+        """
+        Оценивает план сидинга по графу зависимостей вызовов gateway.
+        Длительности вызовов берутся из статистики прошлого сидинга (среднее), если она есть.
+
+        :param users: Сколько пользователей оценить. По умолчанию — все пользователи плана.
+        :return: Оценка плана.
+        """
+        stats = load_seeds_stats(scenario=self.scenario)
+        latencies = {rpc: summary.avg_ms / 1000 for rpc, summary in stats.rpc.items()} if stats else None
+
+        return estimate_seeds_graph(
+            graph=compile_seeds_plan(self.plan.users),
+            users=self.plan.users.count if users is None else users,
+            max_concurrency=settings.seeds.max_concurrency,
+            rpc_concurrency=settings.seeds.rpc_concurrency,
+            latencies=latencies,
+            rps_limit=settings.seeds.rps_limit
+        )
+
+    def dry_run(self) -> SeedsPlanEstimate:
+        """
+        Выводит в лог, сколько вызовов gateway каждого типа выполнит сидинг, сколько сущностей
+        он создаст и сколько времени займёт, не выполняя ни одного запроса.
+
+        :return: Оценка для пользователей, которых сидинг действительно создаст.
+        """
+        estimate = self.estimate(users=self.count_missing_users())
+        rpc = "\n".join(f"  {name}: {count}" for name, count in sorted(estimate.rpc.items()))
+        entities = ", ".join(f"{name} {count}" for name, count in estimate.entities.items())
+
+        logger.info(
+            f"[{self.scenario}] Seeding dry run: {estimate.users}/{self.plan.users.count} users to create, "
+            f"{estimate.rpc_count} RPCs:\n{rpc}\n"
+            f"Entities: {entities}\n"
+            f"Estimated wall time: {estimate.lower_bound:.1f}s "
+            f"(critical path {estimate.critical_path:.3f}s, sequential {estimate.work:.1f}s, "
+            f"{'latencies of the last seeding' if estimate.measured else 'default latencies'})"
+        )
+        return estimate
+
+    def prepare_shared_pool(self, force: bool) -> None:
+        """
+        Готовит общий пул к сидингу. Если в актуальном пуле меньше пользователей, чем нужно сценарию,
+        существующие пользователи записываются в журнал сидинга, и билдер досоздаёт только недостающих.
+        Если пул создаётся заново, его счётчики использования сбрасываются.
+
+        :param force: Пул создаётся заново, даже если актуальный пул существует.
+        """
+        if load_seeds_journal(scenario=self.dump_name, fingerprint=self.fingerprint):
+            # Прерванный сидинг пула продолжится по журналу
+            return
+
+        meta = load_seeds_meta(
+            scenario=self.dump_name, dump_format=settings.seeds.dump_format, compression=settings.seeds.compression
+        )
+        if force or meta is None or meta.fingerprint != self.fingerprint or meta.is_expired(settings.seeds.ttl):
+            save_seeds_usage(usage=SeedsUsage(), scenario=self.dump_name)
+            return
+
+        existing = 0
+        with open_seeds_journal(scenario=self.dump_name, fingerprint=self.fingerprint) as writer:
+            for user in self.iter_dump_users():
+                writer.write(user)
+                existing += 1
+
+        logger.info(
+            f"[{self.scenario}] Topping up shared pool {self.dump_name}: {existing} users exist, "
+            f"{max(self.plan.users.count - existing, 0)} to create."
+        )
+
+    def build(self, force: bool = False, on_user_built: Callable[[SeedUserResult], None] | None = None) -> None:
         """
         Генерирует данные с помощью билдера, используя план сидинга, и сохраняет результат.
+        Движок сидинга (gevent или asyncio) выбирается настройкой SEEDS.ENGINE.
+
+        Если для того же плана и gateway уже есть неустаревший дамп, сидинг пропускается.
+        При SEEDS.DRY_RUN=true вместо сидинга выводится оценка плана и процесс завершается.
+        При SEEDS.REGISTRY=true используется общий пул сценариев с тем же планом пользователя:
+        при нехватке пользователей пул пополняется.
+        :param force: Выполнить сидинг заново, даже если актуальный дамп существует.
+        :param on_user_built: Вызывается для каждого готового пользователя, включая восстановленных
+                              из журнала (только для движка gevent). Используется конвейерным сидингом.
         """
+        if settings.seeds.dry_run:
+            self.dry_run()
+            # Сухой прогон завершает процесс до обращений к gateway
+            sys.exit(0)
+
+        if not force and self.is_built():
+            logger.info(f"[{self.scenario}] Valid seeding dump found for current plan, skipping seeding.")
+            return
+
         # Преобразуем план сидинга в JSON для логов (без значений по умолчанию)
         plan_json = self.plan.model_dump_json(indent=2, exclude_defaults=True)
         # Логируем начало генерации
         logger.info(f"[{self.scenario}] Starting seeding data generation for plan: {plan_json}")
-        # Запускаем генерацию
-        result = self.builder.build(self.plan)
-        # Логируем завершение генерации
+        estimate = self.estimate()
+        logger.info(
+            f"[{self.scenario}] Seeding estimate: {estimate.rpc_count} RPCs, "
+            f"critical path {estimate.critical_path_rpcs} RPCs ({estimate.critical_path:.3f}s), "
+            f"lower bound {estimate.lower_bound:.1f}s"
+            f"{'' if estimate.measured else ' (default latencies)'}"
+        )
+
+        if settings.seeds.registry:
+            self.prepare_shared_pool(force=force)
+
+        if settings.seeds.engine == SeedsEngine.ASYNCIO and settings.seeds.backend == SeedsBackend.SERVICES:
+            logger.warning(f"[{self.scenario}] Seeding via internal services requires gevent engine, using gevent.")
+        elif settings.seeds.engine == SeedsEngine.ASYNCIO:
+            # Асинхронный сидер сам сохраняет результат в файл
+            self.build_async()
+            logger.info(f"[{self.scenario}] Seeding data generation completed.")
+            save_seeds_meta(
+                meta=SeedsMeta(fingerprint=self.fingerprint, users=self.plan.users.count),
+                scenario=self.dump_name
+            )
+            return
+
+        # Если предыдущий сидинг этого плана прервался, продолжаем с последнего зафиксированного пользователя
+        journal = load_seeds_journal(scenario=self.dump_name, fingerprint=self.fingerprint)
+        if journal:
+            logger.info(f"[{self.scenario}] Resuming seeding from journal: {len(journal)} users already created.")
+
+        on_pool_user = on_user_built
+        selected = None
+        if on_user_built and settings.seeds.registry:
+            # Конвейер получает только пользователей общего пула, выбранных для запуска, как при загрузке дампа.
+            # Позиции пользователей в пуле — порядок журнала: сначала восстановленные, затем новые
+            selected = self.select_users(record=False, size=max(len(journal), self.plan.users.count))
+            positions, selected_positions = itertools.count(), set(selected)
+
+            def on_pool_user(user: SeedUserResult) -> None:
+                if next(positions) in selected_positions:
+                    on_user_built(user)
+
+        if on_pool_user:
+            for user in journal:
+                on_pool_user(user)
+
+        # Запускаем генерацию, фиксируя в журнале каждого полностью созданного пользователя
+        with open_seeds_journal(scenario=self.dump_name, fingerprint=self.fingerprint, resume=bool(journal)) as writer:
+            def on_built(user: SeedUserResult) -> None:
+                writer.write(user)
+                if on_pool_user:
+                    on_pool_user(user)
+
+            result = self.builder.build(self.plan, completed=journal, on_user_built=on_built)
+        # Логируем завершение генерации и итоговую статистику сидинга
         logger.info(f"[{self.scenario}] Seeding data generation completed.")
-        # Сохраняем результат
-        self.save(result)
+        self.builder.stats.report()
+        save_seeds_stats(summary=self.builder.stats.summary(), scenario=self.scenario)
+
+        if settings.seeds.dump_format == SeedsDumpFormat.JSONL:
+            # Журнал уже содержит всех пользователей в формате JSONL и становится дампом
+            commit_seeds_journal(scenario=self.dump_name, compression=settings.seeds.compression)
+        else:
+            self.save(result)
+            # Журнал больше не нужен: итоговый результат сохранён
+            remove_seeds_journal(scenario=self.dump_name)
+
+        # Сохраняем отпечаток плана, для которого получен результат
+        save_seeds_meta(meta=SeedsMeta(fingerprint=self.fingerprint, users=len(result.users)), scenario=self.dump_name)
+        # Использование пользователей, выданных конвейеру, учитывается так же, как при загрузке дампа
+        self.record_users(selected)
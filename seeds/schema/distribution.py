@@ -0,0 +1,161 @@
+import bisect
+import itertools
+import math
+import random
+from functools import cached_property
+from typing import Annotated, Literal
+
+from pydantic import BaseModel, Field, model_validator
+
+# Poisson с большим средним сэмплируется суммой независимых Poisson со средним не больше этого значения:
+# exp(-POISSON_CHUNK) не должно уходить в ноль
+POISSON_CHUNK = 500.0
+
+
+class SeedsFixedDistribution(BaseModel):
+    """
+    Фиксированное количество — то же, что поле count плана.
+
+    Attributes:
+        count (int): Количество сущностей.
+    """
+    kind: Literal["fixed"] = "fixed"
+    count: int = Field(default=0, ge=0)
+
+    @property
+    def mean(self) -> float:
+        return self.count
+
+    def sample(self, rng: random.Random) -> int:
+        return self.count
+
+
+class SeedsUniformDistribution(BaseModel):
+    """
+    Равномерное распределение целых чисел на отрезке [low, high].
+
+    Attributes:
+        low (int): Минимальное количество.
+        high (int): Максимальное количество.
+    """
+    kind: Literal["uniform"] = "uniform"
+    low: int = Field(default=0, ge=0)
+    high: int = Field(ge=0)
+
+    @model_validator(mode="after")
+    def check_bounds(self) -> "SeedsUniformDistribution":
+        if self.low > self.high:
+            raise ValueError("low must not exceed high")
+        return self
+
+    @property
+    def mean(self) -> float:
+        return (self.low + self.high) / 2
+
+    def sample(self, rng: random.Random) -> int:
+        return rng.randint(self.low, self.high)
+
+
+class SeedsPoissonDistribution(BaseModel):
+    """
+    Распределение Пуассона: количество событий со средним mean, при необходимости ограниченное сверху.
+
+    Attributes:
+        mean (float): Среднее количество.
+        max (int | None): Максимальное количество. None — без ограничения.
+    """
+    kind: Literal["poisson"] = "poisson"
+    mean: float = Field(ge=0)
+    max: int | None = Field(default=None, ge=0)
+
+    def sample(self, rng: random.Random) -> int:
+        count, remaining = 0, self.mean
+        while remaining > 0:
+            chunk = min(remaining, POISSON_CHUNK)
+            remaining -= chunk
+
+            # Алгоритм Кнута: перемножаем равномерные числа, пока произведение не станет меньше exp(-chunk)
+            threshold, product = math.exp(-chunk), rng.random()
+            while product > threshold:
+                count += 1
+                product *= rng.random()
+
+        return count if self.max is None else min(count, self.max)
+
+
+class SeedsZipfDistribution(BaseModel):
+    """
+    Распределение Ципфа на отрезке [1, max]: вероятность количества k пропорциональна 1 / k^exponent.
+    Большинство счетов получают несколько сущностей, а немногие «тяжёлые» — до max.
+
+    Attributes:
+        exponent (float): Показатель степени. Чем он больше, тем реже встречаются тяжёлые счета.
+        max (int): Максимальное количество.
+    """
+    kind: Literal["zipf"] = "zipf"
+    exponent: float = Field(default=1.0, gt=0)
+    max: int = Field(ge=1)
+
+    @cached_property
+    def cum_weights(self) -> list[float]:
+        return list(itertools.accumulate(k ** -self.exponent for k in range(1, self.max + 1)))
+
+    @property
+    def mean(self) -> float:
+        return sum(k ** (1 - self.exponent) for k in range(1, self.max + 1)) / self.cum_weights[-1]
+
+    def sample(self, rng: random.Random) -> int:
+        return bisect.bisect_left(self.cum_weights, rng.random() * self.cum_weights[-1]) + 1
+
+
+class SeedsHistogramBin(BaseModel):
+    """
+    Корзина эмпирической гистограммы: доля weight счетов с количеством от low до high.
+
+    Attributes:
+        low (int): Минимальное количество в корзине.
+        high (int): Максимальное количество в корзине.
+        weight (float): Относительный вес корзины (например, доля счетов в продакшене).
+    """
+    low: int = Field(ge=0)
+    high: int = Field(ge=0)
+    weight: float = Field(gt=0)
+
+
+class SeedsHistogramDistribution(BaseModel):
+    """
+    Эмпирическая гистограмма: корзина выбирается по весу, количество внутри корзины — равномерно.
+
+    Attributes:
+        bins (list[SeedsHistogramBin]): Корзины гистограммы.
+    """
+    kind: Literal["histogram"] = "histogram"
+    bins: list[SeedsHistogramBin] = Field(min_length=1)
+
+    @model_validator(mode="after")
+    def check_bins(self) -> "SeedsHistogramDistribution":
+        if any(item.low > item.high for item in self.bins):
+            raise ValueError("bin low must not exceed high")
+        return self
+
+    @cached_property
+    def cum_weights(self) -> list[float]:
+        return list(itertools.accumulate(item.weight for item in self.bins))
+
+    @property
+    def mean(self) -> float:
+        return sum(item.weight * (item.low + item.high) / 2 for item in self.bins) / self.cum_weights[-1]
+
+    def sample(self, rng: random.Random) -> int:
+        item = self.bins[bisect.bisect_left(self.cum_weights, rng.random() * self.cum_weights[-1])]
+        return rng.randint(item.low, item.high)
+
+
+SeedsDistribution = Annotated[
+    SeedsFixedDistribution
+    | SeedsUniformDistribution
+    | SeedsPoissonDistribution
+    | SeedsZipfDistribution
+    | SeedsHistogramDistribution,
+    Field(discriminator="kind")
+]
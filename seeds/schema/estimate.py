@@ -0,0 +1,29 @@
+from pydantic import BaseModel, Field
+
+
+class SeedsPlanEstimate(BaseModel):
+    """
+    Оценка плана сидинга, построенная по графу зависимостей вызовов gateway.
+
+    Attributes:
+        users (int): Количество пользователей в оценке.
+        rpc_count (int): Общее количество вызовов gateway.
+        rpc (dict[str, int]): Количество вызовов по каждому методу.
+        entities (dict[str, int]): Количество создаваемых сущностей по типам (users, accounts, cards, operations).
+        critical_path_rpcs (int): Длина критического пути одного пользователя в вызовах
+            (например, create_user → open_credit_card_account → make_purchase_operation = 3).
+        critical_path (float): Длительность критического пути одного пользователя в секундах.
+        work (float): Суммарная длительность всех вызовов в секундах (при последовательном сидинге).
+        lower_bound (float): Нижняя оценка длительности сидинга в секундах с учётом лимитов конкурентности
+            и потолка запросов в секунду: не меньше критического пути и не меньше work, делённого на лимит.
+        measured (bool): Длительности вызовов взяты из статистики прошлого сидинга, а не по умолчанию.
+    """
+    users: int
+    rpc_count: int
+    rpc: dict[str, int] = Field(default_factory=dict)
+    entities: dict[str, int] = Field(default_factory=dict)
+    critical_path_rpcs: int
+    critical_path: float
+    work: float
+    lower_bound: float
+    measured: bool = False
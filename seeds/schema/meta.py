@@ -0,0 +1,32 @@
+from datetime import datetime, timezone
+
+from pydantic import BaseModel, Field
+
+
+class SeedsMeta(BaseModel):
+    """
+    Метаданные дампа сидинга, сохраняемые рядом с файлом dumps/{scenario}_seeds.json.
+
+    Attributes:
+        fingerprint (str): Отпечаток плана сидинга и целевого gateway, для которых создан дамп.
+        created_at (datetime): Время создания дампа (UTC).
+        users (int | None): Количество пользователей в дампе.
+    """
+    fingerprint: str
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    users: int | None = None
+
+    def is_expired(self, ttl: float | None) -> bool:
+        """
+        Проверяет, истёк ли срок жизни дампа.
+
+        Args:
+            ttl: Срок жизни дампа в секундах. None — дамп не устаревает.
+
+        Returns:
+            bool: True, если дамп старше ttl.
+        """
+        if ttl is None:
+            return False
+
+        return (datetime.now(timezone.utc) - self.created_at).total_seconds() > ttl
@@ -1,5 +1,7 @@
 from pydantic import BaseModel, Field
 
+from seeds.schema.distribution import SeedsDistribution
+
 
 class SeedCardsPlan(BaseModel):
     """
@@ -7,8 +9,11 @@ class SeedCardsPlan(BaseModel):
 
     Attributes:
         count (int): Количество карт (виртуальных или физических), которые нужно создать.
+        distribution (SeedsDistribution | None): Распределение количества карт, из которого количество
+            выбирается отдельно для каждого счёта. Если задано, count не используется.
     """
     count: int = 0
+    distribution: SeedsDistribution | None = None
 
 
 class SeedOperationsPlan(BaseModel):
@@ -17,8 +22,12 @@ class SeedOperationsPlan(BaseModel):
 
     Attributes:
         count (int): Количество операций (например, пополнений или покупок), которые нужно сгенерировать.
+        distribution (SeedsDistribution | None): Распределение количества операций, из которого количество
+            выбирается отдельно для каждого счёта (например, Zipf для редких счетов с тысячами операций).
+            Если задано, count не используется.
     """
     count: int = 0
+    distribution: SeedsDistribution | None = None
 
 
 class SeedAccountsPlan(BaseModel):
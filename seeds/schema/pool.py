@@ -0,0 +1,31 @@
+from pydantic import BaseModel
+
+
+class SeedsPoolStats(BaseModel):
+    """
+    Счётчики нагрузки на пул сид-пользователей.
+
+    Attributes:
+        size (int): Общее количество пользователей в пуле.
+        leased (int): Количество пользователей, выданных эксклюзивно и ещё не возвращённых.
+        max_leased (int): Максимальное количество одновременно выданных пользователей.
+        acquired (int): Сколько раз пользователи были выданы эксклюзивно.
+        released (int): Сколько раз пользователи были возвращены в пул.
+        recycled (int): Сколько раз был выдан уже занятый пользователь (политика recycle).
+        waits (int): Сколько раз приходилось ждать освобождения пользователя (политика block).
+        wait_time (float): Суммарное время ожидания в секундах.
+        exhausted (int): Сколько раз выдача завершилась ошибкой из-за исчерпания пула.
+    """
+    size: int
+    leased: int = 0
+    max_leased: int = 0
+    acquired: int = 0
+    released: int = 0
+    recycled: int = 0
+    waits: int = 0
+    wait_time: float = 0.0
+    exhausted: int = 0
+
+    @property
+    def available(self) -> int:
+        return self.size - self.leased
@@ -0,0 +1,13 @@
+from pydantic import BaseModel, Field
+
+
+class SeedsUsage(BaseModel):
+    """
+    Счётчики использования пользователей общего пула сидинга.
+
+    Attributes:
+        usage (list[int]): Сколько запусков использовали каждого пользователя пула (по индексу в дампе).
+        runs (dict[str, int]): Количество запусков, взявших пользователей из пула, по сценариям.
+    """
+    usage: list[int] = Field(default_factory=list)
+    runs: dict[str, int] = Field(default_factory=dict)
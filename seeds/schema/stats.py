@@ -0,0 +1,50 @@
+from pydantic import BaseModel, Field
+
+
+class SeedsRPCStatsSummary(BaseModel):
+    """
+    Статистика одного вызова gateway за сидинг.
+
+    Attributes:
+        count (int): Количество вызовов.
+        errors (int): Количество вызовов, завершившихся ошибкой.
+        rate (float): Вызовов в секунду.
+        avg_ms (float): Средняя длительность вызова, мс.
+        min_ms (float): Минимальная длительность вызова, мс.
+        max_ms (float): Максимальная длительность вызова, мс.
+        p50_ms (float): 50-й процентиль длительности, мс.
+        p90_ms (float): 90-й процентиль длительности, мс.
+        p95_ms (float): 95-й процентиль длительности, мс.
+        p99_ms (float): 99-й процентиль длительности, мс.
+        avg_wait_ms (float): Среднее ожидание свободного слота конкурентности до вызова, мс.
+            Если ожидание велико при малой длительности вызовов, узкое место — наш лимит, а не gateway.
+    """
+    count: int
+    errors: int
+    rate: float
+    avg_ms: float
+    min_ms: float
+    max_ms: float
+    p50_ms: float
+    p90_ms: float
+    p95_ms: float
+    p99_ms: float
+    avg_wait_ms: float
+
+
+class SeedsStatsSummary(BaseModel):
+    """
+    Итоговая статистика сидинга, сохраняемая рядом с дампом.
+
+    Attributes:
+        elapsed (float): Длительность сидинга в секундах.
+        users (int): Количество пользователей, созданных за этот запуск.
+        users_rate (float): Пользователей в секунду.
+        entities (dict[str, int]): Количество созданных сущностей по типам (users, accounts, cards, operations).
+        rpc (dict[str, SeedsRPCStatsSummary]): Статистика по каждому вызову gateway.
+    """
+    elapsed: float
+    users: int
+    users_rate: float
+    entities: dict[str, int] = Field(default_factory=dict)
+    rpc: dict[str, SeedsRPCStatsSummary] = Field(default_factory=dict)
@@ -0,0 +1,22 @@
+from pydantic import BaseModel, Field
+
+
+class SeedsVerifyReport(BaseModel):
+    """
+    Результат проверки сид-пользователей на стенде перед запуском нагрузки.
+
+    Attributes:
+        total (int): Количество пользователей в загруженном результате.
+        checked (int): Количество проверенных пользователей (все или выборка).
+        dead (list[int]): Позиции пользователей в результате, которых нет на стенде
+            (GetUser вернул NOT_FOUND или GetAccounts не вернул какой-то из созданных счетов).
+        elapsed (float): Длительность проверки в секундах.
+    """
+    total: int
+    checked: int
+    dead: list[int] = Field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def dead_share(self) -> float:
+        return len(self.dead) / self.checked if self.checked else 0.0
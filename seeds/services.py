@@ -0,0 +1,114 @@
+"""
+Сидинг напрямую через внутренние сервисы (users, accounts, cards, operations) в обход gateway.
+
+SeedsServicesClient повторяет методы gateway-клиентов, которые использует граф сидинга
+(create_user, open_*_account, issue_*_card, make_*_operation), и возвращает ответы той же формы,
+поэтому SeedsBuilder и SeedsResult не меняются.
+
+Отличия от gateway: карточный счёт создаётся двумя вызовами (CreateAccount и CreateCard),
+а операции только записываются в OperationsService — баланс счёта не пересчитывается.
+"""
+from clients.grpc.services.accounts.client import AccountsGRPCClient, build_accounts_grpc_client
+from clients.grpc.services.cards.client import CardsGRPCClient, build_cards_grpc_client
+from clients.grpc.services.operations.client import OperationsGRPCClient, build_operations_grpc_client
+from clients.grpc.services.users.client import UsersGRPCClient, build_users_grpc_client
+from contracts.services.accounts.account_pb2 import AccountType
+from contracts.services.accounts.rpc_create_account_pb2 import CreateAccountResponse
+from contracts.services.cards.card_pb2 import CardType
+from contracts.services.cards.rpc_create_card_pb2 import CreateCardResponse
+from contracts.services.gateway.accounts.account_pb2 import AccountView
+from contracts.services.gateway.accounts.rpc_open_credit_card_account_pb2 import OpenCreditCardAccountResponse
+from contracts.services.gateway.accounts.rpc_open_debit_card_account_pb2 import OpenDebitCardAccountResponse
+from contracts.services.operations.operation_pb2 import OperationType
+from contracts.services.operations.rpc_create_operation_pb2 import CreateOperationResponse
+from contracts.services.users.rpc_create_user_pb2 import CreateUserResponse
+from tools.fakers import fake
+
+
+class SeedsServicesClient:
+    """
+    Клиент сидинга поверх внутренних сервисов с интерфейсом gateway-клиентов.
+
+    :param users_client: Клиент UsersService.
+    :param accounts_client: Клиент AccountsService.
+    :param cards_client: Клиент CardsService.
+    :param operations_client: Клиент OperationsService.
+    """
+
+    def __init__(
+            self,
+            users_client: UsersGRPCClient,
+            accounts_client: AccountsGRPCClient,
+            cards_client: CardsGRPCClient,
+            operations_client: OperationsGRPCClient
+    ):
+        self.users_client = users_client
+        self.accounts_client = accounts_client
+        self.cards_client = cards_client
+        self.operations_client = operations_client
+
+    def create_user(self) -> CreateUserResponse:
+        return self.users_client.create_user()
+
+    def open_savings_account(self, user_id: str) -> CreateAccountResponse:
+        return self.accounts_client.create_account(user_id, AccountType.ACCOUNT_TYPE_SAVINGS)
+
+    def open_deposit_account(self, user_id: str) -> CreateAccountResponse:
+        return self.accounts_client.create_account(user_id, AccountType.ACCOUNT_TYPE_DEPOSIT)
+
+    def open_card_account(self, user_id: str, account_type: AccountType.ValueType) -> AccountView:
+        """
+        Открывает карточный счёт так же, как gateway: счёт сразу с виртуальной картой.
+
+        :param user_id: Идентификатор пользователя.
+        :param account_type: Тип счёта (дебетовый или кредитный).
+        :return: Счёт с выпущенной картой в формате gateway.
+        """
+        account = self.accounts_client.create_account(user_id, account_type).account
+        card = self.cards_client.create_card(account.id, CardType.CARD_TYPE_VIRTUAL).card
+
+        return AccountView(id=account.id, type=account.type, cards=[card], status=account.status, balance=account.balance)
+
+    def open_debit_card_account(self, user_id: str) -> OpenDebitCardAccountResponse:
+        account = self.open_card_account(user_id, AccountType.ACCOUNT_TYPE_DEBIT_CARD)
+        return OpenDebitCardAccountResponse(account=account)
+
+    def open_credit_card_account(self, user_id: str) -> OpenCreditCardAccountResponse:
+        account = self.open_card_account(user_id, AccountType.ACCOUNT_TYPE_CREDIT_CARD)
+        return OpenCreditCardAccountResponse(account=account)
+
+    def issue_physical_card(self, user_id: str, account_id: str) -> CreateCardResponse:
+        return self.cards_client.create_card(account_id, CardType.CARD_TYPE_PHYSICAL)
+
+    def issue_virtual_card(self, user_id: str, account_id: str) -> CreateCardResponse:
+        return self.cards_client.create_card(account_id, CardType.CARD_TYPE_VIRTUAL)
+
+    def make_top_up_operation(self, card_id: str, account_id: str) -> CreateOperationResponse:
+        return self.operations_client.create_operation(card_id, account_id, OperationType.OPERATION_TYPE_TOP_UP)
+
+    def make_purchase_operation(self, card_id: str, account_id: str) -> CreateOperationResponse:
+        return self.operations_client.create_operation(
+            card_id, account_id, OperationType.OPERATION_TYPE_PURCHASE, category=fake.category()
+        )
+
+    def make_transfer_operation(self, card_id: str, account_id: str) -> CreateOperationResponse:
+        return self.operations_client.create_operation(card_id, account_id, OperationType.OPERATION_TYPE_TRANSFER)
+
+    def make_cash_withdrawal_operation(self, card_id: str, account_id: str) -> CreateOperationResponse:
+        return self.operations_client.create_operation(
+            card_id, account_id, OperationType.OPERATION_TYPE_CASH_WITHDRAWAL
+        )
+
+
+def build_seeds_services_client() -> SeedsServicesClient:
+    """
+    Фабрика клиента сидинга по адресам внутренних сервисов из настроек (*_GRPC_CLIENT).
+
+    :return: Клиент сидинга в обход gateway.
+    """
+    return SeedsServicesClient(
+        users_client=build_users_grpc_client(),
+        accounts_client=build_accounts_grpc_client(),
+        cards_client=build_cards_grpc_client(),
+        operations_client=build_operations_grpc_client()
+    )
@@ -0,0 +1,158 @@
+import time
+from collections import defaultdict
+
+from seeds.dag import SEEDS_RPC, count_seeds_entities
+from seeds.schema.stats import SeedsStatsSummary, SeedsRPCStatsSummary
+from tools.logger import get_logger
+
+logger = get_logger("SEEDS_STATS")
+
+PERCENTILES = (0.5, 0.9, 0.95, 0.99)
+
+
+def round_latency(latency_ms: float) -> int:
+    """
+    Округляет длительность для гистограммы так же, как Locust: до 1 мс до 100 мс,
+    до 10 мс до 1 с и до 100 мс дальше. Количество корзин не растёт с числом вызовов.
+    """
+    if latency_ms < 100:
+        return round(latency_ms)
+    if latency_ms < 1000:
+        return int(round(latency_ms, -1))
+
+    return int(round(latency_ms, -2))
+
+
+class SeedsRPCStats:
+    """
+    Счётчики и гистограмма длительностей одного вызова gateway.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.total_wait_ms = 0.0
+        self.min_ms = float("inf")
+        self.max_ms = 0.0
+        self.histogram: dict[int, int] = defaultdict(int)
+
+    def record(self, latency_ms: float, wait_ms: float, error: bool) -> None:
+        self.count += 1
+        self.errors += int(error)
+        self.total_ms += latency_ms
+        self.total_wait_ms += wait_ms
+        self.min_ms = min(self.min_ms, latency_ms)
+        self.max_ms = max(self.max_ms, latency_ms)
+        self.histogram[round_latency(latency_ms)] += 1
+
+    def percentile(self, percent: float) -> float:
+        """
+        Процентиль длительности по гистограмме. Корзина гистограммы округлена, поэтому значение
+        ограничивается реальными минимумом и максимумом: p50 не может оказаться меньше min_ms.
+        """
+        threshold = self.count * percent
+        processed = 0
+        for latency, count in sorted(self.histogram.items()):
+            processed += count
+            if processed >= threshold:
+                return round(min(max(latency, self.min_ms), self.max_ms), 2)
+
+        return 0
+
+    def summary(self, elapsed: float) -> SeedsRPCStatsSummary:
+        p50, p90, p95, p99 = (self.percentile(percent) for percent in PERCENTILES)
+        return SeedsRPCStatsSummary(
+            count=self.count,
+            errors=self.errors,
+            rate=round(self.count / elapsed, 2),
+            avg_ms=round(self.total_ms / self.count, 2),
+            min_ms=round(self.min_ms, 2),
+            max_ms=round(self.max_ms, 2),
+            p50_ms=p50,
+            p90_ms=p90,
+            p95_ms=p95,
+            p99_ms=p99,
+            avg_wait_ms=round(self.total_wait_ms / self.count, 2)
+        )
+
+
+class SeedsStats:
+    """
+    Инструментирование сидинга: счётчики сущностей, скорость создания пользователей, ETA
+    и гистограммы длительностей каждого вызова gateway.
+
+    Билдер вызывает record для каждого запроса и user_built для каждого готового пользователя.
+    Раз в report_interval секунд прогресс выводится в лог.
+
+    :param total: Сколько пользователей нужно создать за этот запуск.
+    :param report_interval: Интервал между отчётами в секундах.
+    """
+
+    def __init__(self, total: int = 0, report_interval: float = 10.0):
+        self.total = total
+        self.report_interval = report_interval
+
+        self.users = 0
+        self.rpc: dict[str, SeedsRPCStats] = defaultdict(SeedsRPCStats)
+
+        self.started = time.perf_counter()
+        self.reported = self.started
+
+    @property
+    def elapsed(self) -> float:
+        return max(time.perf_counter() - self.started, 1e-9)
+
+    def record(self, rpc: str, latency: float, wait: float = 0.0, error: bool = False) -> None:
+        """
+        Фиксирует вызов gateway.
+
+        :param rpc: Имя метода клиента (например, create_user).
+        :param latency: Длительность вызова в секундах.
+        :param wait: Время ожидания слота конкурентности перед вызовом в секундах.
+        :param error: Вызов завершился ошибкой.
+        """
+        self.rpc[rpc].record(latency * 1000, wait * 1000, error)
+        self.maybe_report()
+
+    @property
+    def entities(self) -> dict[str, int]:
+        """
+        Созданные сущности по успешным вызовам gateway. Считаются так же, как в оценке плана
+        (count_seeds_entities): карточный счёт создаёт и счёт, и карту.
+        """
+        return count_seeds_entities(
+            {rpc: stats.count - stats.errors for rpc, stats in self.rpc.items() if rpc in SEEDS_RPC}
+        )
+
+    def user_built(self) -> None:
+        self.users += 1
+
+    def maybe_report(self) -> None:
+        now = time.perf_counter()
+        if now - self.reported >= self.report_interval:
+            self.reported = now
+            self.report()
+
+    def report(self) -> None:
+        rate = self.users / self.elapsed
+        eta = (self.total - self.users) / rate if rate else float("inf")
+        rpc = ", ".join(
+            f"{name} p50={stats.percentile(0.5)}ms p95={stats.percentile(0.95)}ms"
+            for name, stats in sorted(self.rpc.items())
+        )
+
+        logger.info(
+            f"Seeding progress: {self.users}/{self.total} users, {rate:.1f} users/s, "
+            f"ETA {eta:.0f}s, entities {self.entities}; {rpc}"
+        )
+
+    def summary(self) -> SeedsStatsSummary:
+        elapsed = self.elapsed
+        return SeedsStatsSummary(
+            elapsed=round(elapsed, 3),
+            users=self.users,
+            users_rate=round(self.users / elapsed, 2),
+            entities=self.entities,
+            rpc={name: stats.summary(elapsed) for name, stats in sorted(self.rpc.items())}
+        )
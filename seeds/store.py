@@ -0,0 +1,300 @@
+import random
+import sys
+from array import array
+from typing import Iterable, Iterator
+
+from seeds.schema.result import SeedsResult, SeedUserResult, SeedAccountResult
+
+# Порядок типов счетов, карт и операций внутри колонок смещений
+ACCOUNT_KINDS = ("deposit_accounts", "savings_accounts", "debit_card_accounts", "credit_card_accounts")
+CARD_KINDS = ("physical_cards", "virtual_cards")
+OPERATION_KINDS = ("top_up_operations", "purchase_operations", "transfer_operations", "cash_withdrawal_operations")
+
+UUID_SIZE = 16
+UUID_DASHES = (8, 13, 18, 23)
+
+
+def pack_uuid(value: str) -> bytes | None:
+    """
+    Упаковывает UUID в каноническом виде (36 символов, нижний регистр) в 16 байт.
+
+    :param value: Строковый идентификатор.
+    :return: 16 байт или None, если строка не является каноническим UUID.
+    """
+    if len(value) != 36 or any(value[index] != "-" for index in UUID_DASHES) or value != value.lower():
+        return None
+
+    try:
+        return bytes.fromhex(value.replace("-", ""))
+    except ValueError:
+        return None
+
+
+def unpack_uuid(raw: bytes | bytearray) -> str:
+    """
+    Восстанавливает строку UUID из 16 байт, упакованных pack_uuid.
+    """
+    value = raw.hex()
+    return f"{value[:8]}-{value[8:12]}-{value[12:16]}-{value[16:20]}-{value[20:]}"
+
+
+class SeedIdColumn:
+    """
+    Колонка идентификаторов. Пока все идентификаторы — канонические UUID, они хранятся
+    подряд в одном bytearray по 16 байт на значение. Если встречается идентификатор другого
+    формата, колонка переходит на список интернированных строк.
+    """
+    __slots__ = ("_uuids", "_strings")
+
+    def __init__(self):
+        self._uuids = bytearray()
+        self._strings: list[str] | None = None
+
+    def append(self, value: str) -> None:
+        if self._strings is None:
+            raw = pack_uuid(value)
+            if raw is not None:
+                self._uuids += raw
+                return
+
+            self._strings = [self[index] for index in range(len(self))]
+            self._uuids = bytearray()
+
+        self._strings.append(sys.intern(value))
+
+    def __getitem__(self, index: int) -> str:
+        if self._strings is not None:
+            return self._strings[index]
+
+        offset = index * UUID_SIZE
+        return unpack_uuid(self._uuids[offset:offset + UUID_SIZE])
+
+    def __len__(self) -> int:
+        if self._strings is not None:
+            return len(self._strings)
+
+        return len(self._uuids) // UUID_SIZE
+
+
+class SeedCardView:
+    """
+    Карта сидинга. Повторяет атрибуты SeedCardResult.
+    """
+    __slots__ = ("card_id",)
+
+    def __init__(self, card_id: str):
+        self.card_id = card_id
+
+
+class SeedOperationView:
+    """
+    Операция сидинга. Повторяет атрибуты SeedOperationResult.
+    """
+    __slots__ = ("operation_id",)
+
+    def __init__(self, operation_id: str):
+        self.operation_id = operation_id
+
+
+class SeedAccountView:
+    """
+    Представление счёта поверх колонок CompactSeedsResult. Повторяет атрибуты SeedAccountResult,
+    вложенные карты и операции создаются только при обращении к ним.
+    """
+    __slots__ = ("_store", "_index")
+
+    def __init__(self, store: "CompactSeedsResult", index: int):
+        self._store = store
+        self._index = index
+
+    @property
+    def account_id(self) -> str:
+        return self._store.account_ids[self._index]
+
+    def _cards(self, kind: int) -> list[SeedCardView]:
+        offsets = self._store.card_offsets
+        position = self._index * len(CARD_KINDS) + kind
+        return [
+            SeedCardView(self._store.card_ids[index])
+            for index in range(offsets[position], offsets[position + 1])
+        ]
+
+    def _operations(self, kind: int) -> list[SeedOperationView]:
+        offsets = self._store.operation_offsets
+        position = self._index * len(OPERATION_KINDS) + kind
+        return [
+            SeedOperationView(self._store.operation_ids[index])
+            for index in range(offsets[position], offsets[position + 1])
+        ]
+
+    @property
+    def physical_cards(self) -> list[SeedCardView]:
+        return self._cards(0)
+
+    @property
+    def virtual_cards(self) -> list[SeedCardView]:
+        return self._cards(1)
+
+    @property
+    def top_up_operations(self) -> list[SeedOperationView]:
+        return self._operations(0)
+
+    @property
+    def purchase_operations(self) -> list[SeedOperationView]:
+        return self._operations(1)
+
+    @property
+    def transfer_operations(self) -> list[SeedOperationView]:
+        return self._operations(2)
+
+    @property
+    def cash_withdrawal_operations(self) -> list[SeedOperationView]:
+        return self._operations(3)
+
+
+class SeedUserView:
+    """
+    Представление пользователя поверх колонок CompactSeedsResult. Повторяет атрибуты SeedUserResult.
+    """
+    __slots__ = ("_store", "_index")
+
+    def __init__(self, store: "CompactSeedsResult", index: int):
+        self._store = store
+        self._index = index
+
+    @property
+    def user_id(self) -> str:
+        return self._store.user_ids[self._index]
+
+    def _accounts(self, kind: int) -> list[SeedAccountView]:
+        offsets = self._store.account_offsets
+        position = self._index * len(ACCOUNT_KINDS) + kind
+        return [SeedAccountView(self._store, index) for index in range(offsets[position], offsets[position + 1])]
+
+    @property
+    def deposit_accounts(self) -> list[SeedAccountView]:
+        return self._accounts(0)
+
+    @property
+    def savings_accounts(self) -> list[SeedAccountView]:
+        return self._accounts(1)
+
+    @property
+    def debit_card_accounts(self) -> list[SeedAccountView]:
+        return self._accounts(2)
+
+    @property
+    def credit_card_accounts(self) -> list[SeedAccountView]:
+        return self._accounts(3)
+
+
+class CompactSeedsResult:
+    """
+    Компактное хранилище результата сидинга для больших пулов пользователей.
+
+    Вместо дерева pydantic-моделей идентификаторы хранятся в колонках (SeedIdColumn),
+    а вложенность описывается массивами смещений (array('I')): счета пользователя u вида k
+    лежат в диапазоне account_offsets[u * 4 + k] .. account_offsets[u * 4 + k + 1],
+    аналогично карты и операции счёта. Объекты SeedUserView/SeedAccountView создаются
+    только при выдаче пользователя и имеют тот же набор атрибутов, что и модели SeedsResult.
+
+    API выдачи пользователей совпадает с SeedsResult: get_next_user и get_random_user.
+    """
+
+    def __init__(self):
+        self.user_ids = SeedIdColumn()
+        self.account_ids = SeedIdColumn()
+        self.card_ids = SeedIdColumn()
+        self.operation_ids = SeedIdColumn()
+
+        self.account_offsets = array('I', [0])
+        self.card_offsets = array('I', [0])
+        self.operation_offsets = array('I', [0])
+
+        # Индекс первого невыданного пользователя для get_next_user
+        self.cursor = 0
+
+    def add_account(self, account: SeedAccountResult) -> None:
+        self.account_ids.append(account.account_id)
+
+        for kind in CARD_KINDS:
+            for card in getattr(account, kind):
+                self.card_ids.append(card.card_id)
+            self.card_offsets.append(len(self.card_ids))
+
+        for kind in OPERATION_KINDS:
+            for operation in getattr(account, kind):
+                self.operation_ids.append(operation.operation_id)
+            self.operation_offsets.append(len(self.operation_ids))
+
+    def add_user(self, user: SeedUserResult) -> None:
+        """
+        Добавляет пользователя в хранилище. Исходная модель после этого не нужна.
+
+        :param user: Пользователь со счетами, картами и операциями.
+        """
+        self.user_ids.append(user.user_id)
+
+        for kind in ACCOUNT_KINDS:
+            for account in getattr(user, kind):
+                self.add_account(account)
+            self.account_offsets.append(len(self.account_ids))
+
+    @classmethod
+    def from_users(cls, users: Iterable[SeedUserResult]) -> "CompactSeedsResult":
+        """
+        Собирает хранилище из потока пользователей. В паре с ленивым чтением JSONL-дампа
+        в памяти одновременно находится только одна pydantic-модель.
+
+        :param users: Итерируемый источник пользователей.
+        :return: Заполненное хранилище.
+        """
+        store = cls()
+        for user in users:
+            store.add_user(user)
+
+        return store
+
+    @classmethod
+    def from_result(cls, result: SeedsResult) -> "CompactSeedsResult":
+        """
+        Собирает хранилище из SeedsResult.
+
+        :param result: Результат сидинга.
+        :return: Заполненное хранилище.
+        """
+        return cls.from_users(result.users)
+
+    def get_user(self, index: int) -> SeedUserView:
+        return SeedUserView(self, index)
+
+    def get_next_user(self) -> SeedUserView:
+        """
+        Возвращает следующего невыданного пользователя (аналог SeedsResult.get_next_user).
+
+        :return: Представление пользователя.
+        :raises IndexError: Если все пользователи уже выданы.
+        """
+        if self.cursor >= len(self.user_ids):
+            raise IndexError("get next user from empty seeds store")
+
+        self.cursor += 1
+        return self.get_user(self.cursor - 1)
+
+    def get_random_user(self) -> SeedUserView:
+        """
+        Возвращает случайного пользователя из невыданных, без удаления (аналог SeedsResult.get_random_user).
+
+        :return: Представление пользователя.
+        :raises IndexError: Если невыданных пользователей нет.
+        """
+        if self.cursor >= len(self.user_ids):
+            raise IndexError("get random user from empty seeds store")
+
+        return self.get_user(random.randrange(self.cursor, len(self.user_ids)))
+
+    def __len__(self) -> int:
+        return len(self.user_ids) - self.cursor
+
+    def __iter__(self) -> Iterator[SeedUserView]:
+        return (self.get_user(index) for index in range(self.cursor, len(self.user_ids)))
@@ -0,0 +1,102 @@
+"""
+Проверка сид-пользователей на стенде перед запуском нагрузки.
+
+Дамп может пережить сброс базы стенда: тогда пользователи из него на стенде уже не существуют,
+и это проявляется только потоком 404 посреди теста. SeedsVerifier проверяет пользователей
+(всех или случайную выборку) вызовами GetUser и GetAccounts через gateway с ограничением
+количества одновременных запросов.
+"""
+import random
+import time
+from typing import Callable
+
+import grpc
+from gevent.pool import Pool
+
+from clients.grpc.gateway.accounts.client import AccountsGatewayGRPCClient, build_accounts_gateway_grpc_client
+from clients.grpc.gateway.users.client import UsersGatewayGRPCClient, build_users_gateway_grpc_client
+from config import settings
+from seeds.schema.result import SeedUserResult
+from seeds.schema.verify import SeedsVerifyReport
+from seeds.store import ACCOUNT_KINDS
+
+
+class SeedsVerifier:
+    """
+    Проверяет, что сид-пользователи и их счета существуют на стенде.
+
+    :param users_client: gRPC-клиент UsersGatewayService.
+    :param accounts_client: gRPC-клиент AccountsGatewayService.
+    :param max_concurrency: Максимальное количество одновременно проверяемых пользователей.
+    """
+
+    def __init__(
+            self,
+            users_client: UsersGatewayGRPCClient,
+            accounts_client: AccountsGatewayGRPCClient,
+            max_concurrency: int = 10
+    ):
+        self.users_client = users_client
+        self.accounts_client = accounts_client
+        self.max_concurrency = max_concurrency
+
+    def is_alive(self, user: SeedUserResult) -> bool:
+        """
+        Проверяет одного пользователя: GetUser, затем GetAccounts, если у пользователя есть счета.
+
+        :param user: Сид-пользователь (модель или представление CompactSeedsResult).
+        :return: False, если пользователя или какого-то из его счетов нет на стенде.
+        :raises grpc.RpcError: Любая ошибка, кроме NOT_FOUND: стенд недоступен, проверка невозможна.
+        """
+        try:
+            self.users_client.get_user(user.user_id)
+        except grpc.RpcError as error:
+            if error.code() == grpc.StatusCode.NOT_FOUND:
+                return False
+            raise
+
+        account_ids = {account.account_id for kind in ACCOUNT_KINDS for account in getattr(user, kind)}
+        if not account_ids:
+            return True
+
+        response = self.accounts_client.get_accounts(user.user_id)
+        return account_ids <= {account.id for account in response.accounts}
+
+    def verify(self, get_user: Callable[[int], SeedUserResult], size: int, sample: int | None = None) -> SeedsVerifyReport:
+        """
+        Проверяет пользователей результата сидинга.
+
+        :param get_user: Функция получения пользователя по позиции в результате.
+        :param size: Количество пользователей в результате.
+        :param sample: Размер случайной выборки. None — проверяются все пользователи.
+        :return: Отчёт с позициями пользователей, которых нет на стенде.
+        """
+        started = time.perf_counter()
+        indexes = range(size) if sample is None or sample >= size else sorted(random.sample(range(size), sample))
+
+        pool = Pool(self.max_concurrency)
+        try:
+            alive = list(pool.imap(lambda index: self.is_alive(get_user(index)), indexes))
+        except BaseException:
+            pool.kill()
+            raise
+
+        return SeedsVerifyReport(
+            total=size,
+            checked=len(indexes),
+            dead=[index for index, is_alive in zip(indexes, alive) if not is_alive],
+            elapsed=round(time.perf_counter() - started, 3)
+        )
+
+
+def build_seeds_verifier() -> SeedsVerifier:
+    """
+    Фабрика проверки сид-пользователей через gRPC gateway по настройкам SEEDS.VERIFY_*.
+
+    :return: Инициализированный SeedsVerifier.
+    """
+    return SeedsVerifier(
+        users_client=build_users_gateway_grpc_client(),
+        accounts_client=build_accounts_gateway_grpc_client(),
+        max_concurrency=settings.seeds.verify_concurrency
+    )
@@ -1,6 +1,29 @@
+from enum import StrEnum
+
 from pydantic import BaseModel, HttpUrl
 
 
+class HTTPTransportScope(StrEnum):
+    # Общего пула HTTP/1.1 на процесс Locust нет: пул httpcore, который делят сотни greenlet'ов, тратит CPU
+    # на распределение ожидающих запросов по соединениям и под gevent закрывает сокеты, из которых
+    # читает другой greenlet (ReadError: File descriptor was closed in another greenlet)
+
+    # У каждого httpx.Client собственный пул соединений (пять пулов на виртуального пользователя)
+    CLIENT = "client"
+    # Клиенты одного виртуального пользователя делят один пул соединений
+    USER = "user"
+    # Группа из TRANSPORT_GROUP_SIZE виртуальных пользователей делит один пул. Только с HTTP2=true:
+    # запросы группы идут параллельными потоками одного мультиплексированного соединения
+    GROUP = "group"
+
+
+class HTTPClientBackend(StrEnum):
+    # Транспорт httpx по умолчанию (httpcore + h11)
+    HTTPX = "httpx"
+    # geventhttpclient — движок FastHttpUser: парсер на C, меньше CPU на запрос под gevent
+    GEVENT = "gevent"
+
+
 class HTTPClientConfig(BaseModel):
     # URL сервиса, к которому будем подключаться через httpx
     url: HttpUrl
@@ -8,6 +31,33 @@ class HTTPClientConfig(BaseModel):
     # Таймаут для запросов в секундах (по умолчанию 100)
     timeout: float = 100.0
 
+    # Чем отправляются запросы: транспорт httpx или geventhttpclient
+    backend: HTTPClientBackend = HTTPClientBackend.HTTPX
+
+    # HTTP/2 без отката на HTTP/1.1 (только backend=httpx): для http:// — h2c с prior knowledge,
+    # для https:// — согласование h2 через ALPN
+    http2: bool = False
+
+    # Какие клиенты делят пул соединений (транспорт httpx)
+    transport_scope: HTTPTransportScope = HTTPTransportScope.USER
+
+    # Сколько виртуальных пользователей делят пул при transport_scope=group
+    transport_group_size: int = 50
+
+    # Доверенный режим разбора ответов в клиентах Locust: из ответа извлекаются только идентификаторы,
+    # которые нужны следующим задачам (user.id, account.cards[0].id, operation.id), без валидации остальных полей
+    trusted_responses: bool = False
+
+    # Собирать статистику потоков по соединениям и выводить её в лог при завершении Locust
+    connection_stats: bool = False
+
+    # Лимиты пула соединений: всего соединений, соединений keep-alive и время жизни простаивающего
+    # соединения в секундах. None — без ограничения. При исчерпании max_connections запрос ждёт
+    # свободное соединение не дольше timeout.
+    max_connections: int | None = 100
+    max_keepalive_connections: int | None = 20
+    keepalive_expiry: float | None = 5.0
+
     @property
     def client_url(self) -> str:
         """
@@ -0,0 +1,143 @@
+from enum import StrEnum
+
+from pydantic import BaseModel, Field
+
+
+class SeedsEngine(StrEnum):
+    # Сидинг через блокирующие клиенты в greenlet'ах (SeedsBuilder)
+    GEVENT = "gevent"
+    # Сидинг через grpc.aio/httpx.AsyncClient в отдельном процессе (AsyncSeedsBuilder)
+    ASYNCIO = "asyncio"
+
+
+class SeedsBackend(StrEnum):
+    # Сущности создаются через grpc-gateway, как их создаёт реальный клиент
+    GATEWAY = "gateway"
+    # Сущности создаются напрямую во внутренних сервисах (users, accounts, cards, operations)
+    SERVICES = "services"
+
+
+class SeedsDumpFormat(StrEnum):
+    # Один JSON-документ со всем SeedsResult
+    JSON = "json"
+    # Строка JSON на пользователя: потоковая запись и ленивое чтение
+    JSONL = "jsonl"
+    # Бинарный дамп с таблицей смещений: отображается в память, пользователи читаются по требованию
+    MMAP = "mmap"
+
+
+class SeedsCompression(StrEnum):
+    # Дамп пишется без сжатия
+    NONE = "none"
+    # gzip: быстрое сжатие и чтение, файл .gz
+    GZIP = "gzip"
+    # LZMA: файл .xz примерно на 20% меньше gzip, но запись в десятки раз медленнее
+    LZMA = "lzma"
+
+
+class SeedsStore(StrEnum):
+    # Дерево pydantic-моделей SeedsResult
+    MODELS = "models"
+    # Колоночное хранилище CompactSeedsResult для больших пулов пользователей
+    COMPACT = "compact"
+
+
+class SeedsPoolPolicy(StrEnum):
+    # Ждать, пока другой виртуальный пользователь вернёт сид-пользователя в пул
+    BLOCK = "block"
+    # Выдать уже занятого сид-пользователя повторно (без эксклюзивности)
+    RECYCLE = "recycle"
+    # Завершить виртуального пользователя ошибкой SeedsPoolExhaustedError
+    FAIL = "fail"
+
+
+class SeedsConfig(BaseModel):
+    # Максимальное количество одновременно выполняемых запросов сидинга (in-flight).
+    # Значение 1 соответствует строго последовательному сидингу.
+    max_concurrency: int = 1
+
+    # Лимиты одновременных запросов для отдельных методов gateway, действуют вместе с max_concurrency.
+    # Пример: SEEDS.RPC_CONCURRENCY={"make_purchase_operation": 5}
+    rpc_concurrency: dict[str, int] = Field(default_factory=dict)
+
+    # Адаптивная конкурентность (AIMD): лимит растёт на единицу, пока gateway отвечает без ошибок
+    # и быстрее adaptive_latency_threshold секунд, и уменьшается вдвое при ошибке или медленном ответе.
+    # Лимит меняется в пределах от adaptive_min_concurrency до max_concurrency.
+    adaptive_concurrency: bool = False
+    adaptive_min_concurrency: int = 1
+    adaptive_latency_threshold: float = 1.0
+
+    # Жёсткий потолок запросов сидинга в секунду. None — без ограничения.
+    rps_limit: float | None = None
+
+    # Количество повторов запроса сидинга, завершившегося временной ошибкой (UNAVAILABLE, DEADLINE_EXCEEDED,
+    # RESOURCE_EXHAUSTED, ошибка соединения), и пауза перед первым повтором в секундах (каждый следующий
+    # повтор ждёт вдвое дольше). Постоянные ошибки не повторяются. Запрос, создавший сущность, но не успевший
+    # ответить до таймаута, при повторе создаст её второй раз (например, операция будет проведена дважды).
+    retries: int = 0
+    retry_backoff: float = 0.5
+
+    # Зерно генератора случайных чисел для распределений количества карт и операций в плане.
+    # При одном и том же зерне каждый пользователь получает ту же структуру. None — каждый сидинг разный.
+    random_seed: int | None = None
+
+    # Движок сидинга, который используется в SeedsScenario.build
+    engine: SeedsEngine = SeedsEngine.GEVENT
+
+    # Куда отправляются запросы сидинга. Для services нужны адреса *_GRPC_CLIENT, работает с движком gevent.
+    backend: SeedsBackend = SeedsBackend.GATEWAY
+
+    # Срок жизни дампа сидинга в секундах. Пока дамп для того же плана не устарел,
+    # повторный сидинг не выполняется. None — дамп не устаревает.
+    ttl: float | None = None
+
+    # Общий пул сид-пользователей для сценариев с одинаковым планом пользователя (счета, карты, операции).
+    # Сценарий берёт наименее использованных пользователей пула и досоздаёт недостающих.
+    registry: bool = False
+
+    # Формат дампа сидинга в папке dumps
+    dump_format: SeedsDumpFormat = SeedsDumpFormat.JSON
+
+    # Потоковое сжатие дампов json и jsonl (файл .gz или .xz). Дамп mmap не сжимается.
+    compression: SeedsCompression = SeedsCompression.NONE
+
+    # Представление загруженного дампа в памяти. Дамп mmap не загружается в память целиком
+    # и всегда выдаёт пользователей напрямую из отображённого файла, эта настройка к нему не применяется.
+    store: SeedsStore = SeedsStore.MODELS
+
+    # Плоские индексы всего пула (environment.seeds.index): счета по типу, карты по счёту, операции по типу.
+    # Нужны только для выборок по всему пулу без учёта аренды. Задачам арендованного пользователя
+    # они не требуются: SeedsLease.index_view без индексов пула строится по одному пользователю.
+    # С SEEDS.DUMP_FORMAT=mmap индексы строятся при первом обращении к environment.seeds.index,
+    # потому что требуют прочитать весь дамп: пул без индексов создаётся мгновенно.
+    index: bool = False
+
+    # Проверка сид-пользователей на стенде при загрузке дампа (GetUser и GetAccounts через gateway).
+    # Если доля отсутствующих пользователей больше verify_max_dead, выполняется пересидинг,
+    # иначе отсутствующие пользователи исключаются из пула. verify_sample — размер случайной выборки
+    # для проверки (None — проверяются все), verify_concurrency — количество одновременных проверок.
+    verify: bool = False
+    verify_sample: int | None = None
+    verify_concurrency: int = 10
+    verify_max_dead: float = 0.1
+
+    # Поведение пула сид-пользователей, когда свободных пользователей не осталось
+    pool_policy: SeedsPoolPolicy = SeedsPoolPolicy.RECYCLE
+
+    # Максимальное время ожидания свободного пользователя в секундах для политики block.
+    # None — ждать без ограничения.
+    pool_timeout: float | None = None
+
+    # Конвейерный сидинг: нагрузка стартует сразу, а пул сид-пользователей наполняется в фоне.
+    # Работает с движком gevent при локальном запуске Locust.
+    pipeline: bool = False
+
+    # Интервал в секундах между отчётами конвейерного сидинга (скорость наполнения и потребления пула)
+    pipeline_report_interval: float = 5.0
+
+    # Сухой прогон: вывести количество вызовов gateway и сущностей и оценку длительности сидинга,
+    # затем завершить процесс, не обращаясь к gateway
+    dry_run: bool = False
+
+    # Интервал в секундах между отчётами о прогрессе сидинга (скорость, ETA, длительности вызовов gateway)
+    stats_report_interval: float = 10.0
@@ -113,6 +113,46 @@ class Fake:
         """
         return self.float(1, 1000)
 
+    def card_number(self) -> str:
+        """
+        Генерирует случайный номер банковской карты.
+
+        :return: Номер карты из 16 цифр.
+        """
+        return self.faker.credit_card_number(card_type="visa16")
+
+    def card_holder(self) -> str:
+        """
+        Генерирует имя держателя карты в том виде, как оно печатается на карте.
+
+        :return: Имя и фамилия латиницей в верхнем регистре.
+        """
+        return f"{self.faker.first_name()} {self.faker.last_name()}".upper()
+
+    def expiry_date(self) -> str:
+        """
+        Генерирует срок действия карты.
+
+        :return: Дата в формате ГГГГ-ММ-ДД в пределах ближайших пяти лет.
+        """
+        return self.faker.date_between(start_date="+1y", end_date="+5y").isoformat()
+
+    def pin(self) -> str:
+        """
+        Генерирует PIN-код карты.
+
+        :return: Строка из 4 цифр.
+        """
+        return self.faker.numerify("####")
+
+    def cvv(self) -> str:
+        """
+        Генерирует CVV-код карты.
+
+        :return: Строка из 3 цифр.
+        """
+        return self.faker.numerify("###")
+
     def proto_enum(self, value: EnumTypeWrapper) -> int:
         """
         Выбирает случайное значение из proto enum-типа.